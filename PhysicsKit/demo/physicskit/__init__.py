@@ -10,11 +10,12 @@ A MOSS Kit for realistic vehicle dynamics simulation featuring:
 
 __version__ = "0.1.0"
 
-from physicskit.core.vector import Vector3
+from physicskit.core.vector import Vector2, Vector3
 from physicskit.core.rigid_body import RigidBody
 from physicskit.core.world import World
 
 __all__ = [
+    "Vector2",
     "Vector3",
     "RigidBody",
     "World",
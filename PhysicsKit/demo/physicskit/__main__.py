@@ -4,8 +4,11 @@ Run with: python -m physicskit [command]
 
 Commands:
     drift     - Run drift simulation demo
+    replay    - Play back a recorded run
     plot      - Plot tire curves
     info      - Show available presets
+    bench     - Run performance benchmarks
+    sweep     - Run a parameter sweep over a vehicle configuration
 """
 
 import sys
@@ -92,7 +95,7 @@ def run_drift_demo(args):
             sim_time += dt
 
             # Update drift analysis
-            state = car.get_state()
+            state = car.get_state_view()
             drift_metrics = drift_analyzer.update(
                 velocity=state.velocity,
                 orientation=state.orientation,
@@ -116,6 +119,40 @@ def run_drift_demo(args):
     return 0
 
 
+def run_replay(args):
+    """Play back a recording written by TelemetryRecorder."""
+    try:
+        from physicskit.visualization import PygameRenderer
+    except ImportError:
+        print("Error: Pygame is required for replay.")
+        print("Install it with: pip install pygame")
+        return 1
+
+    from physicskit.config.vehicle_presets import get_vehicle_config
+    from physicskit.core.recorder import TelemetryReader
+
+    try:
+        config = get_vehicle_config(args.vehicle)
+        reader = TelemetryReader(args.path)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"Replaying {args.path}: {len(reader)} rows, {reader.n_vehicles} vehicle(s)")
+    renderer = PygameRenderer()
+    try:
+        renderer.replay(reader, config, vehicle=args.index, speed=args.rate)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        renderer.quit()
+        reader.close()
+    return 0
+
+
 def plot_tires(args):
     """Plot tire force curves."""
     try:
@@ -187,6 +224,143 @@ def show_info(args):
     return 0
 
 
+def run_benchmarks(args):
+    """Run the benchmark suite, optionally comparing against a baseline."""
+    from physicskit.benchmark import (
+        run_benchmarks as run_suite, compare_results, format_result,
+        save_results, load_results, multirate_report, format_multirate,
+        wheel_stability_matrix, format_wheel_stability
+    )
+
+    if args.wheel_stability:
+        print("PhysicsKit Wheel Integrator Stability")
+        print("=" * 40)
+        results = wheel_stability_matrix(
+            progress=lambda result: print(format_wheel_stability(result))
+        )
+        unstable = [r for r in results if not r.stable]
+        print()
+        print(f"{len(results) - len(unstable)}/{len(results)} runs stable")
+        return 0
+
+    if args.substeps:
+        print("PhysicsKit Multi-rate Accuracy")
+        print("=" * 40)
+        try:
+            for preset in args.vehicle or ["drift_car"]:
+                multirate_report(
+                    preset,
+                    substeps=args.substeps,
+                    repeats=args.repeats,
+                    progress=lambda result: print(format_multirate(result))
+                )
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load_results(args.compare)
+        except (OSError, ValueError) as e:
+            print(f"Error: could not read baseline {args.compare}: {e}")
+            return 1
+
+    print("PhysicsKit Benchmarks")
+    print("=" * 40)
+
+    try:
+        results = run_suite(
+            presets=args.vehicle,
+            methods=args.method,
+            steps=args.steps,
+            repeats=args.repeats,
+            progress=lambda result: print(format_result(result))
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"Saved to: {args.output}")
+
+    if baseline is not None:
+        regressions = compare_results(results, baseline, args.threshold)
+        print()
+        if not regressions:
+            print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+            return 0
+
+        print(f"Regressions beyond {args.threshold:.0%} against {args.compare}:")
+        for r in regressions:
+            print(
+                f"  {r.key:28} {r.metric:18} {r.baseline:10.2f} -> {r.current:10.2f} "
+                f"({r.change:+.0%})"
+            )
+        return 1
+
+    return 0
+
+
+def run_sweep(args):
+    """Run a parameter sweep and print the results table."""
+    from physicskit.sweep import (
+        SweepSpec, run_sweep as run_points, grid, random_sample, combine,
+        parse_axis, parse_range, sort_results, format_table, save_csv
+    )
+
+    try:
+        axes = dict(parse_axis(text) for text in args.grid or [])
+        ranges = dict(parse_range(text) for text in args.random or [])
+        spec = SweepSpec(
+            scenario=args.scenario,
+            duration=args.duration,
+            initial_speed=args.speed / 3.6
+        )
+        points = combine(
+            grid(axes) if axes else [],
+            random_sample(ranges, args.samples, args.seed) if ranges else []
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print("PhysicsKit Sweep")
+    print("=" * 40)
+    print(f"{len(points)} points on {args.vehicle}, scenario {spec.scenario}")
+
+    done = 0
+
+    def progress(result):
+        nonlocal done
+        done += 1
+        print(f"\r  {done}/{len(points)}", end="", flush=True)
+
+    try:
+        results = run_points(
+            points, base=args.vehicle, spec=spec, workers=args.jobs,
+            cache_dir=None if args.no_cache else args.cache, progress=progress
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    cached = sum(result.cached for result in results)
+    print(f"\r  {len(results)} points ({cached} cached)")
+    print()
+
+    if args.sort:
+        results = sort_results(results, args.sort)
+    print(format_table(results))
+
+    if args.output:
+        save_csv(results, args.output)
+        print(f"Saved to: {args.output}")
+
+    return 0
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -213,6 +387,25 @@ def main():
         help="Initial speed in km/h (default: 0)"
     )
 
+    # Replay command
+    replay_parser = subparsers.add_parser("replay", help="Play back a recorded run")
+    replay_parser.add_argument("path", help="Recording directory (from TelemetryRecorder)")
+    replay_parser.add_argument(
+        "-v", "--vehicle",
+        default="drift_car",
+        help="Vehicle preset of the recorded car, for its geometry (default: drift_car)"
+    )
+    replay_parser.add_argument(
+        "-i", "--index",
+        type=int, default=0,
+        help="Vehicle index in the recording (default: 0)"
+    )
+    replay_parser.add_argument(
+        "-r", "--rate",
+        type=float, default=1.0,
+        help="Playback speed, 1.0 = real time (default: 1.0)"
+    )
+
     # Plot command
     plot_parser = subparsers.add_parser("plot", help="Plot tire curves")
     plot_parser.add_argument(
@@ -229,14 +422,138 @@ def main():
     # Info command
     subparsers.add_parser("info", help="Show available presets")
 
+    # Benchmark command
+    bench_parser = subparsers.add_parser("bench", help="Run performance benchmarks")
+    bench_parser.add_argument(
+        "-v", "--vehicle",
+        action="append",
+        help="Vehicle preset to benchmark, may be repeated (default: all)"
+    )
+    bench_parser.add_argument(
+        "-m", "--method",
+        action="append",
+        choices=["simple", "vector", "empirical"],
+        help="Combined slip method, may be repeated (default: all)"
+    )
+    bench_parser.add_argument(
+        "-n", "--steps",
+        type=int, default=2000,
+        help="Physics steps per scenario run (default: 2000)"
+    )
+    bench_parser.add_argument(
+        "-r", "--repeats",
+        type=int, default=3,
+        help="Timing repeats, best is reported (default: 3)"
+    )
+    bench_parser.add_argument(
+        "-o", "--output",
+        help="Write results as JSON"
+    )
+    bench_parser.add_argument(
+        "-c", "--compare",
+        help="Baseline JSON to compare against; exits 1 on regression"
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float, default=0.10,
+        help="Relative slowdown tolerated by --compare (default: 0.10)"
+    )
+    bench_parser.add_argument(
+        "--wheel-stability",
+        action="store_true",
+        help="Instead of the suite, run every tire preset with each wheel "
+             "integrator over 1-10 ms timesteps and report stability"
+    )
+    bench_parser.add_argument(
+        "--substeps",
+        type=int, nargs="+",
+        help="Instead of the suite, compare wheel sub-step ratios (chassis dt = "
+             "N ms) against single-rate 1 ms for speed and accuracy"
+    )
+
+    # Sweep command
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="Run a parameter sweep over a vehicle configuration"
+    )
+    sweep_parser.add_argument(
+        "-v", "--vehicle",
+        default="drift_car",
+        help="Base vehicle preset (default: drift_car)"
+    )
+    sweep_parser.add_argument(
+        "-g", "--grid",
+        action="append",
+        help="Grid axis name=v1,v2,... or name=low:high:count; nested fields "
+             "use dots (tire_config.friction_mu). May be repeated."
+    )
+    sweep_parser.add_argument(
+        "-R", "--random",
+        action="append",
+        help="Random axis name=low:high, sampled --samples times. May be repeated."
+    )
+    sweep_parser.add_argument(
+        "-n", "--samples",
+        type=int, default=16,
+        help="Random samples, crossed with the grid (default: 16)"
+    )
+    sweep_parser.add_argument(
+        "--seed",
+        type=int, default=0,
+        help="Random sample seed (default: 0)"
+    )
+    sweep_parser.add_argument(
+        "--scenario",
+        default="drift_entry",
+        help="Scripted inputs: drift_entry, donut or step_steer (default: drift_entry)"
+    )
+    sweep_parser.add_argument(
+        "-d", "--duration",
+        type=float, default=4.0,
+        help="Simulated seconds per point (default: 4.0)"
+    )
+    sweep_parser.add_argument(
+        "-s", "--speed",
+        type=float, default=72.0,
+        help="Initial speed in km/h (default: 72)"
+    )
+    sweep_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="Worker processes (default: CPU count)"
+    )
+    sweep_parser.add_argument(
+        "--cache",
+        default=".physicskit_sweep",
+        help="Result cache directory (default: .physicskit_sweep)"
+    )
+    sweep_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write cached results"
+    )
+    sweep_parser.add_argument(
+        "--sort",
+        help="Sort the table by a metric or parameter, descending"
+    )
+    sweep_parser.add_argument(
+        "-o", "--output",
+        help="Write results as CSV"
+    )
+
     args = parser.parse_args()
 
     if args.command == "drift":
         return run_drift_demo(args)
+    elif args.command == "replay":
+        return run_replay(args)
     elif args.command == "plot":
         return plot_tires(args)
     elif args.command == "info":
         return show_info(args)
+    elif args.command == "bench":
+        return run_benchmarks(args)
+    elif args.command == "sweep":
+        return run_sweep(args)
     else:
         parser.print_help()
         return 0
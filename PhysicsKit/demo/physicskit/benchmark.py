@@ -0,0 +1,639 @@
+"""Reproducible performance benchmarks for the simulation hot path.
+
+Every vehicle preset is benchmarked with every CombinedSlip method on a
+fixed scripted drift (throttle, steering, handbrake flick), so numbers are
+comparable between runs and machines of the same kind.
+
+Reported per preset/method:
+    steps_per_second          Car.physics_step rate over the scenario
+    real_time_factor          Simulated seconds per wall-clock second
+    us_tire_update            Microseconds per Tire.update
+    us_tire_step              Microseconds per Tire.step (as run by Car.physics_step)
+    us_lateral_force          Microseconds per PacejkaFormula.lateral_force
+    us_get_state              Microseconds per Car.get_state
+    alloc_bytes_per_step      Peak memory allocated transiently in one step
+    alloc_blocks_per_step     Net memory blocks still allocated after a step
+
+Timings are the best of several repeats with the garbage collector
+disabled. Allocation figures come from tracemalloc and are measured in a
+separate pass, so they do not slow down the timings.
+
+Results are plain JSON; compare_results flags metrics that got worse than
+a saved baseline by more than a relative threshold.
+
+multirate_report measures wheel sub-stepping (World.wheel_substeps): the
+same scenario is run with a chassis step of N * wheel_dt and N wheel
+sub-steps, and compared against a single-rate run at wheel_dt for speed
+and for trajectory error at the shared sample times.
+
+wheel_stability_matrix runs every tire preset with each wheel integrator
+(TireConfig.wheel_integrator) over a range of timesteps and reports wheel
+speed chatter and trajectory error against a fine-step explicit run.
+"""
+
+from __future__ import annotations
+import gc
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from physicskit import __version__
+from physicskit.config.tire_presets import TIRE_PRESETS, get_tire_config
+from physicskit.config.vehicle_presets import VEHICLE_PRESETS, get_vehicle_config
+from physicskit.core.telemetry import Telemetry
+from physicskit.core.world import World
+from physicskit.tire.tire import WHEEL_INTEGRATORS, Tire
+from physicskit.vehicle.car import Car
+from physicskit.vehicle.suspension import WheelPosition
+
+
+COMBINED_SLIP_METHODS = ("simple", "vector", "empirical")
+
+# Metrics where a larger value is better; everything else is a cost
+HIGHER_IS_BETTER = {"steps_per_second", "real_time_factor"}
+
+
+@dataclass
+class BenchmarkResult:
+    """Benchmark numbers for one preset and combined slip method."""
+    preset: str
+    method: str
+    steps_per_second: float
+    real_time_factor: float
+    us_tire_update: float
+    us_tire_step: float
+    us_lateral_force: float
+    us_get_state: float
+    alloc_bytes_per_step: float
+    alloc_blocks_per_step: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.preset}/{self.method}"
+
+    def metrics(self) -> dict[str, float]:
+        """Numeric metrics by name."""
+        return {k: v for k, v in asdict(self).items() if k not in ("preset", "method")}
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline."""
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    change: float                  # Relative change, positive = worse
+
+
+@dataclass
+class MultiRateResult:
+    """Speed and accuracy of one wheel sub-step ratio against single-rate."""
+    preset: str
+    substeps: int
+    chassis_dt: float              # s
+    steps_per_second: float        # Chassis steps per wall-clock second
+    speedup: float                 # Single-rate wall time / this wall time
+    max_position_error: float      # m
+    max_speed_error: float         # m/s
+    max_yaw_error: float           # deg
+    rms_drift_angle_error: float   # deg
+
+
+@dataclass
+class WheelStabilityResult:
+    """Wheel spin behaviour of one tire, wheel integrator and timestep."""
+    tire: str
+    integrator: str
+    scenario: str
+    dt: float                      # s
+    inertia_scale: float           # Multiplier on the preset's wheel inertia
+    stable: bool
+    chatter: float                 # Wheel speed reversals per simulated second
+    position_error: float          # m, final position against the reference run
+
+
+def scenario_inputs(t: float) -> tuple[float, float, float, float]:
+    """Scripted drift: throttle, turn in, handbrake flick, counter-steer.
+
+    Returns:
+        Tuple of (throttle, brake, steer, handbrake)
+    """
+    steer = 0.6 if t < 1.0 else -0.4
+    handbrake = 1.0 if 0.8 < t < 1.1 else 0.0
+    return 0.8, 0.0, steer, handbrake
+
+
+def _make_car(preset: str, method: str) -> Car:
+    config = get_vehicle_config(preset)
+    config.tire_config.combined_slip_method = method
+    car = Car(config)
+    car.set_velocity(20.0)
+    return car
+
+
+def _best_time(func: Callable[[], object], repeats: int) -> float:
+    """Best wall time of func over repeats, with GC disabled."""
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        best = math.inf
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _time_steps(preset: str, method: str, steps: int, dt: float, repeats: int) -> float:
+    """Best wall time to run the scenario for a fresh car."""
+    inputs = [scenario_inputs(i * dt) for i in range(steps)]
+    best = math.inf
+    for _ in range(repeats):
+        car = _make_car(preset, method)
+
+        def run() -> None:
+            for throttle, brake, steer, handbrake in inputs:
+                car.set_inputs(throttle, brake, steer, handbrake)
+                car.physics_step(dt)
+
+        best = min(best, _best_time(run, 1))
+    return best
+
+
+def _per_call_us(func: Callable[[], object], calls: int, repeats: int) -> float:
+    """Microseconds per call of func."""
+    def run() -> None:
+        for _ in range(calls):
+            func()
+    return _best_time(run, repeats) / calls * 1e6
+
+
+def _measure_allocations(preset: str, method: str, steps: int, dt: float) -> tuple[float, float]:
+    """Average transient peak bytes and net blocks per step."""
+    car = _make_car(preset, method)
+    # Warm caches so one-off setup does not count
+    for i in range(50):
+        car.set_inputs(*scenario_inputs(i * dt))
+        car.physics_step(dt)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak_total = 0
+        blocks_before = sys.getallocatedblocks()
+        for i in range(steps):
+            car.set_inputs(*scenario_inputs(i * dt))
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            car.physics_step(dt)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - current
+        blocks_after = sys.getallocatedblocks()
+    finally:
+        tracemalloc.stop()
+
+    return peak_total / steps, (blocks_after - blocks_before) / steps
+
+
+def benchmark_preset(
+    preset: str,
+    method: str,
+    steps: int = 2000,
+    dt: float = 0.001,
+    repeats: int = 3,
+    calls: int = 2000
+) -> BenchmarkResult:
+    """Benchmark one vehicle preset with one combined slip method.
+
+    Args:
+        preset: Vehicle preset name (see VEHICLE_PRESETS)
+        method: CombinedSlip method: "simple", "vector" or "empirical"
+        steps: Physics steps in the scenario run
+        dt: Physics timestep (seconds)
+        repeats: Timing repeats; the best is reported
+        calls: Calls per micro-benchmark repeat
+
+    Returns:
+        BenchmarkResult
+    """
+    if method not in COMBINED_SLIP_METHODS:
+        raise ValueError(
+            f"Unknown combined slip method '{method}'. "
+            f"Available: {', '.join(COMBINED_SLIP_METHODS)}"
+        )
+
+    elapsed = _time_steps(preset, method, steps, dt, repeats)
+
+    # Micro-benchmarks on a car mid-drift
+    car = _make_car(preset, method)
+    for i in range(steps // 2):
+        car.set_inputs(*scenario_inputs(i * dt))
+        car.physics_step(dt)
+
+    rear = car.tires[WheelPosition.REAR_LEFT]
+    tire = Tire(rear.config)
+    tire.angular_velocity = rear.angular_velocity
+    contact_velocity = car.body.get_velocity_at_point(
+        car.get_wheel_position_world(WheelPosition.REAR_LEFT)
+    )
+    heading = car.body.orientation
+    load = car._wheel_loads.RL
+    slip_angle = rear.slip_angle_deg
+
+    us_tire_update = _per_call_us(
+        lambda: tire.update(contact_velocity, heading, load, 0.0, 0.0, dt), calls, repeats
+    )
+    us_tire_step = _per_call_us(
+        lambda: tire.step(contact_velocity, heading, load, 0.0, 0.0, dt), calls, repeats
+    )
+    us_lateral_force = _per_call_us(
+        lambda: tire.pacejka.lateral_force(slip_angle, load), calls, repeats
+    )
+    us_get_state = _per_call_us(car.get_state, calls, repeats)
+
+    alloc_bytes, alloc_blocks = _measure_allocations(preset, method, min(steps, 500), dt)
+
+    return BenchmarkResult(
+        preset=preset,
+        method=method,
+        steps_per_second=steps / elapsed,
+        real_time_factor=steps * dt / elapsed,
+        us_tire_update=us_tire_update,
+        us_tire_step=us_tire_step,
+        us_lateral_force=us_lateral_force,
+        us_get_state=us_get_state,
+        alloc_bytes_per_step=alloc_bytes,
+        alloc_blocks_per_step=alloc_blocks
+    )
+
+
+def run_benchmarks(
+    presets: Optional[Sequence[str]] = None,
+    methods: Optional[Sequence[str]] = None,
+    steps: int = 2000,
+    repeats: int = 3,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None
+) -> dict:
+    """Run the benchmark suite.
+
+    Args:
+        presets: Vehicle presets to run. Defaults to all of VEHICLE_PRESETS.
+        methods: Combined slip methods. Defaults to all.
+        steps: Physics steps per scenario run
+        repeats: Timing repeats per measurement
+        progress: Called with each result as it completes
+
+    Returns:
+        JSON-serializable dict with "meta" and "results" (keyed "preset/method")
+    """
+    presets = list(presets or VEHICLE_PRESETS)
+    methods = list(methods or COMBINED_SLIP_METHODS)
+
+    results = {}
+    for preset in presets:
+        get_vehicle_config(preset)  # Validate name before spending time
+        for method in methods:
+            result = benchmark_preset(preset, method, steps=steps, repeats=repeats)
+            results[result.key] = result.metrics()
+            if progress is not None:
+                progress(result)
+
+    return {
+        "meta": {
+            "physicskit": __version__,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "steps": steps,
+            "repeats": repeats,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+MULTIRATE_CHANNELS = ("x", "y", "orientation", "vx", "vy", "speed")
+
+
+def _run_multirate(
+    preset: str,
+    substeps: int,
+    wheel_dt: float,
+    duration: float,
+    repeats: int
+) -> tuple[float, int, Telemetry]:
+    """Time the scenario at one sub-step ratio and record its trajectory.
+
+    Returns:
+        (best wall time, chassis steps, telemetry)
+    """
+    dt = wheel_dt * substeps
+    n_steps = round(duration / dt)
+    inputs = np.array([scenario_inputs(i * dt) for i in range(n_steps)])
+
+    def make_world() -> World:
+        car = Car(get_vehicle_config(preset))
+        car.set_velocity(20.0)
+        world = World(dt=dt, wheel_substeps=substeps)
+        world.add_vehicle(car)
+        return world
+
+    best = math.inf
+    for _ in range(repeats):
+        world = make_world()
+        best = min(best, _best_time(lambda: world.run(n_steps, inputs, channels=()), 1))
+
+    telemetry = make_world().run(n_steps, inputs, channels=MULTIRATE_CHANNELS)
+    return best, n_steps, telemetry
+
+
+def _angle_error(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Absolute difference of angle arrays, wrapped to [0, pi]."""
+    error: np.ndarray = np.abs(np.angle(np.exp(1j * (a - b))))
+    return error
+
+
+def multirate_report(
+    preset: str = "drift_car",
+    substeps: Sequence[int] = (2, 4, 5),
+    wheel_dt: float = 0.001,
+    duration: float = 3.0,
+    repeats: int = 3,
+    progress: Optional[Callable[[MultiRateResult], None]] = None
+) -> list[MultiRateResult]:
+    """Compare wheel sub-stepping against the single-rate baseline.
+
+    Args:
+        preset: Vehicle preset name (see VEHICLE_PRESETS)
+        substeps: Sub-step ratios to measure; the chassis step is
+                  ratio * wheel_dt
+        wheel_dt: Wheel/tire step, and the single-rate baseline's dt (seconds)
+        duration: Simulated seconds of the scenario
+        repeats: Timing repeats; the best is reported
+        progress: Called with each result as it completes
+
+    Returns:
+        One MultiRateResult per ratio, the baseline (ratio 1) first
+    """
+    base_time, base_steps, base = _run_multirate(preset, 1, wheel_dt, duration, repeats)
+
+    results = []
+    for ratio in [1] + [n for n in substeps if n != 1]:
+        if ratio < 1:
+            raise ValueError(f"substeps must be >= 1, got {ratio}")
+        if ratio == 1:
+            elapsed, n_steps, run = base_time, base_steps, base
+        else:
+            elapsed, n_steps, run = _run_multirate(preset, ratio, wheel_dt, duration, repeats)
+
+        # Baseline records after every wheel step; keep the ones at chassis step ends
+        n = min(n_steps, base_steps // ratio)
+        ref = {name: base[name][ratio - 1::ratio][:n, 0] for name in MULTIRATE_CHANNELS}
+        cur = {name: run[name][:n, 0] for name in MULTIRATE_CHANNELS}
+
+        position_error = np.hypot(cur["x"] - ref["x"], cur["y"] - ref["y"])
+        yaw_error = _angle_error(cur["orientation"], ref["orientation"])
+        # Drift angle from the velocity heading; the drift_angle channel
+        # jumps where the forward speed crosses zero in a spin
+        drift_error = _angle_error(
+            np.arctan2(cur["vy"], cur["vx"]) - cur["orientation"],
+            np.arctan2(ref["vy"], ref["vx"]) - ref["orientation"]
+        )
+
+        result = MultiRateResult(
+            preset=preset,
+            substeps=ratio,
+            chassis_dt=wheel_dt * ratio,
+            steps_per_second=n_steps / elapsed,
+            speedup=base_time / elapsed,
+            max_position_error=float(position_error.max(initial=0.0)),
+            max_speed_error=float(np.abs(cur["speed"] - ref["speed"]).max(initial=0.0)),
+            max_yaw_error=float(np.degrees(yaw_error.max(initial=0.0))),
+            rms_drift_angle_error=float(np.degrees(np.sqrt(np.mean(drift_error ** 2)))) if n else 0.0
+        )
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    return results
+
+
+def format_multirate(result: MultiRateResult) -> str:
+    """One-line summary of a multi-rate result."""
+    return (
+        f"{result.preset:12} x{result.substeps:<3d} dt {result.chassis_dt * 1000:5.2f}ms "
+        f"{result.steps_per_second:8.0f} steps/s {result.speedup:5.2f}x  "
+        f"pos {result.max_position_error:7.4f}m  "
+        f"speed {result.max_speed_error:7.4f}m/s  "
+        f"yaw {result.max_yaw_error:6.3f}deg  "
+        f"drift rms {result.rms_drift_angle_error:6.3f}deg"
+    )
+
+
+def braking_inputs(t: float) -> tuple[float, float, float, float]:
+    """Straight-line braking hard enough to lock the wheels briefly."""
+    return 0.0, 0.4, 0.0, 0.0
+
+
+STABILITY_SCENARIOS: dict[str, Callable[[float], tuple[float, float, float, float]]] = {
+    "drift": scenario_inputs,
+    "braking": braking_inputs,
+}
+
+# Consecutive wheel speed changes larger than this (rad/s) in opposite
+# directions count as one chatter reversal
+CHATTER_THRESHOLD = 0.5
+
+# Reversals per simulated second above which a run counts as unstable
+MAX_CHATTER = 2.0
+
+
+def _run_wheel(
+    tire: str,
+    integrator: str,
+    scenario: str,
+    dt: float,
+    inertia_scale: float,
+    duration: float
+) -> tuple[float, float, float]:
+    """Run a drift_car on one tire preset.
+
+    Returns:
+        (final x, final y, chatter reversals per second)
+    """
+    config = get_vehicle_config("drift_car")
+    tire_config = get_tire_config(tire)
+    tire_config.wheel_integrator = integrator
+    tire_config.inertia *= inertia_scale
+    config.tire_config = tire_config
+    car = Car(config)
+    car.set_velocity(20.0)
+    world = World(dt=dt)
+    world.add_vehicle(car)
+
+    n_steps = round(duration / dt)
+    inputs = STABILITY_SCENARIOS[scenario]
+    telemetry = world.run(
+        n_steps, np.array([inputs(i * dt) for i in range(n_steps)]),
+        channels=("x", "y", "wheel_speed")
+    )
+
+    change = np.diff(telemetry["wheel_speed"][:, 0, :], axis=0)
+    big = np.abs(change) > CHATTER_THRESHOLD
+    reversals = (change[1:] * change[:-1] < 0) & big[1:] & big[:-1]
+    return telemetry["x"][-1, 0], telemetry["y"][-1, 0], reversals.sum() / duration
+
+
+def wheel_stability_matrix(
+    tires: Optional[Sequence[str]] = None,
+    integrators: Sequence[str] = WHEEL_INTEGRATORS,
+    dts: Sequence[float] = (0.001, 0.002, 0.005, 0.01),
+    inertia_scales: Sequence[float] = (1.0, 0.25),
+    scenarios: Optional[Sequence[str]] = None,
+    reference_dt: float = 0.00025,
+    duration: float = 3.0,
+    progress: Optional[Callable[[WheelStabilityResult], None]] = None
+) -> list[WheelStabilityResult]:
+    """Run every tire preset with every wheel integrator and timestep.
+
+    A run is stable when its wheel speeds stay finite and reverse direction
+    step-to-step at most MAX_CHATTER times per second. The error is the
+    final position distance from an explicit run at reference_dt.
+
+    Args:
+        tires: Tire presets. Defaults to all of TIRE_PRESETS.
+        integrators: Wheel integrators (see TireConfig.wheel_integrator)
+        dts: Physics timesteps (seconds)
+        inertia_scales: Multipliers on each preset's wheel inertia; lighter
+                        wheels are stiffer
+        scenarios: Input scenarios (see STABILITY_SCENARIOS). Defaults to all.
+        reference_dt: Timestep of the reference run (seconds)
+        duration: Simulated seconds per run
+        progress: Called with each result as it completes
+
+    Returns:
+        WheelStabilityResult per combination
+    """
+    tires = list(tires or TIRE_PRESETS)
+    scenarios = list(scenarios or STABILITY_SCENARIOS)
+    for tire in tires:
+        get_tire_config(tire)  # Validate names before spending time
+    for integrator in integrators:
+        if integrator not in WHEEL_INTEGRATORS:
+            raise ValueError(
+                f"Unknown wheel integrator '{integrator}'. "
+                f"Available: {', '.join(WHEEL_INTEGRATORS)}"
+            )
+    for scenario in scenarios:
+        if scenario not in STABILITY_SCENARIOS:
+            raise ValueError(
+                f"Unknown scenario '{scenario}'. Available: {', '.join(STABILITY_SCENARIOS)}"
+            )
+
+    results = []
+    for tire in tires:
+        for scenario in scenarios:
+            for scale in inertia_scales:
+                ref_x, ref_y, _ = _run_wheel(tire, "explicit", scenario, reference_dt, scale, duration)
+                for integrator in integrators:
+                    for dt in dts:
+                        x, y, chatter = _run_wheel(tire, integrator, scenario, dt, scale, duration)
+                        finite = math.isfinite(x) and math.isfinite(y) and math.isfinite(chatter)
+                        result = WheelStabilityResult(
+                            tire=tire,
+                            integrator=integrator,
+                            scenario=scenario,
+                            dt=dt,
+                            inertia_scale=scale,
+                            stable=finite and chatter <= MAX_CHATTER,
+                            chatter=float(chatter),
+                            position_error=math.hypot(x - ref_x, y - ref_y) if finite else math.inf
+                        )
+                        results.append(result)
+                        if progress is not None:
+                            progress(result)
+
+    return results
+
+
+def format_wheel_stability(result: WheelStabilityResult) -> str:
+    """One-line summary of a wheel stability result."""
+    return (
+        f"{result.tire:11} {result.scenario:8} I x{result.inertia_scale:<5g} "
+        f"{result.integrator:9} dt {result.dt * 1000:5.2f}ms  "
+        f"{'stable  ' if result.stable else 'UNSTABLE'}  "
+        f"chatter {result.chatter:7.1f}/s  pos err {result.position_error:7.3f}m"
+    )
+
+
+def compare_results(current: dict, baseline: dict, threshold: float = 0.10) -> list[Regression]:
+    """Find metrics that got worse than the baseline.
+
+    Only timing metrics are compared; allocation counts are reported but
+    too noisy to gate on.
+
+    Args:
+        current: Output of run_benchmarks
+        baseline: Saved output of run_benchmarks
+        threshold: Relative change tolerated before flagging (0.10 = 10%)
+
+    Returns:
+        Regressions, worst first
+    """
+    regressions = []
+    for key, metrics in current["results"].items():
+        base_metrics = baseline.get("results", {}).get(key)
+        if base_metrics is None:
+            continue
+        for metric, value in metrics.items():
+            if metric.startswith("alloc_") or metric not in base_metrics:
+                continue
+            base = base_metrics[metric]
+            if base <= 0:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                change = base / value - 1.0 if value > 0 else math.inf
+            else:
+                change = value / base - 1.0
+            if change > threshold:
+                regressions.append(Regression(key, metric, base, value, change))
+
+    regressions.sort(key=lambda r: r.change, reverse=True)
+    return regressions
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """One-line summary of a result."""
+    return (
+        f"{result.key:28} {result.steps_per_second:9.0f} steps/s "
+        f"{result.real_time_factor:6.2f}x RT  "
+        f"tire {result.us_tire_update:6.2f}/{result.us_tire_step:5.2f}us  "
+        f"Fy {result.us_lateral_force:5.2f}us  "
+        f"state {result.us_get_state:6.2f}us  "
+        f"alloc {result.alloc_bytes_per_step:7.0f}B/{result.alloc_blocks_per_step:+.2f}blk"
+    )
+
+
+def save_results(results: dict, path: str) -> None:
+    """Write results as JSON."""
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> dict:
+    """Read results written by save_results."""
+    with open(path) as f:
+        results: dict = json.load(f)
+    return results
@@ -1,15 +1,30 @@
 """Core physics engine components."""
 
-from physicskit.core.vector import Vector3
+from physicskit.core.vector import Vector2, Vector3
 from physicskit.core.rigid_body import RigidBody
-from physicskit.core.integrators import semi_implicit_euler, rk4_step, IntegratorType
+from physicskit.core.integrators import (
+    semi_implicit_euler, rk4_step, IntegratorType, DormandPrince, IntegratorStats
+)
 from physicskit.core.world import World
+from physicskit.core.telemetry import Telemetry, CHANNELS
+from physicskit.core.recorder import TelemetryRecorder, TelemetryReader
+from physicskit.core.schedule import InputSchedule, InputTrack, InputTable
 
 __all__ = [
+    "Vector2",
     "Vector3",
     "RigidBody",
     "semi_implicit_euler",
     "rk4_step",
     "IntegratorType",
+    "DormandPrince",
+    "IntegratorStats",
     "World",
+    "Telemetry",
+    "CHANNELS",
+    "TelemetryRecorder",
+    "TelemetryReader",
+    "InputSchedule",
+    "InputTrack",
+    "InputTable",
 ]
@@ -1,8 +1,18 @@
-"""Numerical integration methods for physics simulation."""
+"""Numerical integration methods for physics simulation.
+
+The RigidBody steppers (semi_implicit_euler, explicit_euler, rk4_step,
+verlet_step) advance a single body. rk4_array and DormandPrince integrate
+a state array y' = f(y), which Car uses to integrate its full state
+(body and wheels) with the higher-order IntegratorType modes.
+"""
 
 from __future__ import annotations
+import math
+from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
+
+import numpy as np
 
 from physicskit.core.vector import Vector3, normalize_angle
 
@@ -13,7 +23,9 @@ if TYPE_CHECKING:
 class IntegratorType(Enum):
     """Available integration methods."""
     SEMI_IMPLICIT_EULER = "semi_implicit_euler"
+    EXPLICIT_EULER = "explicit_euler"
     RK4 = "rk4"
+    DORMAND_PRINCE = "dormand_prince"   # Adaptive RK45 with error control
 
 
 def semi_implicit_euler(body: RigidBody, dt: float) -> None:
@@ -32,15 +44,13 @@ def semi_implicit_euler(body: RigidBody, dt: float) -> None:
         dt: Time step in seconds
     """
     # Linear motion
-    acceleration = body.get_acceleration()
-    body.velocity += acceleration * dt
-    body.position += body.velocity * dt
+    body.velocity.add_scaled_(body._force, dt / body.mass)
+    body.position.add_scaled_(body.velocity, dt)
 
     # Angular motion
     angular_accel = body.get_angular_acceleration()
     body.angular_velocity += angular_accel * dt
-    body.orientation += body.angular_velocity * dt
-    body.orientation = normalize_angle(body.orientation)
+    body.orientation = normalize_angle(body.orientation + body.angular_velocity * dt)
 
     # Clear accumulators for next step
     body.clear_forces()
@@ -69,8 +79,7 @@ def explicit_euler(body: RigidBody, dt: float) -> None:
 
     # Update positions with OLD velocity
     body.position += old_velocity * dt
-    body.orientation += old_angular_velocity * dt
-    body.orientation = normalize_angle(body.orientation)
+    body.orientation = normalize_angle(body.orientation + old_angular_velocity * dt)
 
     body.clear_forces()
 
@@ -189,3 +198,170 @@ def verlet_step(
     body.clear_forces()
 
     return old_pos, old_ori
+
+
+def rk4_array(f: Callable[[np.ndarray], np.ndarray], y: np.ndarray, dt: float) -> np.ndarray:
+    """One classic Runge-Kutta step of y' = f(y).
+
+    Args:
+        f: Derivative function
+        y: State at the start of the step
+        dt: Time step in seconds
+
+    Returns:
+        State at the end of the step
+    """
+    k1 = f(y)
+    k2 = f(y + k1 * (dt / 2))
+    k3 = f(y + k2 * (dt / 2))
+    k4 = f(y + k3 * dt)
+    y_next: np.ndarray = y + (k1 + 2 * k2 + 2 * k3 + k4) * (dt / 6)
+    return y_next
+
+
+# Dormand-Prince 5(4) tableau
+_DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0, 1.0)
+_DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+# 5th-order weights are the last row of A (FSAL); error = 5th - 4th order
+_DP_E = (
+    71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40,
+)
+
+
+@dataclass
+class IntegratorStats:
+    """Step counts of an adaptive integrator."""
+    steps: int = 0                 # Accepted steps
+    rejected: int = 0              # Steps retried with a smaller dt
+    evaluations: int = 0           # Derivative evaluations
+    min_dt: float = math.inf       # Smallest accepted step (s)
+    max_dt: float = 0.0            # Largest accepted step (s)
+
+    def reset(self) -> None:
+        self.steps = self.rejected = self.evaluations = 0
+        self.min_dt = math.inf
+        self.max_dt = 0.0
+
+    def merge(self, other: IntegratorStats) -> None:
+        """Add another integrator's counts to these."""
+        self.steps += other.steps
+        self.rejected += other.rejected
+        self.evaluations += other.evaluations
+        self.min_dt = min(self.min_dt, other.min_dt)
+        self.max_dt = max(self.max_dt, other.max_dt)
+
+
+class DormandPrince:
+    """Adaptive Dormand-Prince RK5(4) integrator with error control.
+
+    Each call to integrate covers a fixed interval with as many internal
+    steps as the error estimate requires. The step size carries over
+    between calls, so smooth stretches use long steps and fast transients
+    short ones.
+
+    The error of a step is the RMS over components of
+    e_i / (atol_i + rtol * max(|y_i|, |y_new_i|)); a step is accepted when
+    it is <= 1.
+    """
+
+    SAFETY: float = 0.9
+    MIN_FACTOR: float = 0.2
+    MAX_FACTOR: float = 5.0
+
+    def __init__(
+        self,
+        rtol: float = 1e-6,
+        atol: float | np.ndarray = 1e-6,
+        min_dt: float = 1e-7,
+        max_dt: float = math.inf
+    ):
+        """Initialize integrator.
+
+        Args:
+            rtol: Relative tolerance
+            atol: Absolute tolerance, scalar or per state component
+            min_dt: Smallest step; steps are accepted at this size even if
+                    the error is too large (counted in stats as usual)
+            max_dt: Largest step
+        """
+        self.rtol = rtol
+        self.atol = atol
+        self.min_dt = min_dt
+        self.max_dt = max_dt
+        self.stats = IntegratorStats()
+        self._h: Optional[float] = None    # Next step size
+
+    def reset(self) -> None:
+        """Forget the step size and counts."""
+        self._h = None
+        self.stats.reset()
+
+    def integrate(
+        self,
+        f: Callable[[np.ndarray], np.ndarray],
+        y: np.ndarray,
+        interval: float
+    ) -> np.ndarray:
+        """Integrate y' = f(y) over an interval.
+
+        Args:
+            f: Derivative function
+            y: State at the start of the interval
+            interval: Length of the interval (seconds)
+
+        Returns:
+            State at the end of the interval
+        """
+        stats = self.stats
+        h = min(self._h or interval, self.max_dt)
+        t = 0.0
+        k1 = f(y)
+        stats.evaluations += 1
+
+        while t < interval:
+            remaining = interval - t
+            # Stretch the step by up to 1% rather than leave a sliver at the end
+            last = h >= remaining * 0.99
+            step = remaining if last else h
+
+            k = [k1]
+            for stage in range(1, 7):
+                a = _DP_A[stage]
+                y_stage = y + step * sum(a[j] * k[j] for j in range(stage) if a[j])
+                k.append(f(y_stage))
+            stats.evaluations += 6
+            y_new = y_stage            # Last stage is the 5th-order solution (FSAL)
+
+            error = step * sum(_DP_E[j] * k[j] for j in range(7) if _DP_E[j])
+            scale = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(y_new))
+            err = math.sqrt(float(np.mean((error / scale) ** 2)))
+
+            # At min_dt h cannot shrink further (a final step may be stretched past it)
+            if err <= 1.0 or h <= self.min_dt:
+                t = interval if last else t + step
+                y = y_new
+                k1 = k[6]
+                stats.steps += 1
+                stats.min_dt = min(stats.min_dt, step)
+                stats.max_dt = max(stats.max_dt, step)
+                factor = self.MAX_FACTOR if err == 0 else min(
+                    self.MAX_FACTOR, self.SAFETY * err ** -0.2
+                )
+                # A step shortened to land on the interval end says nothing
+                # about the size the next one can have
+                if not last or step >= h:
+                    h = min(max(step * factor, self.min_dt), self.max_dt)
+            else:
+                stats.rejected += 1
+                h = max(step * max(self.MIN_FACTOR, self.SAFETY * err ** -0.2), self.min_dt)
+
+        self._h = h
+        return y
@@ -0,0 +1,195 @@
+"""Opt-in timing of the stages inside a physics step.
+
+A StageProfiler is attached to a Car (and its tires) or to every vehicle
+in a World. The step code calls lap(stage) after each stage; the profiler
+attributes the time since the previous lap to that stage. With no profiler
+attached the step only pays a None check per stage.
+
+Stages recorded by Car.physics_step and Tire.update:
+    steering          Steering and handbrake updates
+    load_transfer     Acceleration smoothing and wheel loads
+    drivetrain        Drive, brake and handbrake torques
+    tire_kinematics   Wheel position and contact patch velocity
+    slip              Slip ratio and slip angle
+    combined_slip     Pacejka forces and combined slip
+    relaxation        Relaxation length dynamics
+    wheel_spin        Wheel angular velocity integration
+    tire_idle         Unloaded tire (slip to wheel_spin skipped)
+    force_accumulation  Tire forces to world frame, body force/torque
+    body_integration  Drag and rigid body integration
+    engine            Engine RPM update
+
+Durations are aggregated into per-stage histograms. With trace=True every
+lap is also kept as an event and can be written as a Chrome trace-event
+JSON file (chrome://tracing, Perfetto).
+"""
+
+from __future__ import annotations
+import json
+import time
+from dataclasses import dataclass, field
+
+
+# Histogram resolution: SUB_BUCKETS buckets per power of two
+SUB_BITS = 2
+SUB_BUCKETS = 1 << SUB_BITS
+
+
+def _bucket(ns: int) -> int:
+    """Log-scale histogram bucket for a duration in nanoseconds."""
+    bits = ns.bit_length()
+    if bits <= SUB_BITS + 1:
+        return ns
+    return (bits - SUB_BITS) * SUB_BUCKETS + ((ns >> (bits - SUB_BITS - 1)) & (SUB_BUCKETS - 1))
+
+
+def _bucket_floor(bucket: int) -> int:
+    """Smallest duration (ns) falling in a bucket."""
+    if bucket < 2 * SUB_BUCKETS:
+        return bucket
+    octave, sub = divmod(bucket, SUB_BUCKETS)
+    bits = octave + SUB_BITS
+    return (SUB_BUCKETS | sub) << (bits - SUB_BITS - 1)
+
+
+@dataclass
+class StageStats:
+    """Aggregated timings of one stage."""
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+    histogram: dict[int, int] = field(default_factory=dict)
+
+    def add(self, ns: int) -> None:
+        """Record one duration."""
+        if self.count == 0 or ns < self.min_ns:
+            self.min_ns = ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.count += 1
+        self.total_ns += ns
+        bucket = _bucket(ns)
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    @property
+    def mean_us(self) -> float:
+        """Mean duration in microseconds."""
+        return self.total_ns / self.count / 1000.0 if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Approximate q-th percentile (0-100) in microseconds.
+
+        Resolved to the histogram bucket (about 25% wide).
+        """
+        if self.count == 0:
+            return 0.0
+        target = q / 100.0 * self.count
+        seen = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= target:
+                return _bucket_floor(bucket) / 1000.0
+        return self.max_ns / 1000.0
+
+
+class StageProfiler:
+    """Collects per-stage timings of physics steps."""
+
+    def __init__(self, trace: bool = False, max_events: int = 1_000_000):
+        """Initialize profiler.
+
+        Args:
+            trace: Keep individual events for Chrome trace export
+            max_events: Stop recording trace events beyond this many
+        """
+        self.trace = trace
+        self.max_events = max_events
+        self.stats: dict[str, StageStats] = {}
+        self.events: list[tuple[str, int, int, int]] = []  # (stage, start_ns, dur_ns, track)
+        self._origin = time.perf_counter_ns()
+        self._step_start = 0
+        self._last = 0
+        self._track = 0
+
+    def start(self, track: int = 0) -> None:
+        """Mark the start of a physics step.
+
+        Args:
+            track: Timeline row for the trace (e.g. vehicle index)
+        """
+        now = time.perf_counter_ns()
+        self._step_start = now
+        self._last = now
+        self._track = track
+
+    def lap(self, stage: str) -> None:
+        """Attribute the time since the previous lap to a stage."""
+        now = time.perf_counter_ns()
+        self._record(stage, self._last, now - self._last)
+        self._last = now
+
+    def finish(self) -> None:
+        """Mark the end of a physics step (recorded as 'physics_step')."""
+        now = time.perf_counter_ns()
+        self._record("physics_step", self._step_start, now - self._step_start)
+        self._last = now
+
+    def _record(self, stage: str, start_ns: int, duration_ns: int) -> None:
+        stats = self.stats.get(stage)
+        if stats is None:
+            stats = self.stats[stage] = StageStats()
+        stats.add(duration_ns)
+        if self.trace and len(self.events) < self.max_events:
+            self.events.append((stage, start_ns, duration_ns, self._track))
+
+    def reset(self) -> None:
+        """Discard all recorded timings and events."""
+        self.stats.clear()
+        self.events.clear()
+        self._origin = time.perf_counter_ns()
+
+    def report(self) -> str:
+        """Table of per-stage timings, slowest total first."""
+        step = self.stats.get("physics_step")
+        step_total = step.total_ns if step else 0
+
+        lines = [
+            f"{'stage':20} {'calls':>8} {'total ms':>10} {'share':>6} "
+            f"{'mean us':>8} {'p50 us':>8} {'p99 us':>8} {'max us':>8}"
+        ]
+        ranked = sorted(self.stats.items(), key=lambda kv: kv[1].total_ns, reverse=True)
+        for name, s in ranked:
+            share = s.total_ns / step_total if step_total else 0.0
+            lines.append(
+                f"{name:20} {s.count:8d} {s.total_ns / 1e6:10.2f} {share:6.1%} "
+                f"{s.mean_us:8.2f} {s.percentile(50):8.2f} {s.percentile(99):8.2f} "
+                f"{s.max_ns / 1000.0:8.2f}"
+            )
+        return "\n".join(lines)
+
+    def to_chrome_trace(self) -> dict:
+        """Trace events in Chrome trace-event format (complete 'X' events)."""
+        return {
+            "traceEvents": [
+                {
+                    "name": stage,
+                    "cat": "physics",
+                    "ph": "X",
+                    "ts": (start - self._origin) / 1000.0,
+                    "dur": duration / 1000.0,
+                    "pid": 0,
+                    "tid": track,
+                }
+                for stage, start, duration, track in self.events
+            ],
+            "displayTimeUnit": "ns",
+        }
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write trace events to a JSON file for chrome://tracing or Perfetto."""
+        if not self.trace:
+            raise ValueError("Profiler was created with trace=False; no events to write")
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
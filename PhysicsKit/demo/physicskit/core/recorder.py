@@ -0,0 +1,442 @@
+"""Streaming telemetry recorder for long runs.
+
+A TelemetryRecorder attached to a World samples the requested telemetry
+channels after every decimation-th step and writes one fixed-width float64
+row per sample into memory-mapped chunk files. Each chunk holds chunk_rows
+rows; when it is full it is flushed and unmapped and the next one is
+created, so memory use depends on chunk_rows, not on the run length.
+
+On disk a recording is a directory:
+
+    telemetry.json     Header: channels, column layout, dt, rows, chunk files
+    chunk_00000.f64    Raw little-endian float64, shape (chunk_rows, row_width)
+    chunk_00001.f64    ...
+
+Column 0 is the simulation time. Each channel then takes a contiguous
+block of n_vehicles columns (n_vehicles * 4 for per-wheel channels, wheel
+index fastest), so a block reshapes to the same (rows, n_vehicles[, 4])
+arrays as World.run returns. The header is rewritten whenever a chunk is
+completed and on close; the last chunk is truncated to the rows written.
+
+A TelemetryReader maps a recording read-only. Channel data are NumPy
+views into the mapped chunks (copied only when a requested range spans
+several chunks), and rows are found by simulation time with a binary
+search on the time column.
+"""
+
+from __future__ import annotations
+import json
+import os
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, cast
+
+import numpy as np
+
+from physicskit.core.telemetry import CHANNELS, Telemetry, get_channel
+
+if TYPE_CHECKING:
+    from physicskit.core.world import World
+    from physicskit.vehicle.car import Car
+
+
+HEADER_NAME = "telemetry.json"
+FORMAT_NAME = "physicskit-telemetry"
+FORMAT_VERSION = 1
+DTYPE = "<f8"
+
+# Channel.read, narrowed by Channel.per_wheel
+ScalarRead = Callable[["Car"], float]
+WheelRead = Callable[["Car"], tuple[float, ...]]
+
+
+def chunk_name(index: int) -> str:
+    """File name of the index-th chunk of a recording."""
+    return f"chunk_{index:05d}.f64"
+
+
+class TelemetryRecorder:
+    """Records telemetry channels of a World into memory-mapped files.
+
+    Usage:
+        with TelemetryRecorder("runs/soak", decimation=10) as recorder:
+            world.attach_recorder(recorder)
+            for _ in range(n_steps):
+                world.step()
+            world.detach_recorder()
+
+    A recorder closed while still attached is detached by the World on its
+    next step.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        channels: Sequence[str] = tuple(CHANNELS),
+        decimation: int = 1,
+        chunk_rows: int = 65536
+    ):
+        """Initialize recorder.
+
+        Args:
+            path: Output directory (created if missing)
+            channels: Telemetry channel names (see core.telemetry.CHANNELS)
+            decimation: Record every decimation-th step
+            chunk_rows: Rows per chunk file; bounds the mapped memory
+        """
+        if decimation < 1:
+            raise ValueError(f"decimation must be >= 1, got {decimation}")
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be >= 1, got {chunk_rows}")
+
+        self.path = path
+        self.channels = [get_channel(name) for name in channels]
+        self.decimation = decimation
+        self.chunk_rows = chunk_rows
+
+        self.rows = 0                  # Rows written so far
+        self.n_vehicles = 0
+        self.row_width = 0
+        self.dt = 0.0
+        self._chunks: list[str] = []
+        self._chunk: Optional[np.memmap] = None
+        self._chunk_row = 0
+        self._countdown = decimation
+        self._open = False
+        self._closed = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    def open(self, world: World) -> None:
+        """Fix the column layout for a world and write an empty recording.
+
+        Called by World.attach_recorder.
+        """
+        if self._open or self._closed:
+            raise ValueError("Recorder is already in use; create a new one per recording")
+
+        self.n_vehicles = len(world.vehicles)
+        if self.n_vehicles == 0:
+            raise ValueError("World has no vehicles to record")
+        self.dt = world.dt
+        self.row_width = 1 + sum(
+            self.n_vehicles * (4 if ch.per_wheel else 1) for ch in self.channels
+        )
+        os.makedirs(self.path, exist_ok=True)
+        self._open = True
+        self._write_header()
+
+    def sample(self, world: World) -> None:
+        """Count one world step and record a row every decimation-th call.
+
+        Called by World.step after the vehicles have been advanced.
+        """
+        self._countdown -= 1
+        if self._countdown:
+            return
+        self._countdown = self.decimation
+        self.record(world)
+
+    def record(self, world: World) -> None:
+        """Write one row with the current state of the world."""
+        if not self._open:
+            raise ValueError("Recorder is not open; attach it to a World first")
+        vehicles = world.vehicles
+        if len(vehicles) != self.n_vehicles:
+            raise ValueError(
+                f"Recorder was opened for {self.n_vehicles} vehicles, "
+                f"world has {len(vehicles)}"
+            )
+
+        row = [world.time]
+        for channel in self.channels:
+            if channel.per_wheel:
+                read_wheels = cast(WheelRead, channel.read)
+                for vehicle in vehicles:
+                    row.extend(read_wheels(vehicle))
+            else:
+                read = cast(ScalarRead, channel.read)
+                for vehicle in vehicles:
+                    row.append(read(vehicle))
+
+        chunk = self._chunk
+        if chunk is None:
+            chunk = self._start_chunk()
+        chunk[self._chunk_row] = row
+        self._chunk_row += 1
+        self.rows += 1
+        if self._chunk_row == self.chunk_rows:
+            self._finish_chunk()
+            self._write_header()
+
+    def flush(self) -> None:
+        """Flush mapped rows to disk and update the header."""
+        if self._chunk is not None:
+            self._chunk.flush()
+        if self._open:
+            self._write_header()
+
+    def close(self) -> None:
+        """Finish the recording: truncate the last chunk and write the header."""
+        if not self._open:
+            return
+        if self._chunk is not None:
+            self._finish_chunk()
+        self._write_header()
+        self._open = False
+        self._closed = True
+
+    def __enter__(self) -> TelemetryRecorder:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def header(self) -> dict:
+        """Header describing the recording (written as telemetry.json)."""
+        columns = [{"name": "time", "unit": "s", "description": "Simulation time",
+                    "per_wheel": False, "offset": 0, "width": 1}]
+        offset = 1
+        for ch in self.channels:
+            width = self.n_vehicles * (4 if ch.per_wheel else 1)
+            columns.append({"name": ch.name, "unit": ch.unit, "description": ch.description,
+                            "per_wheel": ch.per_wheel, "offset": offset, "width": width})
+            offset += width
+        return {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "dtype": DTYPE,
+            "dt": self.dt,
+            "decimation": self.decimation,
+            "n_vehicles": self.n_vehicles,
+            "row_width": self.row_width,
+            "chunk_rows": self.chunk_rows,
+            "rows": self.rows,
+            "chunks": list(self._chunks),
+            "columns": columns,
+        }
+
+    def _start_chunk(self) -> np.memmap:
+        name = chunk_name(len(self._chunks))
+        chunk = self._chunk = np.memmap(
+            os.path.join(self.path, name), dtype=DTYPE, mode="w+",
+            shape=(self.chunk_rows, self.row_width)
+        )
+        self._chunks.append(name)
+        self._chunk_row = 0
+        return chunk
+
+    def _finish_chunk(self) -> None:
+        """Flush and unmap the current chunk, dropping unused rows."""
+        if self._chunk is None:
+            return
+        self._chunk.flush()
+        self._chunk = None             # Unmaps the file
+        if self._chunk_row < self.chunk_rows:
+            itemsize = np.dtype(DTYPE).itemsize
+            os.truncate(
+                os.path.join(self.path, self._chunks[-1]),
+                self._chunk_row * self.row_width * itemsize
+            )
+
+    def _write_header(self) -> None:
+        # Write then rename, so a crash never leaves a half-written header
+        target = os.path.join(self.path, HEADER_NAME)
+        temp = target + ".tmp"
+        with open(temp, "w") as f:
+            json.dump(self.header(), f, indent=2)
+        os.replace(temp, target)
+
+
+class TelemetryReader:
+    """Random access to a recording written by TelemetryRecorder.
+
+    Channels are returned with the same shapes as World.run telemetry:
+    (rows,) for time, (rows, n_vehicles) for scalar channels and
+    (rows, n_vehicles, 4) for per-wheel channels.
+
+    Usage:
+        with TelemetryReader("runs/soak") as reader:
+            lap = reader.time_range(60.0, 120.0)
+            lap["drift_angle"][:, 0]
+    """
+
+    def __init__(self, path: str):
+        """Open a recording.
+
+        Args:
+            path: Recording directory (contains telemetry.json)
+
+        Raises:
+            ValueError: If the directory does not hold a supported recording
+        """
+        with open(os.path.join(path, HEADER_NAME)) as f:
+            header = json.load(f)
+        if header.get("format") != FORMAT_NAME or header.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported telemetry recording in '{path}': "
+                f"format {header.get('format')!r} version {header.get('version')!r}"
+            )
+
+        self.path = path
+        self.header = header
+        self.dt: float = header["dt"]
+        self.decimation: int = header["decimation"]
+        self.n_vehicles: int = header["n_vehicles"]
+        self.row_width: int = header["row_width"]
+        self._columns: dict[str, dict] = {column["name"]: column for column in header["columns"]}
+
+        # Map chunks; a chunk may be longer than the rows the header vouches for
+        # if the recording is still being written
+        itemsize = np.dtype(header["dtype"]).itemsize
+        self._chunks: list[np.ndarray] = []
+        starts = [0]
+        remaining = header["rows"]
+        for name in header["chunks"]:
+            file_rows = os.path.getsize(os.path.join(path, name)) // (self.row_width * itemsize)
+            n = min(file_rows, remaining)
+            if n <= 0:
+                break
+            self._chunks.append(np.memmap(
+                os.path.join(path, name), dtype=header["dtype"], mode="r",
+                shape=(n, self.row_width)
+            ))
+            remaining -= n
+            starts.append(starts[-1] + n)
+        self._starts = starts
+        self.rows = starts[-1]
+        self._first_times = [float(chunk[0, 0]) for chunk in self._chunks]
+
+    @property
+    def channel_names(self) -> list[str]:
+        """Recorded channel names, in column order (excluding time)."""
+        return [name for name in self._columns if name != "time"]
+
+    def unit(self, name: str) -> str:
+        """Unit of a channel."""
+        return str(self._column(name)["unit"])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.channel(name)
+
+    @property
+    def time(self) -> np.ndarray:
+        """Simulation time of every row."""
+        return self.channel("time")
+
+    def channel(self, name: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Rows [start, stop) of a channel.
+
+        Returns a view into the mapped file when the rows lie in one chunk,
+        otherwise a copy.
+        """
+        column = self._column(name)
+        start, stop, _ = slice(start, stop).indices(self.rows)
+        stop = max(start, stop)
+        first = max(0, bisect_right(self._starts, start) - 1)
+
+        pieces = []
+        k = first
+        while k < len(self._chunks) and self._starts[k] < stop:
+            lo = max(start, self._starts[k]) - self._starts[k]
+            hi = min(stop, self._starts[k + 1]) - self._starts[k]
+            pieces.append(self._block(self._chunks[k][lo:hi], column))
+            k += 1
+
+        if len(pieces) == 1:
+            return pieces[0]
+        if not pieces:
+            return self._block(np.empty((0, self.row_width)), column)
+        return np.concatenate(pieces)
+
+    def frame(self, index: int) -> dict[str, np.ndarray]:
+        """All channels of one row, as views: scalars (n_vehicles,), per-wheel (n_vehicles, 4)."""
+        if not -self.rows <= index < self.rows:
+            raise IndexError(f"Row {index} out of range for {self.rows} rows")
+        index %= self.rows
+        k = bisect_right(self._starts, index) - 1
+        row = self._chunks[k][index - self._starts[k]:index - self._starts[k] + 1]
+        return {name: self._block(row, column)[0] for name, column in self._columns.items()}
+
+    def index_at(self, t: float, side: str = "left") -> int:
+        """Row index for a simulation time, by binary search on the time column.
+
+        Like numpy.searchsorted: the first row with time >= t ("left") or
+        time > t ("right"). Assumes time increases through the recording.
+        """
+        if side not in ("left", "right"):
+            raise ValueError(f"side must be 'left' or 'right', got {side!r}")
+        if not self._chunks:
+            return 0
+        search = bisect_left if side == "left" else bisect_right
+        k = max(0, bisect_right(self._first_times, t) - 1)
+        return self._starts[k] + search(self._chunks[k][:, 0], t)
+
+    def time_range(
+        self,
+        t_start: float,
+        t_end: float,
+        channels: Optional[Sequence[str]] = None
+    ) -> Telemetry:
+        """Rows with t_start <= time <= t_end as Telemetry.
+
+        Args:
+            t_start: First simulation time to include (seconds)
+            t_end: Last simulation time to include (seconds)
+            channels: Channels to include. Defaults to all.
+        """
+        return self.to_telemetry(
+            channels, self.index_at(t_start, "left"), self.index_at(t_end, "right")
+        )
+
+    def to_telemetry(
+        self,
+        channels: Optional[Sequence[str]] = None,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> Telemetry:
+        """Rows [start, stop) as Telemetry, the type World.run returns."""
+        names = self.channel_names if channels is None else list(channels)
+        return Telemetry(
+            time=self.channel("time", start, stop),
+            channels={name: self.channel(name, start, stop) for name in names},
+            dt=self.dt,
+            decimation=self.decimation
+        )
+
+    def close(self) -> None:
+        """Release the mapped chunks (views handed out stay valid)."""
+        self._chunks = []
+        self._starts = [0]
+        self._first_times = []
+        self.rows = 0
+
+    def __enter__(self) -> TelemetryReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _column(self, name: str) -> dict:
+        if name not in self._columns:
+            raise ValueError(
+                f"Unknown telemetry channel '{name}'. Available: {', '.join(self._columns)}"
+            )
+        return self._columns[name]
+
+    def _block(self, rows: np.ndarray, column: dict) -> np.ndarray:
+        """Channel columns of some rows, reshaped to telemetry layout."""
+        offset = column["offset"]
+        block = rows[:, offset:offset + column["width"]]
+        if column["name"] == "time":
+            return block[:, 0]
+        if column["per_wheel"]:
+            return block.reshape(len(rows), self.n_vehicles, 4)
+        return block
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 import math
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass
+from typing import Optional, Sequence, Union
 
-from physicskit.core.vector import Vector3, normalize_angle
+from physicskit.core.vector import Vector2, Vector3, normalize_angle
 
 
-@dataclass
+@dataclass(init=False)
 class RigidBody:
     """2D rigid body with mass, inertia, position, and velocities.
 
@@ -16,21 +16,61 @@ class RigidBody:
     - Position is in the XY plane (z=0)
     - Orientation is yaw angle (rotation around Z axis)
     - Angular velocity is yaw rate
+
+    The cosine and sine of the orientation are cached and recomputed only
+    when orientation is assigned, so frame transforms do not call trig
+    functions.
     """
 
     # Physical properties
-    mass: float = 1000.0  # kg
-    inertia: float = 2000.0  # kg*m^2 (yaw moment of inertia)
+    mass: float  # kg
+    inertia: float  # kg*m^2 (yaw moment of inertia)
 
     # State
-    position: Vector3 = field(default_factory=Vector3)
-    orientation: float = 0.0  # radians (yaw angle)
-    velocity: Vector3 = field(default_factory=Vector3)
-    angular_velocity: float = 0.0  # rad/s (yaw rate)
+    position: Vector3
+    _orientation: float  # radians (yaw angle), set through orientation
+    velocity: Vector3
+    angular_velocity: float  # rad/s (yaw rate)
 
     # Force/torque accumulators (reset each step)
-    _force: Vector3 = field(default_factory=Vector3)
-    _torque: float = 0.0
+    _force: Vector3
+    _torque: float
+
+    def __init__(
+        self,
+        mass: float = 1000.0,
+        inertia: float = 2000.0,
+        position: Optional[Vector3] = None,
+        orientation: float = 0.0,
+        velocity: Optional[Vector3] = None,
+        angular_velocity: float = 0.0,
+        _force: Optional[Vector3] = None,
+        _torque: float = 0.0
+    ):
+        self.mass = mass
+        self.inertia = inertia
+        self.position = position if position is not None else Vector3()
+        self.orientation = orientation
+        self.velocity = velocity if velocity is not None else Vector3()
+        self.angular_velocity = angular_velocity
+        self._force = _force if _force is not None else Vector3()
+        self._torque = _torque
+
+    @property
+    def orientation(self) -> float:
+        """Yaw angle (radians)."""
+        return self._orientation
+
+    @orientation.setter
+    def orientation(self, value: float) -> None:
+        self._orientation = value
+        self._cos = math.cos(value)
+        self._sin = math.sin(value)
+
+    @property
+    def basis(self) -> tuple[float, float]:
+        """Cached (cos, sin) of the orientation."""
+        return self._cos, self._sin
 
     def apply_force(self, force: Vector3, world_point: Optional[Vector3] = None) -> None:
         """Apply force at a world point (or center of mass if None).
@@ -49,6 +89,19 @@ class RigidBody:
             torque = r.x * force.y - r.y * force.x
             self._torque += torque
 
+    def add_force_xy(self, fx: float, fy: float) -> None:
+        """Add a world-frame force at the center of mass (no torque).
+
+        Allocation-free variant of apply_force for the step loop.
+
+        Args:
+            fx: Force x component (Newtons, world frame)
+            fy: Force y component (Newtons, world frame)
+        """
+        force = self._force
+        force.x += fx
+        force.y += fy
+
     def apply_force_local(self, force: Vector3, local_point: Optional[Vector3] = None) -> None:
         """Apply force in local coordinates at a local point.
 
@@ -58,7 +111,7 @@ class RigidBody:
                         If None, force is applied at center of mass.
         """
         # Transform force to world coordinates
-        world_force = force.rotate_z(self.orientation)
+        world_force = force.rotate_z_into(Vector3(), self._cos, self._sin)
 
         if local_point is not None:
             world_point = self.local_to_world(local_point)
@@ -77,21 +130,89 @@ class RigidBody:
 
     def local_to_world(self, local_point: Vector3) -> Vector3:
         """Transform a point from local (body) to world coordinates."""
-        rotated = local_point.rotate_z(self.orientation)
-        return self.position + rotated
+        c = self._cos
+        s = self._sin
+        return Vector3(
+            self.position.x + local_point.x * c - local_point.y * s,
+            self.position.y + local_point.x * s + local_point.y * c,
+            self.position.z + local_point.z
+        )
 
     def world_to_local(self, world_point: Vector3) -> Vector3:
         """Transform a point from world to local (body) coordinates."""
         relative = world_point - self.position
-        return relative.rotate_z(-self.orientation)
+        return relative.rotate_z_into(relative, self._cos, -self._sin)
 
     def local_to_world_direction(self, local_dir: Vector3) -> Vector3:
         """Transform a direction from local to world coordinates (no translation)."""
-        return local_dir.rotate_z(self.orientation)
+        return local_dir.rotate_z_into(Vector3(), self._cos, self._sin)
 
     def world_to_local_direction(self, world_dir: Vector3) -> Vector3:
         """Transform a direction from world to local coordinates."""
-        return world_dir.rotate_z(-self.orientation)
+        return world_dir.rotate_z_into(Vector3(), self._cos, -self._sin)
+
+    def local_to_world_batch(
+        self, local_points: Sequence[Union[Vector2, Vector3]]
+    ) -> list[Vector3]:
+        """Transform several points from local to world coordinates.
+
+        Args:
+            local_points: Points in local (body) coordinates
+
+        Returns:
+            World points, in the same order
+        """
+        c = self._cos
+        s = self._sin
+        px = self.position.x
+        py = self.position.y
+        return [
+            Vector3(px + p.x * c - p.y * s, py + p.x * s + p.y * c, 0.0)
+            for p in local_points
+        ]
+
+    def rotate_offsets_into(
+        self,
+        local_offsets: Sequence[Union[Vector2, Vector3]],
+        out: Sequence[Union[Vector2, Vector3]]
+    ) -> None:
+        """Rotate body-frame offsets into world-frame offsets (no translation).
+
+        Writes into preallocated vectors, e.g. all four wheel offsets from
+        the CG in one call per step.
+
+        Args:
+            local_offsets: Offsets in local (body) coordinates
+            out: Vectors to write the world-frame offsets into (same length)
+        """
+        c = self._cos
+        s = self._sin
+        for p, o in zip(local_offsets, out):
+            x = p.x
+            y = p.y
+            o.x = x * c - y * s
+            o.y = x * s + y * c
+
+    def get_velocity_at_point_into(
+        self, out: Vector3, offset_x: float, offset_y: float
+    ) -> Vector3:
+        """Write the velocity at a world-frame offset from the center of mass into out.
+
+        Allocation-free variant of get_velocity_at_point for the step loop.
+
+        Args:
+            out: Vector to write into
+            offset_x: X offset of the point from the center of mass (world frame)
+            offset_y: Y offset of the point from the center of mass (world frame)
+
+        Returns:
+            out
+        """
+        omega = self.angular_velocity
+        out.x = self.velocity.x - omega * offset_y
+        out.y = self.velocity.y + omega * offset_x
+        out.z = self.velocity.z
+        return out
 
     def get_velocity_at_point(self, world_point: Vector3) -> Vector3:
         """Get velocity at a world point (includes angular contribution).
@@ -119,11 +240,11 @@ class RigidBody:
 
     def get_forward_vector(self) -> Vector3:
         """Get unit vector pointing forward (local +X in world)."""
-        return Vector3(math.cos(self.orientation), math.sin(self.orientation), 0.0)
+        return Vector3(self._cos, self._sin, 0.0)
 
     def get_right_vector(self) -> Vector3:
         """Get unit vector pointing right (local +Y in world)."""
-        return Vector3(-math.sin(self.orientation), math.cos(self.orientation), 0.0)
+        return Vector3(-self._sin, self._cos, 0.0)
 
     def get_speed(self) -> float:
         """Get speed (magnitude of velocity)."""
@@ -131,13 +252,11 @@ class RigidBody:
 
     def get_forward_speed(self) -> float:
         """Get speed in forward direction (can be negative if reversing)."""
-        local_vel = self.get_local_velocity()
-        return local_vel.x
+        return self.velocity.x * self._cos + self.velocity.y * self._sin
 
     def get_lateral_speed(self) -> float:
         """Get speed in lateral direction (positive = moving right)."""
-        local_vel = self.get_local_velocity()
-        return local_vel.y
+        return -self.velocity.x * self._sin + self.velocity.y * self._cos
 
     def get_accumulated_force(self) -> Vector3:
         """Get total accumulated force."""
@@ -149,7 +268,7 @@ class RigidBody:
 
     def clear_forces(self) -> None:
         """Reset force and torque accumulators."""
-        self._force = Vector3(0.0, 0.0, 0.0)
+        self._force.set_zero()
         self._torque = 0.0
 
     def get_acceleration(self) -> Vector3:
@@ -166,18 +285,16 @@ class RigidBody:
         Updates velocity first, then position with new velocity.
         More stable than explicit Euler for oscillatory systems.
         """
-        # Linear
-        acceleration = self.get_acceleration()
-        self.velocity += acceleration * dt
-        self.position += self.velocity * dt
+        # Linear (in place, no temporaries)
+        self.velocity.add_scaled_(self._force, dt / self.mass)
+        self.position.add_scaled_(self.velocity, dt)
 
         # Angular
         angular_accel = self.get_angular_acceleration()
         self.angular_velocity += angular_accel * dt
-        self.orientation += self.angular_velocity * dt
 
-        # Normalize orientation
-        self.orientation = normalize_angle(self.orientation)
+        # Single write so the cached basis is recomputed once
+        self.orientation = normalize_angle(self._orientation + self.angular_velocity * dt)
 
         # Clear accumulators
         self.clear_forces()
@@ -0,0 +1,300 @@
+"""Scripted control inputs for headless runs.
+
+An InputSchedule holds one keyframe track per input (throttle, brake,
+steer, handbrake). Tracks interpolate linearly between keys or hold each
+key until the next ("step"); before the first key a track holds its first
+value, after the last key its last value, and inputs without a track are 0.
+
+compile() samples the schedule once per physics step into an InputTable,
+a dense (n_steps, 4) array, so runs index a row per step instead of
+interpolating in Python. World.run and FleetWorld.run accept a schedule
+directly.
+
+Schedules load from JSON:
+
+    {"duration": 6.0,
+     "tracks": {
+        "throttle":  {"keys": [[0.0, 0.8]]},
+        "steer":     {"keys": [[0.0, 0.0], [2.8, 0.6], [3.1, -0.4]]},
+        "handbrake": {"keys": [[0.0, 0.0], [3.0, 1.0], [3.3, 0.0]],
+                      "interpolation": "step"}}}
+
+or from CSV with a "t" column and one column per input; empty cells are
+not keys:
+
+    t,throttle,steer,handbrake
+    0.0,0.8,0.0,0
+    2.8,,0.6,
+    3.0,,,1
+"""
+
+from __future__ import annotations
+import csv
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+
+INPUT_NAMES: tuple[str, ...] = ("throttle", "brake", "steer", "handbrake")
+INTERPOLATIONS: tuple[str, ...] = ("linear", "step")
+
+
+def _check_input(name: str) -> None:
+    if name not in INPUT_NAMES:
+        raise ValueError(f"Unknown input '{name}'. Available: {', '.join(INPUT_NAMES)}")
+
+
+def _check_interpolation(interpolation: str) -> None:
+    if interpolation not in INTERPOLATIONS:
+        raise ValueError(
+            f"Unknown interpolation '{interpolation}'. Available: {', '.join(INTERPOLATIONS)}"
+        )
+
+
+@dataclass
+class InputTrack:
+    """Keyframes of one input."""
+    keys: list[tuple[float, float]] = field(default_factory=list)   # (time s, value)
+    interpolation: str = "linear"
+
+    def __post_init__(self):
+        _check_interpolation(self.interpolation)
+        self.keys = sorted((float(t), float(v)) for t, v in self.keys)
+
+    def add(self, t: float, value: float) -> None:
+        """Add a key, replacing any key at the same time."""
+        self.keys = [key for key in self.keys if key[0] != t]
+        self.keys.append((float(t), float(value)))
+        self.keys.sort()
+
+    def sample(self, times: np.ndarray) -> np.ndarray:
+        """Values at an array of times."""
+        if not self.keys:
+            return np.zeros(len(times))
+        key_times = np.array([t for t, _ in self.keys])
+        key_values = np.array([v for _, v in self.keys])
+        values: np.ndarray
+        if self.interpolation == "linear":
+            values = np.interp(times, key_times, key_values)
+        else:
+            index = np.searchsorted(key_times, times, side="right") - 1
+            values = key_values[np.maximum(index, 0)]
+        return values
+
+    def value(self, t: float) -> float:
+        """Value at one time."""
+        return float(self.sample(np.array([t]))[0])
+
+
+@dataclass
+class InputTable:
+    """An InputSchedule sampled at every physics step.
+
+    Row k holds (throttle, brake, steer, handbrake) for the step starting
+    at t0 + k * dt.
+    """
+    values: np.ndarray             # (n_steps, 4)
+    dt: float
+    t0: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def index(self, t: float) -> int:
+        """Row for a simulation time, clamped to the table."""
+        k = int(round((t - self.t0) / self.dt))
+        return min(max(k, 0), len(self.values) - 1)
+
+    def at(self, t: float) -> np.ndarray:
+        """Inputs for a simulation time (O(1))."""
+        row: np.ndarray = self.values[self.index(t)]
+        return row
+
+
+@dataclass
+class InputSchedule:
+    """Keyframed control inputs."""
+    tracks: dict[str, InputTrack] = field(default_factory=dict)
+    duration: Optional[float] = None   # Default run length (s)
+
+    def __post_init__(self):
+        for name in self.tracks:
+            _check_input(name)
+
+    def key(
+        self,
+        name: str,
+        t: float,
+        value: float,
+        interpolation: Optional[str] = None
+    ) -> InputSchedule:
+        """Add a keyframe; returns self so calls can be chained.
+
+        Args:
+            name: Input name (see INPUT_NAMES)
+            t: Time (seconds)
+            value: Input value
+            interpolation: Set the track's interpolation ("linear" or "step")
+        """
+        _check_input(name)
+        track = self.tracks.setdefault(name, InputTrack())
+        if interpolation is not None:
+            _check_interpolation(interpolation)
+            track.interpolation = interpolation
+        track.add(t, value)
+        return self
+
+    def sample(self, times: np.ndarray) -> np.ndarray:
+        """Inputs at an array of times, shape (len(times), 4)."""
+        times = np.asarray(times, dtype=float)
+        out = np.zeros((len(times), len(INPUT_NAMES)))
+        for column, name in enumerate(INPUT_NAMES):
+            track = self.tracks.get(name)
+            if track is not None:
+                out[:, column] = track.sample(times)
+        return out
+
+    def __call__(self, t: float) -> tuple[float, float, float, float]:
+        """Inputs at one time, as (throttle, brake, steer, handbrake)."""
+        throttle, brake, steer, handbrake = self.sample(np.array([t]))[0].tolist()
+        return throttle, brake, steer, handbrake
+
+    def compile(self, dt: float, n_steps: Optional[int] = None, t0: float = 0.0) -> InputTable:
+        """Sample the schedule at every physics step.
+
+        Args:
+            dt: Physics timestep (seconds)
+            n_steps: Rows to produce. Defaults to duration / dt.
+            t0: Simulation time of the first step
+
+        Returns:
+            InputTable of shape (n_steps, 4)
+        """
+        if n_steps is None:
+            if self.duration is None:
+                raise ValueError("n_steps is required for a schedule without a duration")
+            n_steps = math.ceil(self.duration / dt - 1e-9)
+        times = t0 + np.arange(n_steps) * dt
+        return InputTable(self.sample(times), dt, t0)
+
+    @staticmethod
+    def compile_batch(
+        schedules: Sequence[InputSchedule],
+        dt: float,
+        n_steps: int,
+        t0: float = 0.0
+    ) -> np.ndarray:
+        """Sample one schedule per vehicle into an (n_steps, n_vehicles, 4) array."""
+        times = t0 + np.arange(n_steps) * dt
+        return np.stack([schedule.sample(times) for schedule in schedules], axis=1)
+
+    @classmethod
+    def handbrake_flick(
+        cls,
+        flick_time: float = 3.0,
+        flick_duration: float = 0.3,
+        turn_in: float = 0.6,
+        counter_steer: float = -0.4,
+        throttle: float = 0.8,
+        duration: float = 6.0
+    ) -> InputSchedule:
+        """Hold throttle, turn in, flick the handbrake, then counter-steer.
+
+        Args:
+            flick_time: Handbrake pull time (seconds)
+            flick_duration: How long the handbrake is held (seconds)
+            turn_in: Steering during turn-in (-1 to 1)
+            counter_steer: Steering held after the flick (-1 to 1)
+            throttle: Throttle held throughout (0-1)
+            duration: Schedule length (seconds)
+        """
+        turn_in_start = max(0.0, flick_time - 0.5)
+        release = flick_time + flick_duration
+        return (
+            cls(duration=duration)
+            .key("throttle", 0.0, throttle)
+            .key("steer", 0.0, 0.0)
+            .key("steer", turn_in_start, 0.0)
+            .key("steer", flick_time, turn_in)
+            .key("steer", release, counter_steer)
+            .key("handbrake", 0.0, 0.0, interpolation="step")
+            .key("handbrake", flick_time, 1.0)
+            .key("handbrake", release, 0.0)
+        )
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form (see module docstring)."""
+        data: dict = {
+            "tracks": {
+                name: {"keys": [list(key) for key in track.keys],
+                       "interpolation": track.interpolation}
+                for name, track in self.tracks.items()
+            }
+        }
+        if self.duration is not None:
+            data["duration"] = self.duration
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> InputSchedule:
+        """Build a schedule from its to_dict form."""
+        tracks = {
+            name: InputTrack(
+                keys=[tuple(key) for key in spec.get("keys", [])],
+                interpolation=spec.get("interpolation", "linear")
+            )
+            for name, spec in data.get("tracks", {}).items()
+        }
+        return cls(tracks=tracks, duration=data.get("duration"))
+
+    def save_json(self, path: str) -> None:
+        """Write the schedule as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def from_json(cls, path: str) -> InputSchedule:
+        """Read a schedule written by save_json."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str,
+        interpolation: Union[str, Mapping[str, str]] = "linear",
+        duration: Optional[float] = None
+    ) -> InputSchedule:
+        """Read keyframes from a CSV file with a "t" column.
+
+        Args:
+            path: CSV file
+            interpolation: For every track, or per input name (missing = "linear")
+            duration: Schedule length. Defaults to the last key time.
+        """
+        schedule = cls()
+        last = 0.0
+        with open(path, newline="") as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None or "t" not in reader.fieldnames:
+                raise ValueError(f"Input CSV '{path}' needs a 't' column")
+            for name in reader.fieldnames:
+                if name != "t":
+                    _check_input(name)
+            for row in reader:
+                t = float(row["t"])
+                last = max(last, t)
+                for name in INPUT_NAMES:
+                    cell = (row.get(name) or "").strip()
+                    if cell:
+                        schedule.key(name, t, float(cell))
+
+        for name, track in schedule.tracks.items():
+            mode = interpolation if isinstance(interpolation, str) else interpolation.get(name, "linear")
+            _check_interpolation(mode)
+            track.interpolation = mode
+        schedule.duration = duration if duration is not None else last
+        return schedule
@@ -0,0 +1,162 @@
+"""Telemetry channels for headless simulation runs.
+
+A channel reads one quantity through a Car's live state view and its
+tires' accessors, without building CarState/TireState objects. World.run records the requested
+channels into preallocated arrays.
+
+Scalar channels have shape (n_records, n_vehicles); per-wheel channels
+have shape (n_records, n_vehicles, 4) in WheelPosition order
+(FL, FR, RL, RR).
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Sequence, Union
+
+import numpy as np
+
+from physicskit.drift.metrics import DriftAnalyzer
+
+if TYPE_CHECKING:
+    from physicskit.tire.tire import Tire
+    from physicskit.vehicle.car import Car
+
+ChannelValue = Union[float, tuple[float, ...]]
+
+
+@dataclass(frozen=True)
+class Channel:
+    """A named telemetry quantity."""
+    name: str
+    unit: str
+    description: str
+    read: Callable[[Car], ChannelValue] = field(repr=False)
+    per_wheel: bool = False        # read returns 4 values (FL, FR, RL, RR)
+
+
+def _local_velocity(car: Car) -> tuple[float, float]:
+    """Body-frame (forward, lateral) velocity without allocating vectors."""
+    body = car.body
+    c, s = body.basis
+    vx = body.velocity.x
+    vy = body.velocity.y
+    return vx * c + vy * s, -vx * s + vy * c
+
+
+def _wheels(read: Callable[[Tire], float]) -> Callable[[Car], tuple[float, ...]]:
+    """Build a per-wheel reader from a function of a Tire."""
+    def read_wheels(car: Car) -> tuple[float, ...]:
+        return tuple(read(tire) for tire in car.wheels)
+    return read_wheels
+
+
+def _drifting(car: Car) -> float:
+    """1.0 while the car is past DriftAnalyzer's angle and speed thresholds."""
+    if car.body.velocity.magnitude() < DriftAnalyzer.DRIFT_SPEED_MIN:
+        return 0.0
+    return float(abs(car.get_drift_angle()) >= DriftAnalyzer.DRIFT_ANGLE_MIN)
+
+
+def _wheel_loads(car: Car) -> tuple[float, float, float, float]:
+    return car.get_state_view().wheel_loads.as_tuple()
+
+
+CHANNELS: dict[str, Channel] = {
+    channel.name: channel for channel in (
+        # Body
+        Channel("x", "m", "World X position", lambda car: car.body.position.x),
+        Channel("y", "m", "World Y position", lambda car: car.body.position.y),
+        Channel("orientation", "rad", "Yaw angle", lambda car: car.body.orientation),
+        Channel("vx", "m/s", "World X velocity", lambda car: car.body.velocity.x),
+        Channel("vy", "m/s", "World Y velocity", lambda car: car.body.velocity.y),
+        Channel("yaw_rate", "rad/s", "Yaw rate", lambda car: car.body.angular_velocity),
+        Channel("speed", "m/s", "Speed", lambda car: car.body.velocity.magnitude()),
+        Channel("forward_speed", "m/s", "Body-frame forward speed",
+                lambda car: _local_velocity(car)[0]),
+        Channel("lateral_speed", "m/s", "Body-frame lateral speed",
+                lambda car: _local_velocity(car)[1]),
+        Channel("drift_angle", "deg", "Body slip angle", lambda car: car.get_drift_angle()),
+        Channel("drifting", "", "1 while drifting (DriftAnalyzer thresholds)", _drifting),
+        Channel("longitudinal_accel", "m/s^2", "Smoothed forward acceleration",
+                lambda car: car.get_state_view().longitudinal_accel),
+        Channel("lateral_accel", "m/s^2", "Smoothed lateral acceleration",
+                lambda car: car.get_state_view().lateral_accel),
+
+        # Inputs and subsystems
+        Channel("throttle", "", "Throttle input", lambda car: car.get_state_view().throttle),
+        Channel("brake", "", "Brake input", lambda car: car.get_state_view().brake),
+        Channel("steer", "", "Steering input", lambda car: car.get_state_view().steer),
+        Channel("handbrake", "", "Handbrake input", lambda car: car.get_state_view().handbrake),
+        Channel("engine_rpm", "rpm", "Engine speed", lambda car: car.drivetrain.engine_rpm),
+
+        # Wheels
+        Channel("wheel_load", "N", "Normal load", _wheel_loads, per_wheel=True),
+        Channel("wheel_speed", "rad/s", "Wheel angular velocity",
+                _wheels(lambda tire: tire.angular_velocity), per_wheel=True),
+        Channel("slip_ratio", "", "Longitudinal slip ratio",
+                _wheels(lambda tire: tire.slip_ratio), per_wheel=True),
+        Channel("slip_angle", "deg", "Lateral slip angle",
+                _wheels(lambda tire: tire.slip_angle_deg), per_wheel=True),
+        Channel("Fx", "N", "Longitudinal tire force (tire frame)",
+                _wheels(lambda tire: tire.get_forces_local()[0]), per_wheel=True),
+        Channel("Fy", "N", "Lateral tire force (tire frame)",
+                _wheels(lambda tire: tire.get_forces_local()[1]), per_wheel=True),
+    )
+}
+
+DEFAULT_CHANNELS: tuple[str, ...] = (
+    "x", "y", "orientation", "speed", "yaw_rate", "drift_angle"
+)
+
+
+def get_channel(name: str) -> Channel:
+    """Look up a telemetry channel by name.
+
+    Raises:
+        ValueError: If the channel does not exist
+    """
+    if name not in CHANNELS:
+        raise ValueError(
+            f"Unknown telemetry channel '{name}'. Available: {', '.join(CHANNELS)}"
+        )
+    return CHANNELS[name]
+
+
+@dataclass
+class Telemetry:
+    """Recorded channels from World.run."""
+    time: np.ndarray                                  # (n_records,)
+    channels: dict[str, np.ndarray] = field(default_factory=dict)
+    dt: float = 0.001
+    decimation: int = 1
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.channels[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.channels
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @classmethod
+    def allocate(
+        cls,
+        channels: Sequence[Channel],
+        n_records: int,
+        n_vehicles: int,
+        dt: float,
+        decimation: int
+    ) -> Telemetry:
+        """Preallocate arrays for a run."""
+        return cls(
+            time=np.zeros(n_records),
+            channels={
+                ch.name: np.zeros(
+                    (n_records, n_vehicles, 4) if ch.per_wheel else (n_records, n_vehicles)
+                )
+                for ch in channels
+            },
+            dt=dt,
+            decimation=decimation
+        )
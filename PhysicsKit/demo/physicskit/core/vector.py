@@ -1,4 +1,9 @@
-"""Vector mathematics for 2D/3D physics simulation."""
+"""Vector mathematics for 2D/3D physics simulation.
+
+Both vector types use __slots__. Operators return new vectors; the
+trailing-underscore methods and the *_into methods update an existing
+vector instead, for hot loops that run every physics step.
+"""
 
 from __future__ import annotations
 import math
@@ -8,7 +13,7 @@ from typing import Union
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector3:
     """3D vector with common operations for physics simulation.
 
@@ -101,6 +106,48 @@ class Vector3:
         """Return a copy of this vector."""
         return Vector3(self.x, self.y, self.z)
 
+    def xy(self) -> Vector2:
+        """Return the XY components as a Vector2."""
+        return Vector2(self.x, self.y)
+
+    # In-place helpers (no allocation)
+    def set(self, x: float, y: float, z: float = 0.0) -> Vector3:
+        """Set all components in place."""
+        self.x = x
+        self.y = y
+        self.z = z
+        return self
+
+    def set_zero(self) -> Vector3:
+        """Set all components to zero in place."""
+        self.x = 0.0
+        self.y = 0.0
+        self.z = 0.0
+        return self
+
+    def add_scaled_(self, other: Vector3, scale: float) -> Vector3:
+        """In place: self += other * scale."""
+        self.x += other.x * scale
+        self.y += other.y * scale
+        self.z += other.z * scale
+        return self
+
+    def rotate_z_into(self, out: Vector3, cos_a: float, sin_a: float) -> Vector3:
+        """Write this vector rotated around Z into out.
+
+        Takes the cosine and sine of the angle so callers rotating several
+        vectors by the same angle compute them once. out may be self.
+
+        Returns:
+            out
+        """
+        x = self.x
+        y = self.y
+        out.x = x * cos_a - y * sin_a
+        out.y = x * sin_a + y * cos_a
+        out.z = self.z
+        return out
+
     # Operator overloads
     def __add__(self, other: Vector3) -> Vector3:
         return Vector3(self.x + other.x, self.y + other.y, self.z + other.z)
@@ -142,6 +189,139 @@ class Vector3:
         return f"Vector3({self.x:.4f}, {self.y:.4f}, {self.z:.4f})"
 
 
+@dataclass(slots=True)
+class Vector2:
+    """2D vector in the ground (XY) plane.
+
+    The simulation is planar, so quantities that never leave the ground
+    plane (wheel offsets, tire forces) can skip the z component.
+    """
+    x: float = 0.0
+    y: float = 0.0
+
+    @classmethod
+    def from_angle(cls, angle: float, magnitude: float = 1.0) -> Vector2:
+        """Create Vector2 from angle (radians)."""
+        return cls(math.cos(angle) * magnitude, math.sin(angle) * magnitude)
+
+    def to_array(self) -> np.ndarray:
+        """Convert to numpy array."""
+        return np.array([self.x, self.y])
+
+    def to_vector3(self, z: float = 0.0) -> Vector3:
+        """Convert to Vector3."""
+        return Vector3(self.x, self.y, z)
+
+    def magnitude(self) -> float:
+        """Return the length of the vector."""
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+    def magnitude_squared(self) -> float:
+        """Return the squared length (faster, no sqrt)."""
+        return self.x * self.x + self.y * self.y
+
+    def normalized(self) -> Vector2:
+        """Return unit vector in same direction."""
+        mag = self.magnitude()
+        if mag < 1e-10:
+            return Vector2(0.0, 0.0)
+        return Vector2(self.x / mag, self.y / mag)
+
+    def dot(self, other: Vector2) -> float:
+        """Dot product with another vector."""
+        return self.x * other.x + self.y * other.y
+
+    def cross(self, other: Vector2) -> float:
+        """Z component of the cross product (self x other)."""
+        return self.x * other.y - self.y * other.x
+
+    def rotate_z(self, angle: float) -> Vector2:
+        """Rotate vector by angle (radians)."""
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        return Vector2(self.x * cos_a - self.y * sin_a, self.x * sin_a + self.y * cos_a)
+
+    def angle(self) -> float:
+        """Return angle of vector (radians)."""
+        return math.atan2(self.y, self.x)
+
+    def perpendicular(self) -> Vector2:
+        """Return perpendicular vector (90 degrees CCW)."""
+        return Vector2(-self.y, self.x)
+
+    def lerp(self, other: Vector2, t: float) -> Vector2:
+        """Linear interpolation between this and other vector."""
+        return Vector2(self.x + (other.x - self.x) * t, self.y + (other.y - self.y) * t)
+
+    def copy(self) -> Vector2:
+        """Return a copy of this vector."""
+        return Vector2(self.x, self.y)
+
+    # In-place helpers (no allocation)
+    def set(self, x: float, y: float) -> Vector2:
+        """Set both components in place."""
+        self.x = x
+        self.y = y
+        return self
+
+    def add_scaled_(self, other: Vector2, scale: float) -> Vector2:
+        """In place: self += other * scale."""
+        self.x += other.x * scale
+        self.y += other.y * scale
+        return self
+
+    def rotate_z_into(self, out: Union[Vector2, Vector3], cos_a: float, sin_a: float):
+        """Write this vector rotated by an angle into out.
+
+        out may be a Vector2 or a Vector3 (its z is left unchanged), or self.
+
+        Returns:
+            out
+        """
+        x = self.x
+        y = self.y
+        out.x = x * cos_a - y * sin_a
+        out.y = x * sin_a + y * cos_a
+        return out
+
+    # Operator overloads
+    def __add__(self, other: Vector2) -> Vector2:
+        return Vector2(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: Vector2) -> Vector2:
+        return Vector2(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar: float) -> Vector2:
+        return Vector2(self.x * scalar, self.y * scalar)
+
+    def __rmul__(self, scalar: float) -> Vector2:
+        return self.__mul__(scalar)
+
+    def __truediv__(self, scalar: float) -> Vector2:
+        return Vector2(self.x / scalar, self.y / scalar)
+
+    def __neg__(self) -> Vector2:
+        return Vector2(-self.x, -self.y)
+
+    def __iadd__(self, other: Vector2) -> Vector2:
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other: Vector2) -> Vector2:
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, scalar: float) -> Vector2:
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __repr__(self) -> str:
+        return f"Vector2({self.x:.4f}, {self.y:.4f})"
+
+
 def normalize_angle(angle: float) -> float:
     """Normalize angle to [-pi, pi] range."""
     while angle > math.pi:
@@ -151,6 +331,17 @@ def normalize_angle(angle: float) -> float:
     return angle
 
 
+def normalize_angles(angles: np.ndarray) -> np.ndarray:
+    """Normalize an array of angles to [-pi, pi] (vectorized normalize_angle)."""
+    two_pi = 2 * math.pi
+    angles = np.where(
+        angles > math.pi, angles - two_pi * np.ceil((angles - math.pi) / two_pi), angles
+    )
+    return np.where(
+        angles < -math.pi, angles + two_pi * np.ceil((-math.pi - angles) / two_pi), angles
+    )
+
+
 def angle_difference(a: float, b: float) -> float:
     """Calculate shortest angular difference between two angles."""
     diff = normalize_angle(a - b)
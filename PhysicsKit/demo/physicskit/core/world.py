@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Union
 
-from physicskit.core.integrators import IntegratorType, semi_implicit_euler
+import numpy as np
+
+from physicskit.core.integrators import IntegratorStats, IntegratorType
+from physicskit.core.telemetry import Telemetry, DEFAULT_CHANNELS, get_channel
+from physicskit.core.profiling import StageProfiler
+from physicskit.core.recorder import TelemetryRecorder
+from physicskit.core.schedule import InputSchedule, InputTable
 
 if TYPE_CHECKING:
     from physicskit.vehicle.car import Car
@@ -23,22 +29,135 @@ class World:
     time: float = 0.0
     gravity: float = 9.81  # m/s^2
     integrator: IntegratorType = IntegratorType.SEMI_IMPLICIT_EULER
+    integrator_options: dict = field(default_factory=dict)  # See Car.set_integrator
+    wheel_substeps: int = 1   # Wheel/tire sub-steps per dt (see Car.set_wheel_substeps)
 
     # Managed objects
     vehicles: list = field(default_factory=list)
 
+    # Stage timing shared by all vehicles (see enable_profiling)
+    profiler: Optional[StageProfiler] = None
+
+    # Streaming telemetry (see attach_recorder)
+    recorder: Optional[TelemetryRecorder] = None
+
     # Fixed timestep accumulator
     _accumulator: float = 0.0
     _max_steps_per_frame: int = 20  # Prevent spiral of death
 
+    def __post_init__(self):
+        for vehicle in self.vehicles:
+            vehicle.set_integrator(self.integrator, **self.integrator_options)
+            vehicle.set_wheel_substeps(self.wheel_substeps)
+
     def add_vehicle(self, vehicle: Car) -> None:
-        """Add a vehicle to the simulation."""
+        """Add a vehicle to the simulation (it takes the world's integrator)."""
+        if self._active_recorder() is not None:
+            raise ValueError("Cannot add vehicles while a recorder is attached")
+        vehicle.set_integrator(self.integrator, **self.integrator_options)
+        vehicle.set_wheel_substeps(self.wheel_substeps)
         self.vehicles.append(vehicle)
+        if self.profiler is not None:
+            vehicle.set_profiler(self.profiler, track=len(self.vehicles) - 1)
 
     def remove_vehicle(self, vehicle: Car) -> None:
         """Remove a vehicle from the simulation."""
+        if self._active_recorder() is not None:
+            raise ValueError("Cannot remove vehicles while a recorder is attached")
         if vehicle in self.vehicles:
             self.vehicles.remove(vehicle)
+            if self.profiler is not None:
+                vehicle.set_profiler(None)
+
+    def set_integrator(self, integrator: IntegratorType, **options) -> None:
+        """Change the integration method of the world and all its vehicles.
+
+        Args:
+            integrator: Integration method
+            **options: Tolerances for DORMAND_PRINCE (see Car.set_integrator)
+        """
+        self.integrator = IntegratorType(integrator)
+        self.integrator_options = options
+        for vehicle in self.vehicles:
+            vehicle.set_integrator(self.integrator, **options)
+
+    def set_wheel_substeps(self, substeps: int) -> None:
+        """Run the wheels and tires at dt / substeps under a chassis step of dt.
+
+        Args:
+            substeps: Wheel sub-steps per physics step (1 = single-rate)
+        """
+        if substeps < 1:
+            raise ValueError(f"substeps must be >= 1, got {substeps}")
+        self.wheel_substeps = int(substeps)
+        for vehicle in self.vehicles:
+            vehicle.set_wheel_substeps(self.wheel_substeps)
+
+    def get_integrator_stats(self) -> IntegratorStats:
+        """Steps taken and rejected, summed over all vehicles."""
+        total = IntegratorStats()
+        for vehicle in self.vehicles:
+            total.merge(vehicle.integrator_stats)
+        return total
+
+    def enable_profiling(self, trace: bool = False) -> StageProfiler:
+        """Time the stages of every vehicle's physics step.
+
+        Each vehicle gets its own trace row (its index in vehicles).
+
+        Args:
+            trace: Keep individual events for Chrome trace export
+
+        Returns:
+            The StageProfiler collecting the timings
+        """
+        self.profiler = StageProfiler(trace=trace)
+        for i, vehicle in enumerate(self.vehicles):
+            vehicle.set_profiler(self.profiler, track=i)
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Detach the profiler from all vehicles."""
+        for vehicle in self.vehicles:
+            vehicle.set_profiler(None)
+        self.profiler = None
+
+    def attach_recorder(self, recorder: TelemetryRecorder) -> TelemetryRecorder:
+        """Stream telemetry of every vehicle to disk while stepping.
+
+        The recorder's columns are fixed for the current vehicles; add all
+        vehicles before attaching.
+
+        Args:
+            recorder: A new, unopened TelemetryRecorder
+
+        Returns:
+            The attached recorder
+        """
+        if self._active_recorder() is not None:
+            raise ValueError("A recorder is already attached; detach it first")
+        recorder.open(self)
+        self.recorder = recorder
+        return recorder
+
+    def detach_recorder(self) -> Optional[TelemetryRecorder]:
+        """Stop recording and close the attached recorder.
+
+        Returns:
+            The detached recorder, or None if none was attached
+        """
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.close()
+            self.recorder = None
+        return recorder
+
+    def _active_recorder(self) -> Optional[TelemetryRecorder]:
+        """The attached recorder, detaching it first if it was closed."""
+        recorder = self.recorder
+        if recorder is not None and not recorder.is_open:
+            self.recorder = recorder = None
+        return recorder
 
     def step(self) -> None:
         """Advance simulation by one fixed timestep (dt)."""
@@ -48,6 +167,14 @@ class World:
 
         self.time += self.dt
 
+        recorder = self.recorder
+        if recorder is not None:
+            if recorder.is_open:
+                recorder.sample(self)
+            else:
+                # Closed by its own context manager while attached
+                self.recorder = None
+
     def step_fixed(self, real_dt: float) -> int:
         """Fixed timestep update with accumulator.
 
@@ -92,6 +219,92 @@ class World:
 
         return self.step_fixed(real_dt)
 
+    def run(
+        self,
+        n_steps: int,
+        inputs: Union[
+            InputSchedule, InputTable, np.ndarray, Callable[[float], Sequence[float]], None
+        ] = None,
+        channels: Sequence[str] = DEFAULT_CHANNELS,
+        decimation: int = 1
+    ) -> Telemetry:
+        """Run the simulation headless and record telemetry arrays.
+
+        Args:
+            n_steps: Number of fixed timesteps to advance
+            inputs: Control inputs as (throttle, brake, steer, handbrake).
+                    An InputSchedule (compiled for this run), an InputTable,
+                    an array of shape (n_steps, 4) applied to every vehicle,
+                    an array of shape (n_steps, n_vehicles, 4), or a callable
+                    taking the simulation time and returning one of those
+                    rows. None keeps the current inputs.
+            channels: Telemetry channel names (see core.telemetry.CHANNELS)
+            decimation: Record every decimation-th step
+
+        Returns:
+            Telemetry with n_steps // decimation records, taken after steps
+        """
+        if decimation < 1:
+            raise ValueError(f"decimation must be >= 1, got {decimation}")
+
+        if isinstance(inputs, InputSchedule):
+            inputs = inputs.compile(self.dt, n_steps, t0=self.time)
+        if isinstance(inputs, InputTable):
+            inputs = inputs.values
+
+        vehicles = self.vehicles
+        n_vehicles = len(vehicles)
+        input_rows: Optional[list] = None
+        input_fn: Optional[Callable[[float], Sequence[float]]] = None
+        if callable(inputs):
+            input_fn = inputs
+        elif inputs is not None:
+            input_table = np.asarray(inputs, dtype=float)
+            if input_table.shape not in ((n_steps, 4), (n_steps, n_vehicles, 4)):
+                raise ValueError(
+                    f"inputs must have shape ({n_steps}, 4) or "
+                    f"({n_steps}, {n_vehicles}, 4), got {input_table.shape}"
+                )
+            # Python floats are much faster to hand to set_inputs than numpy scalars
+            input_rows = input_table.tolist()
+
+        readers = [get_channel(name) for name in channels]
+        telemetry = Telemetry.allocate(
+            readers, n_steps // decimation, n_vehicles, self.dt, decimation
+        )
+        outputs = [(ch.read, telemetry.channels[ch.name]) for ch in readers]
+
+        record = 0
+        for step in range(n_steps):
+            if input_rows is not None:
+                self._apply_inputs(input_rows[step])
+            elif input_fn is not None:
+                self._apply_inputs(input_fn(self.time))
+
+            self.step()
+
+            if (step + 1) % decimation == 0:
+                telemetry.time[record] = self.time
+                for read, out in outputs:
+                    for v, vehicle in enumerate(vehicles):
+                        out[record, v] = read(vehicle)
+                record += 1
+
+        return telemetry
+
+    def _apply_inputs(self, row) -> None:
+        """Set inputs from one (throttle, brake, steer, handbrake) row.
+
+        A flat row applies to every vehicle; a nested row has one entry per vehicle.
+        """
+        if len(row) == 4 and not hasattr(row[0], "__len__"):
+            throttle, brake, steer, handbrake = row
+            for vehicle in self.vehicles:
+                vehicle.set_inputs(throttle, brake, steer, handbrake)
+        else:
+            for vehicle, (throttle, brake, steer, handbrake) in zip(self.vehicles, row):
+                vehicle.set_inputs(throttle, brake, steer, handbrake)
+
     def reset(self) -> None:
         """Reset simulation to initial state."""
         self.time = 0.0
@@ -0,0 +1,476 @@
+"""Parallel parameter sweeps over vehicle configurations.
+
+A sweep runs one headless scripted scenario per parameter point and
+collects summary metrics into a table. Points are CarConfig overrides
+keyed by field path; nested fields use dots:
+
+    {"lsd_preload": 150.0, "brake_bias": 0.6, "tire_config.friction_mu": 1.1}
+
+Points come from grid() (Cartesian product) or random_sample() (uniform
+in ranges), and the two can be crossed with combine(). run_sweep fans
+the points out over a ProcessPoolExecutor in chunks.
+
+Each result is cached on disk under a hash of the full resolved config and
+the run spec, so re-running a sweep (or a wider one) only simulates points
+that have not been run before.
+
+Metrics per point:
+    max_drift_angle     Largest |body slip angle| (deg)
+    max_drift_score     Peak DriftAnalyzer overall score (0-100)
+    mean_drift_score    Mean DriftAnalyzer score while drifting
+    drift_time          Time spent drifting (s)
+    distance            Distance travelled (m)
+    final_speed         Speed at the end of the run (m/s)
+    spun                1 if |drift angle| went past SPIN_ANGLE
+    stopped             1 if the car ended below STOP_SPEED
+    diverged            1 if the state became non-finite or absurd
+"""
+
+from __future__ import annotations
+import copy
+import csv
+import dataclasses
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from physicskit import __version__
+from physicskit.config.vehicle_presets import get_vehicle_config
+from physicskit.core.schedule import InputSchedule
+from physicskit.core.vector import Vector3
+from physicskit.core.world import World
+from physicskit.drift.metrics import DriftAnalyzer
+from physicskit.vehicle.car import Car, CarConfig
+
+
+# Bump when the simulation or metrics change in a way that invalidates cached results
+SWEEP_VERSION = 2
+
+SPIN_ANGLE = 90.0                  # deg
+STOP_SPEED = 1.0                   # m/s
+DIVERGED_SPEED = 150.0             # m/s
+
+METRICS = (
+    "max_drift_angle", "max_drift_score", "mean_drift_score", "drift_time",
+    "distance", "final_speed", "spun", "stopped", "diverged",
+)
+
+
+# Scripted input scenarios, compiled to per-step input arrays for each run
+SCENARIOS: dict[str, InputSchedule] = {
+    # The benchmark drift: turn in, handbrake flick, counter-steer
+    "drift_entry": (
+        InputSchedule()
+        .key("throttle", 0.0, 0.8)
+        .key("steer", 0.0, 0.6, interpolation="step").key("steer", 1.0, -0.4)
+        .key("handbrake", 0.0, 0.0, interpolation="step")
+        .key("handbrake", 0.8, 1.0).key("handbrake", 1.1, 0.0)
+    ),
+    # Full lock and steady throttle
+    "donut": InputSchedule().key("throttle", 0.0, 0.7).key("steer", 0.0, 1.0),
+    # Half throttle, then a half-lock step at 0.5 s
+    "step_steer": (
+        InputSchedule()
+        .key("throttle", 0.0, 0.5)
+        .key("steer", 0.0, 0.0, interpolation="step").key("steer", 0.5, 0.5)
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    """The run every sweep point is put through."""
+    scenario: str = "drift_entry"
+    duration: float = 4.0          # Simulated seconds
+    dt: float = 0.001
+    initial_speed: float = 20.0    # m/s
+    sample_every: int = 10         # Steps between DriftAnalyzer samples
+
+    def __post_init__(self):
+        if self.scenario not in SCENARIOS:
+            raise ValueError(
+                f"Unknown sweep scenario '{self.scenario}'. Available: {', '.join(SCENARIOS)}"
+            )
+
+
+@dataclass
+class SweepResult:
+    """Metrics of one sweep point."""
+    params: dict[str, Any]
+    metrics: dict[str, float]
+    key: str                       # Cache key (config and spec hash)
+    cached: bool = False
+
+    def row(self) -> dict[str, Any]:
+        """Flat table row: parameters then metrics."""
+        return {**self.params, **self.metrics}
+
+
+def _field_names(obj: Any) -> list[str]:
+    return [f.name for f in dataclasses.fields(obj)]
+
+
+def _coerce(current: Any, value: Any) -> Any:
+    """Convert a sweep value to the type of the field it replaces."""
+    if isinstance(current, Enum) and not isinstance(value, type(current)):
+        enum = type(current)
+        try:
+            return enum(value)
+        except ValueError:
+            return enum[str(value).upper()]
+    if isinstance(current, bool):
+        return bool(value)
+    if isinstance(current, float):
+        return float(value)
+    if isinstance(current, int):
+        return int(value)
+    return value
+
+
+def apply_params(config: CarConfig, params: Mapping[str, Any]) -> CarConfig:
+    """Copy of config with dotted field paths overridden.
+
+    Args:
+        config: Base configuration (not modified)
+        params: Field path -> value, e.g. {"tire_config.friction_mu": 1.1}
+
+    Returns:
+        New CarConfig
+
+    Raises:
+        ValueError: If a field path does not exist
+    """
+    config = copy.deepcopy(config)
+    for path, value in params.items():
+        *parents, name = path.split(".")
+        target = config
+        for part in parents:
+            if not dataclasses.is_dataclass(target) or part not in _field_names(target):
+                raise ValueError(
+                    f"Unknown config field '{path}'. Available: {', '.join(_field_names(target))}"
+                )
+            target = getattr(target, part)
+        if not dataclasses.is_dataclass(target) or name not in _field_names(target):
+            raise ValueError(
+                f"Unknown config field '{path}'. Available: {', '.join(_field_names(target))}"
+            )
+        setattr(target, name, _coerce(getattr(target, name), value))
+    return config
+
+
+def grid(axes: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Every combination of the axis values.
+
+    Args:
+        axes: Field path -> values
+
+    Returns:
+        Points, last axis varying fastest
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def random_sample(
+    ranges: Mapping[str, tuple[float, float]],
+    n: int,
+    seed: Optional[int] = None
+) -> list[dict[str, float]]:
+    """Points drawn uniformly from per-field ranges.
+
+    Args:
+        ranges: Field path -> (low, high)
+        n: Number of points
+        seed: Random seed for reproducible samples
+
+    Returns:
+        Points
+    """
+    rng = random.Random(seed)
+    return [{name: rng.uniform(lo, hi) for name, (lo, hi) in ranges.items()} for _ in range(n)]
+
+
+def combine(*point_sets: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Cross several point sets (e.g. a grid with a random sample)."""
+    points: list[dict[str, Any]] = [{}]
+    for point_set in point_sets:
+        if point_set:
+            points = [{**a, **b} for a in points for b in point_set]
+    return points
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.name
+    raise TypeError(f"Cannot hash {type(value).__name__} in a config")
+
+
+def config_key(config: CarConfig, spec: SweepSpec) -> str:
+    """Cache key for running a config with a spec."""
+    payload = json.dumps(
+        {
+            "version": [__version__, SWEEP_VERSION],
+            "config": dataclasses.asdict(config),
+            "spec": dataclasses.asdict(spec),
+        },
+        sort_keys=True, default=_jsonable
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def run_point(config: CarConfig, spec: SweepSpec) -> dict[str, float]:
+    """Run the spec's scenario for one configuration.
+
+    Returns:
+        Metrics by name (see METRICS)
+    """
+    world = World(dt=spec.dt)
+    car = Car(config)
+    car.set_velocity(spec.initial_speed)
+    world.add_vehicle(car)
+
+    n_steps = int(round(spec.duration / spec.dt))
+    telemetry = world.run(
+        n_steps, SCENARIOS[spec.scenario],
+        channels=("vx", "vy", "orientation", "yaw_rate", "speed", "drift_angle",
+                  "throttle", "steer"),
+        decimation=spec.sample_every
+    )
+
+    speed = telemetry["speed"][:, 0]
+    drift_angle = telemetry["drift_angle"][:, 0]
+    sample_dt = spec.dt * spec.sample_every
+
+    diverged = not (np.all(np.isfinite(speed)) and np.all(np.isfinite(drift_angle))) \
+        or bool(np.any(speed > DIVERGED_SPEED))
+    if diverged:
+        return {
+            "max_drift_angle": math.nan, "max_drift_score": 0.0, "mean_drift_score": 0.0,
+            "drift_time": 0.0, "distance": math.nan, "final_speed": math.nan,
+            "spun": 0.0, "stopped": 0.0, "diverged": 1.0,
+        }
+
+    analyzer = DriftAnalyzer()
+    max_steer_deg = math.degrees(config.max_steer_angle)
+    velocity = Vector3()
+    scores = []
+    drift_samples = 0
+    for i in range(len(telemetry)):
+        velocity.set(telemetry["vx"][i, 0], telemetry["vy"][i, 0])
+        metrics = analyzer.update(
+            velocity=velocity,
+            orientation=float(telemetry["orientation"][i, 0]),
+            steer_angle_deg=float(telemetry["steer"][i, 0]) * max_steer_deg,
+            throttle=float(telemetry["throttle"][i, 0]),
+            yaw_rate=float(telemetry["yaw_rate"][i, 0]),
+            speed=float(speed[i]),
+            dt=sample_dt,
+            sim_time=float(telemetry.time[i])
+        )
+        if metrics.is_drifting:
+            drift_samples += 1
+            scores.append(metrics.overall_score)
+
+    max_drift_angle = float(np.max(np.abs(drift_angle))) if len(drift_angle) else 0.0
+    return {
+        "max_drift_angle": max_drift_angle,
+        "max_drift_score": max(scores, default=0.0),
+        "mean_drift_score": sum(scores) / len(scores) if scores else 0.0,
+        "drift_time": drift_samples * sample_dt,
+        "distance": float(np.sum(speed)) * sample_dt,
+        "final_speed": float(speed[-1]) if len(speed) else spec.initial_speed,
+        "spun": float(max_drift_angle > SPIN_ANGLE),
+        "stopped": float(len(speed) > 0 and speed[-1] < STOP_SPEED),
+        "diverged": 0.0,
+    }
+
+
+def _run_task(task: tuple[CarConfig, SweepSpec]) -> dict[str, float]:
+    """Worker entry point (top level so it pickles)."""
+    config, spec = task
+    return run_point(config, spec)
+
+
+def _cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, f"{key}.json")
+
+
+def _load_cached(cache_dir: Optional[str], key: str) -> Optional[dict[str, float]]:
+    if cache_dir is None:
+        return None
+    try:
+        with open(_cache_path(cache_dir, key)) as f:
+            metrics: dict[str, float] = json.load(f)["metrics"]
+        return metrics
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _store_cached(cache_dir: str, key: str, params: dict, metrics: dict) -> None:
+    path = _cache_path(cache_dir, key)
+    temp = path + ".tmp"
+    with open(temp, "w") as f:
+        json.dump({"params": params, "metrics": metrics}, f, default=_jsonable)
+    os.replace(temp, path)
+
+
+def run_sweep(
+    points: Iterable[Mapping[str, Any]],
+    base: str = "drift_car",
+    spec: SweepSpec = SweepSpec(),
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    progress: Optional[Callable[[SweepResult], None]] = None
+) -> list[SweepResult]:
+    """Run a scenario for every parameter point.
+
+    Args:
+        points: CarConfig overrides (see apply_params)
+        base: Vehicle preset the overrides apply to (see VEHICLE_PRESETS)
+        spec: Scenario and run settings
+        workers: Worker processes. None = os.cpu_count(); 1 runs in-process.
+        chunksize: Points per task sent to a worker. Defaults to splitting
+                   the uncached points into ~4 chunks per worker.
+        cache_dir: Directory for cached results. None disables caching.
+        progress: Called with each result as it completes (cached first)
+
+    Returns:
+        One SweepResult per point, in input order
+    """
+    base_config = get_vehicle_config(base)
+    params = [dict(p) for p in points]
+    configs = [apply_params(base_config, p) for p in params]  # Validates paths up front
+    keys = [config_key(config, spec) for config in configs]
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    results: dict[int, SweepResult] = {}
+    todo = []
+    for i, key in enumerate(keys):
+        metrics = _load_cached(cache_dir, key)
+        if metrics is not None:
+            result = results[i] = SweepResult(params[i], metrics, key, cached=True)
+            if progress is not None:
+                progress(result)
+        else:
+            todo.append(i)
+
+    def finish(i: int, metrics: dict[str, float]) -> None:
+        result = results[i] = SweepResult(params[i], metrics, keys[i])
+        if cache_dir is not None:
+            _store_cached(cache_dir, keys[i], params[i], metrics)
+        if progress is not None:
+            progress(result)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(todo) <= 1:
+        for i in todo:
+            finish(i, run_point(configs[i], spec))
+    else:
+        if chunksize is None:
+            chunksize = max(1, len(todo) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tasks = ((configs[i], spec) for i in todo)
+            for i, metrics in zip(todo, pool.map(_run_task, tasks, chunksize=chunksize)):
+                finish(i, metrics)
+
+    return [results[i] for i in range(len(params))]
+
+
+def _columns(results: Sequence[SweepResult]) -> list[str]:
+    columns = []
+    for result in results:
+        for name in result.params:
+            if name not in columns:
+                columns.append(name)
+    return columns + list(METRICS)
+
+
+def sort_results(results: Sequence[SweepResult], by: str, descending: bool = True) -> list[SweepResult]:
+    """Results ordered by a metric or parameter (NaN last)."""
+    def key(result: SweepResult) -> float:
+        value = result.row().get(by, math.nan)
+        if isinstance(value, (int, float)) and not math.isnan(value):
+            return -value if descending else value
+        return math.inf
+    return sorted(results, key=key)
+
+
+def format_table(results: Sequence[SweepResult]) -> str:
+    """Results as an aligned text table."""
+    columns = _columns(results)
+    widths = [max(len(c), 9) for c in columns]
+    lines = ["  ".join(f"{c:>{w}}" for c, w in zip(columns, widths))]
+    for result in results:
+        row = result.row()
+        cells = []
+        for column, width in zip(columns, widths):
+            value = row.get(column, "")
+            if isinstance(value, float):
+                cells.append(f"{value:>{width}.4g}")
+            elif isinstance(value, Enum):
+                cells.append(f"{value.name:>{width}}")
+            else:
+                cells.append(f"{value!s:>{width}}")
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
+
+
+def save_csv(results: Sequence[SweepResult], path: str) -> None:
+    """Write results as CSV (one row per point, parameters then metrics)."""
+    columns = _columns(results)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns + ["key"])
+        writer.writeheader()
+        for result in results:
+            row = {k: (v.name if isinstance(v, Enum) else v) for k, v in result.row().items()}
+            writer.writerow({**row, "key": result.key})
+
+
+def parse_axis(text: str) -> tuple[str, list[Any]]:
+    """Parse a grid axis: "name=v1,v2,..." or "name=low:high:count".
+
+    Raises:
+        ValueError: If the text is malformed
+    """
+    name, sep, values = text.partition("=")
+    if not sep or not name or not values:
+        raise ValueError(f"Expected name=v1,v2,... or name=low:high:count, got '{text}'")
+    if ":" in values:
+        parts = values.split(":")
+        if len(parts) != 3:
+            raise ValueError(f"Expected name=low:high:count, got '{text}'")
+        low, high, count = float(parts[0]), float(parts[1]), int(parts[2])
+        return name, [float(v) for v in np.linspace(low, high, count)]
+    return name, [_parse_value(v) for v in values.split(",")]
+
+
+def parse_range(text: str) -> tuple[str, tuple[float, float]]:
+    """Parse a random-sample range: "name=low:high".
+
+    Raises:
+        ValueError: If the text is malformed
+    """
+    name, sep, values = text.partition("=")
+    parts = values.split(":")
+    if not sep or not name or len(parts) != 2:
+        raise ValueError(f"Expected name=low:high, got '{text}'")
+    return name, (float(parts[0]), float(parts[1]))
+
+
+def _parse_value(text: str) -> Any:
+    try:
+        return float(text)
+    except ValueError:
+        return text            # Enum name or value, converted by apply_params
@@ -1,17 +1,28 @@
 """Tire physics with Pacejka Magic Formula."""
 
-from physicskit.tire.pacejka import PacejkaParams, PacejkaFormula
-from physicskit.tire.slip import SlipCalculator
+from physicskit.tire.pacejka import PacejkaParams, PacejkaFormula, MagicFormulaCoefficients
+from physicskit.tire.tabulated import TabulatedPacejka
+from physicskit.tire.slip import SlipCalculator, SlipState, SlipBatch
 from physicskit.tire.combined import CombinedSlip
-from physicskit.tire.relaxation import TireRelaxation
-from physicskit.tire.tire import Tire, TireState
+from physicskit.tire.relaxation import TireRelaxation, AdaptiveRelaxation, RelaxationDecay
+from physicskit.tire.registry import TireModelRegistry, SharedTireModel
+from physicskit.tire.tire import Tire, TireState, TireStateView
 
 __all__ = [
     "PacejkaParams",
     "PacejkaFormula",
+    "MagicFormulaCoefficients",
+    "TabulatedPacejka",
     "SlipCalculator",
+    "SlipState",
+    "SlipBatch",
     "CombinedSlip",
     "TireRelaxation",
+    "AdaptiveRelaxation",
+    "RelaxationDecay",
+    "TireModelRegistry",
+    "SharedTireModel",
     "Tire",
     "TireState",
+    "TireStateView",
 ]
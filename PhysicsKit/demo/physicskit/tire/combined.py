@@ -18,7 +18,7 @@ from typing import Tuple, Optional
 from physicskit.tire.pacejka import PacejkaFormula, PacejkaParams
 
 
-@dataclass
+@dataclass(slots=True)
 class CombinedForces:
     """Result of combined slip force calculation."""
     Fx: float = 0.0          # Longitudinal force (N)
@@ -28,6 +28,25 @@ class CombinedForces:
     saturation: float = 0.0  # How close to friction limit (0-1)
 
 
+def _store(
+    out: Optional[CombinedForces],
+    Fx: float,
+    Fy: float,
+    Fx_pure: float,
+    Fy_pure: float,
+    saturation: float
+) -> CombinedForces:
+    """Write a result into out, or allocate a new CombinedForces if out is None."""
+    if out is None:
+        return CombinedForces(Fx, Fy, Fx_pure, Fy_pure, saturation)
+    out.Fx = Fx
+    out.Fy = Fy
+    out.Fx_pure = Fx_pure
+    out.Fy_pure = Fy_pure
+    out.saturation = saturation
+    return out
+
+
 class CombinedSlip:
     """Handle combined longitudinal and lateral tire slip.
 
@@ -37,6 +56,9 @@ class CombinedSlip:
     3. More accurate Pacejka-style combined slip formulas
     """
 
+    # Attributes that become read-only after freeze()
+    _FROZEN_ATTRIBUTES = frozenset({"pacejka", "friction_mu", "ellipse_ratio", "_frozen"})
+
     def __init__(
         self,
         pacejka: Optional[PacejkaFormula] = None,
@@ -51,16 +73,35 @@ class CombinedSlip:
             ellipse_ratio: Ratio of Fy_max / Fx_max for friction ellipse.
                           1.0 = circle, <1 = more longitudinal, >1 = more lateral
         """
+        self._frozen = False
         self.pacejka = pacejka or PacejkaFormula()
         self.friction_mu = friction_mu
         self.ellipse_ratio = ellipse_ratio
 
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in self._FROZEN_ATTRIBUTES and self.__dict__.get("_frozen", False):
+            raise AttributeError(
+                f"Cannot assign '{name}': this model is shared between tires. "
+                "Build the tire from a TireConfig with the new parameters instead."
+            )
+        object.__setattr__(self, name, value)
+
+    def freeze(self) -> None:
+        """Make friction, ellipse ratio and the Pacejka model read-only.
+
+        Called by TireModelRegistry on models it shares (see
+        PacejkaFormula.freeze).
+        """
+        self.pacejka.freeze()
+        self._frozen = True
+
     def combined_forces_simple(
         self,
         slip_ratio: float,
         slip_angle: float,
         Fz: float,
-        camber: float = 0.0
+        camber: float = 0.0,
+        out: Optional[CombinedForces] = None
     ) -> CombinedForces:
         """Calculate combined forces using simple friction ellipse.
 
@@ -76,6 +117,7 @@ class CombinedSlip:
             slip_angle: Lateral slip angle (degrees if pacejka configured so)
             Fz: Vertical load (N)
             camber: Camber angle (degrees)
+            out: Result to write into instead of allocating one
 
         Returns:
             CombinedForces with scaled Fx and Fy
@@ -93,7 +135,7 @@ class CombinedSlip:
 
         # Check if we're within the friction ellipse
         if Fx_peak < 1 or Fy_peak < 1:
-            return CombinedForces(0, 0, Fx_pure, Fy_pure, 0)
+            return _store(out, 0, 0, Fx_pure, Fy_pure, 0)
 
         # Normalized position in friction space
         fx_norm = Fx_pure / Fx_peak if Fx_peak > 0 else 0
@@ -104,7 +146,8 @@ class CombinedSlip:
 
         if saturation <= 1.0:
             # Within ellipse, no scaling needed
-            return CombinedForces(
+            return _store(
+                out,
                 Fx=Fx_pure,
                 Fy=Fy_pure,
                 Fx_pure=Fx_pure,
@@ -114,7 +157,8 @@ class CombinedSlip:
 
         # Outside ellipse, scale back to boundary
         scale = 1.0 / saturation
-        return CombinedForces(
+        return _store(
+            out,
             Fx=Fx_pure * scale,
             Fy=Fy_pure * scale,
             Fx_pure=Fx_pure,
@@ -127,7 +171,8 @@ class CombinedSlip:
         slip_ratio: float,
         slip_angle_rad: float,
         Fz: float,
-        camber: float = 0.0
+        camber: float = 0.0,
+        out: Optional[CombinedForces] = None
     ) -> CombinedForces:
         """Calculate combined forces using vector slip method.
 
@@ -141,6 +186,7 @@ class CombinedSlip:
             slip_angle_rad: Lateral slip angle in RADIANS
             Fz: Vertical load (N)
             camber: Camber angle (degrees)
+            out: Result to write into instead of allocating one
 
         Returns:
             CombinedForces
@@ -160,7 +206,7 @@ class CombinedSlip:
         sigma = math.sqrt(slip_ratio * slip_ratio + tan_alpha * tan_alpha)
 
         if sigma < epsilon:
-            return CombinedForces(0, 0, Fx_pure, Fy_pure, 0)
+            return _store(out, 0, 0, Fx_pure, Fy_pure, 0)
 
         # Use lateral force curve with combined slip magnitude
         # This is a simplification - could use a dedicated combined curve
@@ -182,7 +228,8 @@ class CombinedSlip:
 
         saturation = math.sqrt(Fx**2 + Fy**2) / F_peak if F_peak > 0 else 0
 
-        return CombinedForces(
+        return _store(
+            out,
             Fx=Fx,
             Fy=Fy,
             Fx_pure=Fx_pure,
@@ -195,7 +242,8 @@ class CombinedSlip:
         slip_ratio: float,
         slip_angle_deg: float,
         Fz: float,
-        camber: float = 0.0
+        camber: float = 0.0,
+        out: Optional[CombinedForces] = None
     ) -> CombinedForces:
         """Calculate combined forces using empirical weighting.
 
@@ -209,6 +257,7 @@ class CombinedSlip:
             slip_angle_deg: Lateral slip angle in degrees
             Fz: Vertical load (N)
             camber: Camber angle (degrees)
+            out: Result to write into instead of allocating one
 
         Returns:
             CombinedForces
@@ -224,7 +273,7 @@ class CombinedSlip:
         Fy_peak *= self.friction_mu
 
         if Fx_peak < 1 or Fy_peak < 1:
-            return CombinedForces(0, 0, Fx_pure, Fy_pure, 0)
+            return _store(out, 0, 0, Fx_pure, Fy_pure, 0)
 
         # Normalized forces
         fx_norm = abs(Fx_pure) / Fx_peak
@@ -232,7 +281,7 @@ class CombinedSlip:
 
         # Use cosine weighting based on the "angle" in normalized force space
         if fx_norm + fy_norm < 0.001:
-            return CombinedForces(0, 0, Fx_pure, Fy_pure, 0)
+            return _store(out, 0, 0, Fx_pure, Fy_pure, 0)
 
         force_angle = math.atan2(fy_norm, fx_norm)
 
@@ -258,7 +307,8 @@ class CombinedSlip:
             Fy *= scale
             saturation = 1.0
 
-        return CombinedForces(
+        return _store(
+            out,
             Fx=Fx,
             Fy=Fy,
             Fx_pure=Fx_pure,
@@ -272,7 +322,8 @@ class CombinedSlip:
         slip_angle_deg: float,
         Fz: float,
         camber: float = 0.0,
-        method: str = "empirical"
+        method: str = "empirical",
+        out: Optional[CombinedForces] = None
     ) -> CombinedForces:
         """Calculate combined slip forces using specified method.
 
@@ -282,18 +333,19 @@ class CombinedSlip:
             Fz: Vertical load (N)
             camber: Camber angle (degrees)
             method: "simple", "vector", or "empirical"
+            out: Result to write into instead of allocating one
 
         Returns:
             CombinedForces
         """
         if method == "simple":
-            return self.combined_forces_simple(slip_ratio, slip_angle_deg, Fz, camber)
+            return self.combined_forces_simple(slip_ratio, slip_angle_deg, Fz, camber, out)
         elif method == "vector":
             return self.combined_forces_vector(
-                slip_ratio, math.radians(slip_angle_deg), Fz, camber
+                slip_ratio, math.radians(slip_angle_deg), Fz, camber, out
             )
         else:  # empirical (default)
-            return self.combined_forces_empirical(slip_ratio, slip_angle_deg, Fz, camber)
+            return self.combined_forces_empirical(slip_ratio, slip_angle_deg, Fz, camber, out)
 
 
 def friction_ellipse_limit(
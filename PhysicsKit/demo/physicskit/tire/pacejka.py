@@ -21,11 +21,14 @@ References:
 
 from __future__ import annotations
 import math
-from dataclasses import dataclass, field
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, dataclass, field, replace
+from typing import Any, Callable, Hashable, Optional
 
 import numpy as np
 
+from physicskit.tire.slip import ArrayLike
+
 
 @dataclass
 class PacejkaParams:
@@ -79,6 +82,24 @@ class PacejkaParams:
     nominal_load: float = 4000.0  # Reference vertical load (N)
     slip_angle_in_degrees: bool = True  # If True, slip angle inputs are in degrees
 
+    # Bumped on every assignment, so formulas can tell that cached
+    # results were computed from older coefficients (not a dataclass field)
+    _version = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get("_frozen", False):
+            raise FrozenInstanceError(
+                f"Cannot assign '{name}': these PacejkaParams belong to a shared tire model"
+            )
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_version", self._version + 1)
+
+    def frozen(self) -> PacejkaParams:
+        """Read-only copy of these parameters; assigning a field raises FrozenInstanceError."""
+        params = replace(self)
+        object.__setattr__(params, "_frozen", True)
+        return params
+
     @classmethod
     def sport_tire(cls) -> PacejkaParams:
         """Parameters for a typical sport tire with high grip."""
@@ -128,21 +149,253 @@ class PacejkaParams:
         )
 
 
+@dataclass(slots=True)
+class MagicFormulaCoefficients:
+    """Magic Formula coefficients for one (load, camber) operating point.
+
+    Computing these involves several transcendental functions, so they
+    are computed once per load and reused for every slip evaluation at
+    that load. E_neg is the curvature factor for negative slip (the
+    lateral formula's curvature depends on slip sign).
+    """
+    B: float = 0.0
+    C: float = 0.0
+    D: float = 0.0
+    E: float = 0.0
+    Sh: float = 0.0
+    Sv: float = 0.0
+    E_neg: float = 0.0
+
+    def evaluate(self, x: float) -> float:
+        """Evaluate the Magic Formula at slip x (degrees for lateral slip)."""
+        E = self.E if math.copysign(1.0, x) > 0 else self.E_neg
+        Bx1 = self.B * (x + self.Sh)
+        return self.D * math.sin(self.C * math.atan(Bx1 - E * (Bx1 - math.atan(Bx1)))) + self.Sv
+
+
+# Coefficients that make the Magic Formula evaluate to exactly zero (no load)
+_ZERO_COEFFICIENTS = MagicFormulaCoefficients()
+
+# Same result as round() for the float quotients used as cache keys, without
+# allocating a bound __round__ method on every call
+_round = float.__round__
+
+
+@dataclass
+class CacheInfo:
+    """Usage statistics for an LRUCache."""
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    maxsize: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                    used entry is evicted.
+        """
+        self.maxsize = max(1, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Look up a key, marking it as most recently used.
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert a value, evicting the oldest entry if full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get cache usage statistics."""
+        return CacheInfo(self.hits, self.misses, len(self._data), self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CoefficientMemo:
+    """Small first-in-first-out memo for per-load coefficient sets.
+
+    Cheaper than LRUCache on misses, which matters because loads change
+    every step and most lookups within a step are for the same few loads.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        """Initialize memo.
+
+        Args:
+            maxsize: Maximum number of entries before the oldest is dropped
+        """
+        self.maxsize = max(1, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._data: dict = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Look up a key. Returns None on a miss."""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert a value, dropping the oldest entry if full."""
+        data = self._data
+        if len(data) >= self.maxsize:
+            del data[next(iter(data))]
+        data[key] = value
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Get memo usage statistics."""
+        return CacheInfo(self.hits, self.misses, len(self._data), self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class PacejkaFormula:
     """Pacejka Magic Formula tire force calculator.
 
     Computes longitudinal (Fx) and lateral (Fy) tire forces given
     slip conditions and vertical load.
+
+    Peak force lookups are cached on quantized (load, camber) keys, since
+    the combined slip model asks for them on every tire every step.
+    Coefficient sets are memoized on exact (load, camber) in a small
+    cache, so repeated evaluations at the same load within a step share
+    one coefficient computation.
     """
 
-    def __init__(self, params: Optional[PacejkaParams] = None):
+    # Slip windows searched for peak forces (slip angle in input units)
+    LATERAL_PEAK_RANGE: tuple[float, float] = (0.0, 20.0)
+    LONGITUDINAL_PEAK_RANGE: tuple[float, float] = (0.0, 0.5)
+
+    # Largest load held in the dense batch peak tables (N); several times
+    # any realistic wheel load. Higher loads go through the LRU peak cache.
+    DENSE_PEAK_MAX_LOAD: float = 50000.0
+
+    def __init__(
+        self,
+        params: Optional[PacejkaParams] = None,
+        peak_cache_size: int = 1024,
+        load_quantum: float = 10.0,
+        camber_quantum: float = 0.01,
+        coefficient_cache_size: int = 16
+    ):
         """Initialize with Pacejka coefficients.
 
         Args:
             params: Pacejka coefficients. Defaults to sport tire if None.
+            peak_cache_size: Maximum number of cached peak force entries
+            load_quantum: Load resolution of the peak cache (N)
+            camber_quantum: Camber resolution of the peak cache (degrees)
+            coefficient_cache_size: Number of memoized coefficient sets
         """
+        self.load_quantum = load_quantum
+        self.camber_quantum = camber_quantum
+        self._peak_cache = LRUCache(peak_cache_size)
+        self._coefficient_cache = CoefficientMemo(coefficient_cache_size)
+        self._peak_tables: dict[str, np.ndarray] = {}
+        self._frozen = False
         self.params = params or PacejkaParams.sport_tire()
 
+    @property
+    def params(self) -> PacejkaParams:
+        """Pacejka coefficients.
+
+        Assigning new params, or editing a field of params in place,
+        invalidates the caches.
+        """
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+        return self._params
+
+    @params.setter
+    def params(self, value: PacejkaParams) -> None:
+        if self._frozen:
+            raise AttributeError(
+                "Cannot assign params: this model is shared between tires. "
+                "Build the tire from a TireConfig with the new parameters instead."
+            )
+        self._params = value
+        self.invalidate_cache()
+
+    def freeze(self) -> None:
+        """Make the coefficients read-only.
+
+        Called by TireModelRegistry on models it shares, so changing one
+        tire cannot silently change every other tire with the same
+        configuration. params becomes a frozen copy; the caches keep
+        working.
+        """
+        self._params = self._params.frozen()
+        self._params_version = self._params._version
+        self._frozen = True
+
+    @property
+    def is_frozen(self) -> bool:
+        """True once freeze() has been called."""
+        return self._frozen
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached results.
+
+        Called automatically when params is reassigned or edited in place.
+        """
+        self._params_version = self._params._version
+        self._peak_cache.clear()
+        self._coefficient_cache.clear()
+        self._peak_tables.clear()
+
+    def peak_cache_info(self) -> CacheInfo:
+        """Get peak force cache statistics."""
+        return self._peak_cache.info()
+
+    def coefficient_cache_info(self) -> CacheInfo:
+        """Get coefficient cache statistics."""
+        return self._coefficient_cache.info()
+
     @staticmethod
     def magic_formula(x: float, B: float, C: float, D: float, E: float,
                       Sh: float = 0.0, Sv: float = 0.0) -> float:
@@ -166,19 +419,24 @@ class PacejkaFormula:
         Bx1 = B * x1
         return D * math.sin(C * math.atan(Bx1 - E * (Bx1 - math.atan(Bx1)))) + Sv
 
-    def longitudinal_force(self, slip_ratio: float, Fz: float) -> float:
-        """Calculate longitudinal force (Fx) from slip ratio.
+    def longitudinal_coefficients(self, Fz: float) -> MagicFormulaCoefficients:
+        """Get Magic Formula coefficients for longitudinal force at a load.
 
         Args:
-            slip_ratio: Longitudinal slip ratio, typically [-1, 1]
-                       Negative = braking, Positive = acceleration
             Fz: Vertical load in Newtons
 
         Returns:
-            Longitudinal force in Newtons (positive = forward thrust)
+            MagicFormulaCoefficients (memoized per load)
         """
         if Fz <= 0:
-            return 0.0
+            return _ZERO_COEFFICIENTS
+
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+        key = Fz
+        coeffs: Optional[MagicFormulaCoefficients] = self._coefficient_cache.get(key)
+        if coeffs is not None:
+            return coeffs
 
         p = self.params
         Fz_kN = Fz / 1000.0  # Convert to kN for coefficient scaling
@@ -198,29 +456,33 @@ class PacejkaFormula:
         Sh = p.b9 * Fz_kN + p.b10
         Sv = p.b11 * Fz_kN + p.b12
 
-        return self.magic_formula(slip_ratio, B, C, D, E, Sh, Sv)
+        coeffs = MagicFormulaCoefficients(B, C, D, E, Sh, Sv, E)
+        self._coefficient_cache.put(key, coeffs)
+        return coeffs
 
-    def lateral_force(self, slip_angle: float, Fz: float, camber: float = 0.0) -> float:
-        """Calculate lateral force (Fy) from slip angle.
+    def lateral_coefficients(self, Fz: float, camber: float = 0.0) -> MagicFormulaCoefficients:
+        """Get Magic Formula coefficients for lateral force at a load and camber.
+
+        The returned coefficients evaluate slip angles in degrees.
 
         Args:
-            slip_angle: Slip angle. In degrees if params.slip_angle_in_degrees,
-                       otherwise radians.
             Fz: Vertical load in Newtons
-            camber: Camber angle in degrees (optional)
+            camber: Camber angle in degrees
 
         Returns:
-            Lateral force in Newtons (positive = force to the right)
+            MagicFormulaCoefficients (memoized per load and camber)
         """
         if Fz <= 0:
-            return 0.0
-
-        p = self.params
+            return _ZERO_COEFFICIENTS
 
-        # Convert to degrees if needed (formula expects degrees)
-        if not p.slip_angle_in_degrees:
-            slip_angle = math.degrees(slip_angle)
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+        key = (Fz, camber)
+        coeffs: Optional[MagicFormulaCoefficients] = self._coefficient_cache.get(key)
+        if coeffs is not None:
+            return coeffs
 
+        p = self.params
         Fz_kN = Fz / 1000.0  # Convert to kN
 
         # Peak factor D with camber influence
@@ -233,8 +495,11 @@ class PacejkaFormula:
         BCD = p.a3 * math.sin(2 * math.atan(Fz_kN / p.a4)) * (1 - p.a5 * abs(camber))
         B = BCD / (C * D) if abs(C * D) > 1e-6 else 0.0
 
-        # Curvature factor with camber
-        E = (p.a6 * Fz_kN + p.a7) * (1 - (p.a16 * camber + p.a17) * math.copysign(1, slip_angle))
+        # Curvature factor with camber, for positive and negative slip
+        E_base = p.a6 * Fz_kN + p.a7
+        E_camber = p.a16 * camber + p.a17
+        E_pos = E_base * (1 - E_camber * 1.0)
+        E_neg = E_base * (1 - E_camber * -1.0)
 
         # Horizontal shift with load and camber
         Sh = p.a8 * Fz_kN + p.a9 + p.a10 * camber
@@ -242,11 +507,187 @@ class PacejkaFormula:
         # Vertical shift with load and camber
         Sv = (p.a11 * Fz_kN + p.a12) + (p.a13 * Fz_kN + p.a14) * camber * Fz_kN
 
-        return self.magic_formula(slip_angle, B, C, D, E, Sh, Sv)
+        coeffs = MagicFormulaCoefficients(B, C, D, E_pos, Sh, Sv, E_neg)
+        self._coefficient_cache.put(key, coeffs)
+        return coeffs
+
+    def longitudinal_force(self, slip_ratio: float, Fz: float) -> float:
+        """Calculate longitudinal force (Fx) from slip ratio.
+
+        Args:
+            slip_ratio: Longitudinal slip ratio, typically [-1, 1]
+                       Negative = braking, Positive = acceleration
+            Fz: Vertical load in Newtons
+
+        Returns:
+            Longitudinal force in Newtons (positive = forward thrust)
+        """
+        if Fz <= 0:
+            return 0.0
+
+        return self.longitudinal_coefficients(Fz).evaluate(slip_ratio)
+
+    def longitudinal_slip_stiffness(self, slip_ratio: float, Fz: float) -> float:
+        """Slope dFx/d(slip ratio) of the longitudinal force.
+
+        Args:
+            slip_ratio: Longitudinal slip ratio
+            Fz: Vertical load in Newtons
+
+        Returns:
+            Local slip stiffness in N per unit slip ratio (negative past the peak)
+        """
+        if Fz <= 0:
+            return 0.0
+
+        c = self.longitudinal_coefficients(Fz)
+        return _magic_formula_slope(slip_ratio, c.B, c.C, c.D, c.E, c.Sh)
+
+    def lateral_force(self, slip_angle: float, Fz: float, camber: float = 0.0) -> float:
+        """Calculate lateral force (Fy) from slip angle.
+
+        Args:
+            slip_angle: Slip angle. In degrees if params.slip_angle_in_degrees,
+                       otherwise radians.
+            Fz: Vertical load in Newtons
+            camber: Camber angle in degrees (optional)
+
+        Returns:
+            Lateral force in Newtons (positive = force to the right)
+        """
+        if Fz <= 0:
+            return 0.0
+
+        # Convert to degrees if needed (formula expects degrees)
+        if not self.params.slip_angle_in_degrees:
+            slip_angle = math.degrees(slip_angle)
+
+        return self.lateral_coefficients(Fz, camber).evaluate(slip_angle)
+
+    @staticmethod
+    def magic_formula_batch(x: np.ndarray, B, C, D, E, Sh=0.0, Sv=0.0) -> np.ndarray:
+        """Vectorized Magic Formula; all arguments broadcast against each other."""
+        x1 = x + Sh
+        Bx1 = B * x1
+        forces: np.ndarray = D * np.sin(C * np.arctan(Bx1 - E * (Bx1 - np.arctan(Bx1)))) + Sv
+        return forces
+
+    def longitudinal_force_batch(self, slip_ratio: ArrayLike, Fz: ArrayLike) -> np.ndarray:
+        """Calculate longitudinal force for arrays of slip ratios and loads.
+
+        Broadcasting equivalent of longitudinal_force.
+
+        Args:
+            slip_ratio: Longitudinal slip ratios
+            Fz: Vertical loads in Newtons
+
+        Returns:
+            Array of longitudinal forces in Newtons
+        """
+        slip_ratio, Fz = np.broadcast_arrays(
+            np.asarray(slip_ratio, dtype=float), np.asarray(Fz, dtype=float)
+        )
+        B, C, D, E, Sh, Sv = self._longitudinal_coefficients_batch(Fz)
+        forces = self.magic_formula_batch(slip_ratio, B, C, D, E, Sh, Sv)
+        return np.where(Fz > 0, forces, 0.0)
+
+    def longitudinal_slip_stiffness_batch(
+        self,
+        slip_ratio: ArrayLike,
+        Fz: ArrayLike
+    ) -> np.ndarray:
+        """Slope dFx/d(slip ratio) for arrays of slip ratios and loads.
+
+        Broadcasting equivalent of longitudinal_slip_stiffness.
+
+        Args:
+            slip_ratio: Longitudinal slip ratios
+            Fz: Vertical loads in Newtons
+
+        Returns:
+            Array of slip stiffnesses in N per unit slip ratio
+        """
+        slip_ratio, Fz = np.broadcast_arrays(
+            np.asarray(slip_ratio, dtype=float), np.asarray(Fz, dtype=float)
+        )
+        B, C, D, E, Sh, _ = self._longitudinal_coefficients_batch(Fz)
+        Bx1 = B * (slip_ratio + Sh)
+        phi = Bx1 - E * (Bx1 - np.arctan(Bx1))
+        dphi = (1.0 - E) + E / (1.0 + Bx1 * Bx1)
+        slope = D * np.cos(C * np.arctan(phi)) * C / (1.0 + phi * phi) * dphi * B
+        return np.where(Fz > 0, slope, 0.0)
+
+    def _longitudinal_coefficients_batch(self, Fz: np.ndarray) -> tuple:
+        """(B, C, D, E, Sh, Sv) for an array of loads (see longitudinal_coefficients)."""
+        p = self.params
+        Fz_kN = Fz / 1000.0
+
+        C = p.b0
+        D = Fz * (p.b1 * Fz_kN + p.b2) / 1000.0
+
+        BCD = (p.b3 * Fz_kN * Fz_kN + p.b4 * Fz_kN) * np.exp(-p.b5 * Fz_kN)
+        CD = C * D
+        B = np.divide(BCD, CD, out=np.zeros_like(CD), where=np.abs(CD) > 1e-6)
+
+        E = (p.b6 * Fz_kN * Fz_kN + p.b7 * Fz_kN + p.b8)
+
+        Sh = p.b9 * Fz_kN + p.b10
+        Sv = p.b11 * Fz_kN + p.b12
+        return B, C, D, E, Sh, Sv
+
+    def lateral_force_batch(
+        self,
+        slip_angle: ArrayLike,
+        Fz: ArrayLike,
+        camber: ArrayLike = 0.0
+    ) -> np.ndarray:
+        """Calculate lateral force for arrays of slip angles, loads and cambers.
+
+        Broadcasting equivalent of lateral_force.
+
+        Args:
+            slip_angle: Slip angles (degrees if params.slip_angle_in_degrees)
+            Fz: Vertical loads in Newtons
+            camber: Camber angles in degrees
+
+        Returns:
+            Array of lateral forces in Newtons
+        """
+        slip_angle, Fz, camber = np.broadcast_arrays(
+            np.asarray(slip_angle, dtype=float),
+            np.asarray(Fz, dtype=float),
+            np.asarray(camber, dtype=float)
+        )
+        p = self.params
+
+        if not p.slip_angle_in_degrees:
+            slip_angle = np.degrees(slip_angle)
+
+        Fz_kN = Fz / 1000.0
+
+        D = Fz * (p.a1 * Fz_kN + p.a2) * (1 - p.a15 * camber * camber) / 1000.0
+        C = p.a0
+
+        BCD = p.a3 * np.sin(2 * np.arctan(Fz_kN / p.a4)) * (1 - p.a5 * np.abs(camber))
+        CD = C * D
+        B = np.divide(BCD, CD, out=np.zeros_like(CD), where=np.abs(CD) > 1e-6)
+
+        E = (p.a6 * Fz_kN + p.a7) * (
+            1 - (p.a16 * camber + p.a17) * np.copysign(1.0, slip_angle)
+        )
+
+        Sh = p.a8 * Fz_kN + p.a9 + p.a10 * camber
+        Sv = (p.a11 * Fz_kN + p.a12) + (p.a13 * Fz_kN + p.a14) * camber * Fz_kN
+
+        forces = self.magic_formula_batch(slip_angle, B, C, D, E, Sh, Sv)
+        return np.where(Fz > 0, forces, 0.0)
 
     def get_peak_lateral_force(self, Fz: float, camber: float = 0.0) -> tuple[float, float]:
         """Find the peak lateral force and corresponding slip angle.
 
+        Results are cached; the peak is evaluated at the load and camber
+        rounded to load_quantum and camber_quantum.
+
         Args:
             Fz: Vertical load in Newtons
             camber: Camber angle in degrees
@@ -254,25 +695,211 @@ class PacejkaFormula:
         Returns:
             Tuple of (peak_force, peak_slip_angle)
         """
-        # Search for peak in reasonable range
-        slip_angles = np.linspace(0, 20, 200)
-        forces = [abs(self.lateral_force(a, Fz, camber)) for a in slip_angles]
-        peak_idx = np.argmax(forces)
-        return forces[peak_idx], slip_angles[peak_idx]
+        return self._cached_peak_lateral(
+            _round(Fz / self.load_quantum), _round(camber / self.camber_quantum)
+        )
 
     def get_peak_longitudinal_force(self, Fz: float) -> tuple[float, float]:
         """Find the peak longitudinal force and corresponding slip ratio.
 
+        Results are cached; the peak is evaluated at the load rounded
+        to load_quantum.
+
+        Args:
+            Fz: Vertical load in Newtons
+
+        Returns:
+            Tuple of (peak_force, peak_slip_ratio)
+        """
+        return self._cached_peak_longitudinal(_round(Fz / self.load_quantum))
+
+    def _cached_peak_lateral(self, load_key: int, camber_key: int) -> tuple[float, float]:
+        """Peak lateral force for quantized load and camber keys."""
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+        key = ("lateral", load_key, camber_key)
+        peak = self._peak_cache.get(key)
+        if peak is None:
+            peak = self.find_peak_lateral(
+                load_key * self.load_quantum, camber_key * self.camber_quantum
+            )
+            self._peak_cache.put(key, peak)
+        return peak
+
+    def _cached_peak_longitudinal(self, load_key: int) -> tuple[float, float]:
+        """Peak longitudinal force for a quantized load key."""
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+        key = ("longitudinal", load_key)
+        peak = self._peak_cache.get(key)
+        if peak is None:
+            peak = self.find_peak_longitudinal(load_key * self.load_quantum)
+            self._peak_cache.put(key, peak)
+        return peak
+
+    def get_peak_lateral_force_batch(
+        self,
+        Fz: ArrayLike,
+        camber: ArrayLike = 0.0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Peak lateral force and slip angle for arrays of loads and cambers.
+
+        Broadcasting equivalent of get_peak_lateral_force, with the same
+        quantization and results.
+
+        Returns:
+            Tuple of (peak_force, peak_slip_angle) arrays
+        """
+        Fz, camber = np.broadcast_arrays(
+            np.asarray(Fz, dtype=float), np.asarray(camber, dtype=float)
+        )
+        camber_keys = np.round(camber / self.camber_quantum).astype(np.int64)
+
+        if not np.any(camber_keys):
+            peaks = self._dense_peaks(
+                "lateral", Fz, lambda k: self._cached_peak_lateral(k, 0), self.find_peak_lateral
+            )
+            return peaks[..., 0], peaks[..., 1]
+
+        # Cambered: look up each distinct (load, camber) pair once
+        load_keys = np.round(Fz / self.load_quantum).astype(np.int64)
+        keys = np.stack((load_keys.ravel(), camber_keys.ravel()), axis=1)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        peaks = np.array(
+            [self._cached_peak_lateral(int(l), int(c)) for l, c in unique_keys],
+            dtype=float
+        ).reshape(-1, 2)[inverse.ravel()]
+        return peaks[:, 0].reshape(Fz.shape), peaks[:, 1].reshape(Fz.shape)
+
+    def get_peak_longitudinal_force_batch(
+        self,
+        Fz: ArrayLike
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Peak longitudinal force and slip ratio for an array of loads.
+
+        Broadcasting equivalent of get_peak_longitudinal_force.
+
+        Returns:
+            Tuple of (peak_force, peak_slip_ratio) arrays
+        """
+        peaks = self._dense_peaks(
+            "longitudinal", np.asarray(Fz, dtype=float),
+            self._cached_peak_longitudinal, self.find_peak_longitudinal
+        )
+        return peaks[..., 0], peaks[..., 1]
+
+    def _dense_peaks(
+        self,
+        kind: str,
+        Fz: np.ndarray,
+        solve: Callable[[int], tuple[float, float]],
+        find: Callable[[float], tuple[float, float]]
+    ) -> np.ndarray:
+        """Peaks for an array of loads from a dense table indexed by load key.
+
+        The table grows to the largest key seen, up to DENSE_PEAK_MAX_LOAD,
+        and is filled lazily from the peak cache. Non-positive loads all
+        have a zero peak, so negative keys share row 0. Loads above the
+        table are looked up one key at a time through the LRU peak cache,
+        and non-finite loads are solved directly without caching.
+
+        Args:
+            kind: Table name
+            Fz: Vertical loads (N)
+            solve: Cached peak for an integer load key
+            find: Uncached peak for a load
+
+        Returns:
+            Array of shape Fz.shape + (2,): (peak_force, peak_slip)
+        """
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+        scaled = Fz / self.load_quantum
+        max_key = int(self.DENSE_PEAK_MAX_LOAD / self.load_quantum)
+        dense = np.isfinite(scaled) & (scaled < max_key + 0.5)
+        all_dense = bool(dense.all())
+        if all_dense:
+            load_keys = np.maximum(np.round(scaled).astype(np.int64), 0)
+        else:
+            load_keys = np.maximum(np.round(np.where(dense, scaled, 0.0)).astype(np.int64), 0)
+
+        table = self._peak_tables.get(kind)
+        size = int(load_keys.max(initial=0)) + 1
+        if table is None or len(table) < size:
+            length = max(size, 2 * len(table)) if table is not None else size
+            grown = np.full((min(length, max_key + 1), 2), np.nan)
+            if table is not None:
+                grown[:len(table)] = table
+            table = self._peak_tables[kind] = grown
+
+        missing = np.isnan(table[load_keys, 0])
+        if np.any(missing):
+            for key in np.unique(load_keys[missing]):
+                table[key] = solve(int(key))
+        peaks = table[load_keys]
+
+        if not all_dense:
+            outside = ~dense
+            peaks[outside] = [
+                solve(_round(load / self.load_quantum)) if math.isfinite(load) else find(load)
+                for load in Fz[outside].tolist()
+            ]
+        return peaks
+
+    def find_peak_lateral(
+        self,
+        Fz: float,
+        camber: float = 0.0,
+        tol: float = 1e-9
+    ) -> tuple[float, float]:
+        """Solve for the peak lateral force without sampling.
+
+        Searches slip angles in LATERAL_PEAK_RANGE (same units as
+        lateral_force). Uses the closed form C*atan(phi) = pi/2 where it
+        applies, otherwise a bracketed root search on dFy/d(slip).
+
         Args:
             Fz: Vertical load in Newtons
+            camber: Camber angle in degrees
+            tol: Absolute tolerance on the peak slip angle
+
+        Returns:
+            Tuple of (peak_force, peak_slip_angle)
+        """
+        lo, hi = self.LATERAL_PEAK_RANGE
+        if Fz <= 0:
+            return 0.0, lo
+
+        c = self.lateral_coefficients(Fz, camber)
+
+        if self.params.slip_angle_in_degrees:
+            return _solve_peak(c.B, c.C, c.D, c.E, c.Sh, c.Sv, lo, hi, tol)
+
+        # Formula works in degrees; convert window and result
+        force, slip_deg = _solve_peak(
+            c.B, c.C, c.D, c.E, c.Sh, c.Sv, math.degrees(lo), math.degrees(hi), math.degrees(tol)
+        )
+        return force, math.radians(slip_deg)
+
+    def find_peak_longitudinal(self, Fz: float, tol: float = 1e-9) -> tuple[float, float]:
+        """Solve for the peak longitudinal force without sampling.
+
+        Searches slip ratios in LONGITUDINAL_PEAK_RANGE. See
+        find_peak_lateral for the method.
+
+        Args:
+            Fz: Vertical load in Newtons
+            tol: Absolute tolerance on the peak slip ratio
 
         Returns:
             Tuple of (peak_force, peak_slip_ratio)
         """
-        slip_ratios = np.linspace(0, 0.5, 200)
-        forces = [abs(self.longitudinal_force(sr, Fz)) for sr in slip_ratios]
-        peak_idx = np.argmax(forces)
-        return forces[peak_idx], slip_ratios[peak_idx]
+        lo, hi = self.LONGITUDINAL_PEAK_RANGE
+        if Fz <= 0:
+            return 0.0, lo
+
+        c = self.longitudinal_coefficients(Fz)
+        return _solve_peak(c.B, c.C, c.D, c.E, c.Sh, c.Sv, lo, hi, tol)
 
     def get_lateral_curve(self, Fz: float, slip_range: tuple[float, float] = (-20, 20),
                           num_points: int = 100, camber: float = 0.0) -> tuple[np.ndarray, np.ndarray]:
@@ -288,7 +915,7 @@ class PacejkaFormula:
             Tuple of (slip_angles, forces) arrays
         """
         slip_angles = np.linspace(slip_range[0], slip_range[1], num_points)
-        forces = np.array([self.lateral_force(a, Fz, camber) for a in slip_angles])
+        forces = self.lateral_force_batch(slip_angles, Fz, camber)
         return slip_angles, forces
 
     def get_longitudinal_curve(self, Fz: float, slip_range: tuple[float, float] = (-1, 1),
@@ -304,5 +931,161 @@ class PacejkaFormula:
             Tuple of (slip_ratios, forces) arrays
         """
         slip_ratios = np.linspace(slip_range[0], slip_range[1], num_points)
-        forces = np.array([self.longitudinal_force(sr, Fz) for sr in slip_ratios])
+        forces = self.longitudinal_force_batch(slip_ratios, Fz)
         return slip_ratios, forces
+
+
+def _magic_formula_slope(x: float, B: float, C: float, D: float, E: float,
+                         Sh: float) -> float:
+    """Analytic derivative dF/dx of the Magic Formula."""
+    Bx1 = B * (x + Sh)
+    phi = Bx1 - E * (Bx1 - math.atan(Bx1))
+    dphi = (1.0 - E) + E / (1.0 + Bx1 * Bx1)
+    return D * math.cos(C * math.atan(phi)) * C / (1.0 + phi * phi) * dphi * B
+
+
+def _brent_root(func, a: float, b: float, tol: float, max_iter: int = 100) -> float:
+    """Find a root of func in [a, b] using Brent's method.
+
+    func(a) and func(b) must have opposite signs.
+    """
+    fa = func(a)
+    fb = func(b)
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+
+    c, fc = a, fa
+    d = e = b - a
+
+    for _ in range(max_iter):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2.0 * 1e-16 * abs(b) + 0.5 * tol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol1 or fb == 0.0:
+            return b
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            # Inverse quadratic interpolation (secant if only two points)
+            s = fb / fa
+            if a == c:
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2.0 * p < min(3.0 * m * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else math.copysign(tol1, m)
+        fb = func(b)
+
+    return b
+
+
+def _solve_phi(target: float, E: float, tol: float) -> Optional[float]:
+    """Solve (1-E)*u + E*atan(u) = target for u, assuming E <= 1.
+
+    Closed form when E == 0; otherwise safeguarded Newton iteration on
+    the monotonic function. Returns None if no solution exists.
+    """
+    if E == 0.0:
+        return target
+
+    def phi(u: float) -> float:
+        return (1.0 - E) * u + E * math.atan(u) - target
+
+    # Bracket the root (phi is odd and increasing for E <= 1)
+    lo, hi = 0.0, max(abs(target), 1.0)
+    direction = 1.0 if target >= 0 else -1.0
+    for _ in range(64):
+        if phi(direction * hi) * direction >= 0:
+            break
+        lo, hi = hi, hi * 2.0
+    else:
+        return None
+    lo, hi = direction * lo, direction * hi
+    if lo > hi:
+        lo, hi = hi, lo
+
+    u = 0.5 * (lo + hi)
+    for _ in range(100):
+        f = phi(u)
+        if f == 0.0:
+            return u
+        if f > 0:
+            hi = u
+        else:
+            lo = u
+        slope = (1.0 - E) + E / (1.0 + u * u)
+        step = f / slope if slope > 0 else 0.0
+        u_new = u - step
+        if not lo < u_new < hi:
+            u_new = 0.5 * (lo + hi)
+        if abs(u_new - u) <= tol:
+            return u_new
+        u = u_new
+    return u
+
+
+def _solve_peak(B: float, C: float, D: float, E: float, Sh: float, Sv: float,
+                lo: float, hi: float, tol: float) -> tuple[float, float]:
+    """Locate the maximum of |F(x)| over [lo, hi].
+
+    Returns:
+        Tuple of (peak_force, peak_slip)
+    """
+    def force(x: float) -> float:
+        return abs(PacejkaFormula.magic_formula(x, B, C, D, E, Sh, Sv))
+
+    candidates = [lo, hi]
+
+    if B != 0.0 and C > 1.0 and E <= 1.0:
+        # Stationary points where C*atan(phi) = (2k+1)*pi/2
+        k = 0
+        while 2 * k + 1 < C:
+            angle = (2 * k + 1) * math.pi / (2.0 * C)
+            for target in (math.tan(angle), -math.tan(angle)):
+                u = _solve_phi(target, E, tol * abs(B))
+                if u is not None:
+                    x = u / B - Sh
+                    if lo < x < hi:
+                        candidates.append(x)
+            k += 1
+    elif B != 0.0:
+        # No closed form: bracket sign changes of dF/dx, refine with Brent
+        def slope(x: float) -> float:
+            return _magic_formula_slope(x, B, C, D, E, Sh)
+
+        num_segments = 32
+        step = (hi - lo) / num_segments
+        a = lo
+        fa = slope(a)
+        for i in range(1, num_segments + 1):
+            b = lo + i * step
+            fb = slope(b)
+            if fa == 0.0:
+                candidates.append(a)
+            elif fa * fb < 0:
+                candidates.append(_brent_root(slope, a, b, tol))
+            a, fa = b, fb
+
+    best = max(candidates, key=force)
+    return force(best), best
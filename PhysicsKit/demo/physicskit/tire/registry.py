@@ -0,0 +1,148 @@
+"""Shared tire force models.
+
+Every wheel on every car used to build its own PacejkaFormula and
+CombinedSlip, even though four wheels on a car (and often every car in a
+batch) use identical parameters. The force model only holds parameters and
+caches, so it can be shared: TireModelRegistry hands out one model per
+distinct tire configuration, and each Tire keeps only its own dynamic state
+(wheel spin, relaxation, slip).
+
+Sharing also means all those tires warm a single peak/coefficient cache
+instead of one cache each.
+
+Models are keyed on the content of the configuration, not its identity, so
+two equal TireConfig instances share a model. Entries are held weakly and
+disappear once no tire uses them.
+
+Shared models are frozen: their Pacejka params, friction and ellipse ratio
+raise on assignment, since a change through one tire would silently change
+every car with the same configuration. To run a tire with different
+parameters, build it from a TireConfig holding them, or give it a private,
+editable model with Tire(config, shared=False).
+"""
+
+from __future__ import annotations
+import weakref
+from dataclasses import dataclass, astuple
+from typing import TYPE_CHECKING, Hashable
+
+from physicskit.tire.pacejka import PacejkaFormula
+from physicskit.tire.tabulated import TabulatedPacejka
+from physicskit.tire.combined import CombinedSlip
+
+if TYPE_CHECKING:
+    from physicskit.tire.tire import TireConfig
+
+
+FORCE_MODELS = ("analytic", "tabulated")
+
+
+@dataclass
+class SharedTireModel:
+    """Force model shared by every tire with the same configuration.
+
+    Frozen by the registry: assigning pacejka.params, one of its fields or
+    combined_slip.friction_mu raises instead of changing every tire that
+    holds this model.
+    """
+    pacejka: PacejkaFormula
+    combined_slip: CombinedSlip
+
+
+def create_force_model(config: TireConfig) -> PacejkaFormula:
+    """Create the Pacejka backend selected by config.force_model.
+
+    Args:
+        config: Tire configuration
+
+    Returns:
+        New PacejkaFormula or TabulatedPacejka
+    """
+    if config.force_model == "analytic":
+        return PacejkaFormula(config.pacejka_params)
+    elif config.force_model == "tabulated":
+        return TabulatedPacejka(
+            config.pacejka_params,
+            slip_points=config.table_slip_points,
+            load_points=config.table_load_points
+        )
+    raise ValueError(
+        f"Unknown force model '{config.force_model}'. "
+        f"Available: {', '.join(FORCE_MODELS)}"
+    )
+
+
+def create_tire_model(config: TireConfig) -> SharedTireModel:
+    """Build an unshared, editable force model for a configuration.
+
+    Args:
+        config: Tire configuration
+
+    Returns:
+        New SharedTireModel that no registry hands out
+    """
+    pacejka = create_force_model(config)
+    return SharedTireModel(
+        pacejka=pacejka,
+        combined_slip=CombinedSlip(pacejka, friction_mu=config.friction_mu)
+    )
+
+
+class TireModelRegistry:
+    """Flyweight registry of shared tire force models."""
+
+    def __init__(self):
+        self._models: weakref.WeakValueDictionary[Hashable, SharedTireModel] = (
+            weakref.WeakValueDictionary()
+        )
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def key_for(config: TireConfig) -> Hashable:
+        """Content key of the parts of a TireConfig that define the force model.
+
+        Geometry, inertia and relaxation lengths are per-wheel dynamics and
+        are not part of the key.
+        """
+        return (
+            config.force_model,
+            astuple(config.pacejka_params),
+            config.table_slip_points,
+            config.table_load_points,
+            config.friction_mu,
+        )
+
+    def get(self, config: TireConfig) -> SharedTireModel:
+        """Get the shared force model for a configuration, creating it if needed.
+
+        Args:
+            config: Tire configuration
+
+        Returns:
+            SharedTireModel used by every tire with an equal configuration
+        """
+        key = self.key_for(config)
+        model = self._models.get(key)
+        if model is not None:
+            self.hits += 1
+            return model
+
+        self.misses += 1
+        model = create_tire_model(config)
+        model.combined_slip.freeze()
+        self._models[key] = model
+        return model
+
+    def clear(self) -> None:
+        """Forget all models. Tires already holding a model keep it."""
+        self._models.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# Registry used by Tire unless another one is passed in
+default_registry = TireModelRegistry()
@@ -14,11 +14,20 @@ This effect is especially important for:
 - Rapid steering inputs
 - ABS/traction control systems
 - Realistic feel in drifting (smoother transitions)
+
+With a fixed timestep the filter gain depends only on the tire speed, so
+TireRelaxation.update reads it from a RelaxationDecay table shared by all
+tires with the same (dt, relaxation lengths) instead of evaluating exp()
+per axis per step. RelaxationDecay.gains_batch gives the same gains for
+arrays of speeds (used by FleetWorld).
 """
 
 from __future__ import annotations
 import math
 from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
 
 
 @dataclass
@@ -32,6 +41,144 @@ class RelaxationState:
     tau_y: float = 0.0     # Current lateral time constant
 
 
+# Speed grid of RelaxationDecay tables
+DECAY_SPEED_STEP = 0.05   # m/s
+DECAY_MAX_SPEED = 150.0   # m/s, gains above are computed exactly
+
+
+class RelaxationDecay:
+    """Relaxation filter gains for one timestep, tabulated against speed.
+
+    For a fixed dt the gain of TireRelaxation.update,
+
+        alpha = 1 - exp(-dt / tau),  tau = min(sigma / max(v, MIN_VELOCITY), MAX_TAU)
+
+    is a function of speed alone: constant up to v0 = max(MIN_VELOCITY,
+    sigma / MAX_TAU) and smooth above. Each axis is tabulated from its v0
+    on a uniform grid and linearly interpolated, which is exact at v0 and
+    off by at most
+
+        (dt / sigma)^2 * step^2 / 8
+
+    elsewhere (|alpha''| <= (dt / sigma)^2). For dt = 1 ms, sigma = 0.3 m
+    and the default 0.05 m/s step that is 3.5e-9, against gains of 2e-3
+    and up. max_error holds the bound of the larger axis.
+    """
+
+    def __init__(
+        self,
+        dt: float,
+        sigma_x: float,
+        sigma_y: float,
+        step: float = DECAY_SPEED_STEP,
+        max_speed: float = DECAY_MAX_SPEED
+    ):
+        """Build the tables.
+
+        Args:
+            dt: Timestep (seconds)
+            sigma_x: Longitudinal relaxation length (m)
+            sigma_y: Lateral relaxation length (m)
+            step: Speed grid spacing (m/s)
+            max_speed: Largest tabulated speed (m/s)
+        """
+        self.dt = dt
+        self.sigma_x = sigma_x
+        self.sigma_y = sigma_y
+        self.step = step
+        self.max_speed = max_speed
+        self._inv_step = 1.0 / step
+
+        self._x0, self._x_floor, self._x_table = self._build(sigma_x)
+        self._y0, self._y_floor, self._y_table = self._build(sigma_y)
+        self._x_last = len(self._x_table) - 1
+        self._y_last = len(self._y_table) - 1
+
+        # Arrays for gains_batch
+        self._x_grid = self._x0 + step * np.arange(len(self._x_table))
+        self._y_grid = self._y0 + step * np.arange(len(self._y_table))
+        self._x_values = np.array(self._x_table)
+        self._y_values = np.array(self._y_table)
+
+        self.max_error = max(
+            (dt / sigma) ** 2 * step * step / 8 if sigma > 0 else 0.0
+            for sigma in (sigma_x, sigma_y)
+        )
+
+    def _build(self, sigma: float) -> tuple[float, float, list[float]]:
+        """Grid start, gain below it, and gains on the grid for one axis."""
+        if sigma <= 0:
+            return math.inf, 1.0, [1.0]
+        v0 = max(TireRelaxation.MIN_VELOCITY, sigma / TireRelaxation.MAX_TAU)
+        n = max(1, math.ceil((self.max_speed - v0) / self.step))
+        table = [self.exact(sigma, v0 + i * self.step) for i in range(n + 1)]
+        return v0, table[0], table
+
+    def exact(self, sigma: float, speed: float) -> float:
+        """Gain for one relaxation length, evaluated directly."""
+        v = max(abs(speed), TireRelaxation.MIN_VELOCITY)
+        tau = min(sigma / v, TireRelaxation.MAX_TAU)
+        return 1.0 - math.exp(-self.dt / tau) if tau > 0 else 1.0
+
+    def gains(self, speed: float) -> tuple[float, float]:
+        """Longitudinal and lateral gains at a speed (m/s, non-negative)."""
+        f = (speed - self._x0) * self._inv_step
+        if f <= 0.0:
+            alpha_x = self._x_floor
+        elif f < self._x_last:
+            i = int(f)
+            a = self._x_table[i]
+            alpha_x = a + (self._x_table[i + 1] - a) * (f - i)
+        else:
+            # Above the table, including inf (zero tau): alpha = 1
+            alpha_x = self.exact(self.sigma_x, speed)
+
+        f = (speed - self._y0) * self._inv_step
+        if f <= 0.0:
+            alpha_y = self._y_floor
+        elif f < self._y_last:
+            i = int(f)
+            a = self._y_table[i]
+            alpha_y = a + (self._y_table[i + 1] - a) * (f - i)
+        else:
+            alpha_y = self.exact(self.sigma_y, speed)
+
+        return alpha_x, alpha_y
+
+    def gains_batch(self, speed: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Gains for an array of speeds (m/s, non-negative), as gains()."""
+        alpha_x = np.interp(speed, self._x_grid, self._x_values)
+        alpha_y = np.interp(speed, self._y_grid, self._y_values)
+        fast = speed > self._x_grid[-1]
+        if fast.any():
+            alpha_x[fast] = self._exact_batch(self.sigma_x, speed[fast])
+        fast = speed > self._y_grid[-1]
+        if fast.any():
+            alpha_y[fast] = self._exact_batch(self.sigma_y, speed[fast])
+        return alpha_x, alpha_y
+
+    def _exact_batch(self, sigma: float, speed: np.ndarray) -> np.ndarray:
+        """exact() for an array of speeds."""
+        tau = np.minimum(sigma / np.maximum(speed, TireRelaxation.MIN_VELOCITY), TireRelaxation.MAX_TAU)
+        with np.errstate(divide="ignore"):
+            gains: np.ndarray = 1.0 - np.exp(-self.dt / tau)
+        return gains
+
+
+_decay_tables: dict[tuple[float, float, float], RelaxationDecay] = {}
+
+
+def get_decay(dt: float, sigma_x: float, sigma_y: float) -> RelaxationDecay:
+    """Shared RelaxationDecay for a timestep and pair of relaxation lengths."""
+    key = (dt, sigma_x, sigma_y)
+    decay = _decay_tables.get(key)
+    if decay is None:
+        if len(_decay_tables) >= 64:
+            _decay_tables.clear()
+        decay = _decay_tables[key] = RelaxationDecay(dt, sigma_x, sigma_y)
+    return decay
+
+
 class TireRelaxation:
     """First-order tire force dynamics using relaxation length model.
 
@@ -60,13 +207,37 @@ class TireRelaxation:
             relaxation_length_y: Lateral relaxation length (m).
                                 Typically slightly larger than longitudinal.
         """
-        self.sigma_x = relaxation_length_x
-        self.sigma_y = relaxation_length_y
+        self._sigma_x = relaxation_length_x
+        self._sigma_y = relaxation_length_y
+        self._decay: Optional[RelaxationDecay] = None
 
         # Current force state
         self.Fx = 0.0
         self.Fy = 0.0
 
+        # Fraction of the gap to target_Fx closed by the last update
+        self.gain_x = 1.0
+
+    @property
+    def sigma_x(self) -> float:
+        """Longitudinal relaxation length (m)."""
+        return self._sigma_x
+
+    @sigma_x.setter
+    def sigma_x(self, value: float) -> None:
+        self._sigma_x = value
+        self._decay = None
+
+    @property
+    def sigma_y(self) -> float:
+        """Lateral relaxation length (m)."""
+        return self._sigma_y
+
+    @sigma_y.setter
+    def sigma_y(self, value: float) -> None:
+        self._sigma_y = value
+        self._decay = None
+
     def update(
         self,
         target_Fx: float,
@@ -82,6 +253,8 @@ class TireRelaxation:
         For small dt/tau, this approximates:
             F_new = F_old + (F_target - F_old) * dt/tau
 
+        The gains come from the shared RelaxationDecay table for dt.
+
         Args:
             target_Fx: Steady-state longitudinal force (from Pacejka)
             target_Fy: Steady-state lateral force (from Pacejka)
@@ -91,26 +264,56 @@ class TireRelaxation:
         Returns:
             Tuple of (filtered_Fx, filtered_Fy)
         """
-        # Calculate time constants
-        v = max(abs(velocity), self.MIN_VELOCITY)
+        return self._filter(target_Fx, target_Fy, abs(velocity), dt)
 
-        tau_x = min(self.sigma_x / v, self.MAX_TAU)
-        tau_y = min(self.sigma_y / v, self.MAX_TAU)
+    def _filter(
+        self,
+        target_Fx: float,
+        target_Fy: float,
+        speed: float,
+        dt: float
+    ) -> tuple[float, float]:
+        """First-order filter step at an (effective) speed."""
+        decay = self._decay
+        if decay is None or decay.dt != dt:
+            decay = self._decay = get_decay(dt, self._sigma_x, self._sigma_y)
+        alpha_x, alpha_y = decay.gains(speed)
 
-        # First-order filter (exact integration)
-        if tau_x > 0:
-            alpha_x = 1.0 - math.exp(-dt / tau_x)
-            self.Fx += (target_Fx - self.Fx) * alpha_x
-        else:
-            self.Fx = target_Fx
+        self.Fx += (target_Fx - self.Fx) * alpha_x
+        self.Fy += (target_Fy - self.Fy) * alpha_y
+        self.gain_x = alpha_x
+        return self.Fx, self.Fy
 
-        if tau_y > 0:
-            alpha_y = 1.0 - math.exp(-dt / tau_y)
-            self.Fy += (target_Fy - self.Fy) * alpha_y
-        else:
-            self.Fy = target_Fy
+    def rates(
+        self,
+        Fx: float,
+        Fy: float,
+        target_Fx: float,
+        target_Fy: float,
+        velocity: float
+    ) -> tuple[float, float]:
+        """Time derivatives of the forces, for integrating the lag as an ODE.
 
-        return self.Fx, self.Fy
+        dF/dt = (F_target - F) / tau, with tau as in update. The forces are
+        passed in rather than read from the model, so an integrator can
+        evaluate trial states.
+
+        Args:
+            Fx: Longitudinal force (N)
+            Fy: Lateral force (N)
+            target_Fx: Steady-state longitudinal force (N)
+            target_Fy: Steady-state lateral force (N)
+            velocity: Tire velocity magnitude (m/s)
+
+        Returns:
+            Tuple of (dFx/dt, dFy/dt)
+        """
+        v = max(abs(velocity), self.MIN_VELOCITY)
+        tau_x = min(self.sigma_x / v, self.MAX_TAU)
+        tau_y = min(self.sigma_y / v, self.MAX_TAU)
+        dFx = (target_Fx - Fx) / tau_x if tau_x > 0 else 0.0
+        dFy = (target_Fy - Fy) / tau_y if tau_y > 0 else 0.0
+        return dFx, dFy
 
     def update_simple(
         self,
@@ -132,6 +335,7 @@ class TireRelaxation:
         # Linear interpolation (first-order approximation)
         alpha_x = min(dt / tau_x, 1.0) if tau_x > 0 else 1.0
         alpha_y = min(dt / tau_y, 1.0) if tau_y > 0 else 1.0
+        self.gain_x = alpha_x
 
         self.Fx += (target_Fx - self.Fx) * alpha_x
         self.Fy += (target_Fy - self.Fy) * alpha_y
@@ -224,15 +428,14 @@ class AdaptiveRelaxation(TireRelaxation):
         else:
             factor = 1.0
 
-        # Temporarily adjust relaxation lengths
-        orig_x, orig_y = self.sigma_x, self.sigma_y
-        self.sigma_x *= factor
-        self.sigma_y *= factor
-
-        # Update with adapted relaxation
-        result = self.update(target_Fx, target_Fy, velocity, dt)
-
-        # Restore original values
-        self.sigma_x, self.sigma_y = orig_x, orig_y
+        if factor <= 0:
+            # Zero relaxation length: the force follows its target instantly
+            self.Fx = target_Fx
+            self.Fy = target_Fy
+            self.gain_x = 1.0
+            return self.Fx, self.Fy
 
-        return result
+        # tau = factor * sigma / v is the base relaxation at speed v / factor,
+        # so the shared gain table serves every factor
+        speed = max(abs(velocity), self.MIN_VELOCITY) / factor
+        return self._filter(target_Fx, target_Fy, speed, dt)
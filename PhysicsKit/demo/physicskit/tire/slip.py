@@ -3,17 +3,34 @@
 from __future__ import annotations
 import math
 from dataclasses import dataclass
+from typing import Union
 
-from physicskit.core.vector import Vector3
+import numpy as np
 
+from physicskit.core.vector import Vector3, normalize_angles
 
-@dataclass
+ArrayLike = Union[float, np.ndarray]
+
+
+@dataclass(slots=True)
 class SlipState:
     """Current slip state of a tire."""
     slip_ratio: float = 0.0      # Longitudinal slip [-1, inf)
     slip_angle: float = 0.0      # Lateral slip angle (radians)
     slip_angle_deg: float = 0.0  # Lateral slip angle (degrees)
     combined_slip: float = 0.0   # Combined slip magnitude
+    forward_velocity: float = 0.0  # Contact velocity along the wheel heading (m/s)
+
+
+@dataclass(slots=True)
+class SlipBatch:
+    """Slip state of many tires, one array element per tire (see SlipState)."""
+    slip_ratio: np.ndarray
+    slip_angle: np.ndarray        # Radians
+    slip_angle_deg: np.ndarray
+    combined_slip: np.ndarray
+    forward_velocity: np.ndarray  # m/s
+    contact_speed: np.ndarray     # Contact patch speed (m/s)
 
 
 class SlipCalculator:
@@ -196,23 +213,98 @@ class SlipCalculator:
         Returns:
             SlipState with all slip quantities
         """
+        return cls.calculate_slip_into(
+            SlipState(), contact_velocity, wheel_heading, wheel_angular_velocity, wheel_radius
+        )
+
+    @classmethod
+    def calculate_slip_into(
+        cls,
+        out: SlipState,
+        contact_velocity: Vector3,
+        wheel_heading: float,
+        wheel_angular_velocity: float,
+        wheel_radius: float
+    ) -> SlipState:
+        """Calculate complete slip state into an existing SlipState.
+
+        Same as calculate_slip, without allocating.
+
+        Returns:
+            out
+        """
         # Project velocity onto wheel heading for longitudinal component
-        heading_vec = Vector3(math.cos(wheel_heading), math.sin(wheel_heading), 0)
-        forward_velocity = contact_velocity.dot(heading_vec)
+        forward_velocity = (
+            contact_velocity.x * math.cos(wheel_heading) +
+            contact_velocity.y * math.sin(wheel_heading)
+        )
 
         # Calculate slip ratio
         sr = cls.slip_ratio(forward_velocity, wheel_angular_velocity, wheel_radius)
 
         # Calculate slip angle
         sa = cls.slip_angle(contact_velocity, wheel_heading)
-        sa_deg = math.degrees(sa)
 
-        # Combined slip
-        combined = cls.combined_slip_magnitude(sr, sa)
+        out.slip_ratio = sr
+        out.slip_angle = sa
+        out.slip_angle_deg = math.degrees(sa)
+        out.combined_slip = cls.combined_slip_magnitude(sr, sa)
+        out.forward_velocity = forward_velocity
+        return out
+
+    @classmethod
+    def calculate_slip_batch(
+        cls,
+        vx: ArrayLike,
+        vy: ArrayLike,
+        heading: ArrayLike,
+        omega: ArrayLike,
+        radius: ArrayLike
+    ) -> SlipBatch:
+        """Calculate slip for arrays of tires (vectorized calculate_slip).
+
+        Inputs broadcast against each other, so e.g. a (N, 4) array of
+        wheel speeds can be combined with a (4,) array of radii. Element
+        for element the results equal calculate_slip: the same
+        MIN_VELOCITY reference floor and [-1, 1] clamp for the slip ratio,
+        zero slip angle below MIN_VELOCITY contact speed, and the same
+        tan(alpha) cap in the combined slip magnitude.
+
+        Args:
+            vx: Contact patch velocity x (m/s, world frame)
+            vy: Contact patch velocity y (m/s, world frame)
+            heading: Direction each tire is pointing (radians, world frame)
+            omega: Wheel rotation rates (rad/s)
+            radius: Wheel radii (m)
 
-        return SlipState(
-            slip_ratio=sr,
-            slip_angle=sa,
-            slip_angle_deg=sa_deg,
-            combined_slip=combined
+        Returns:
+            SlipBatch of arrays with the broadcast shape of the inputs
+        """
+        vx = np.asarray(vx, dtype=float)
+        vy = np.asarray(vy, dtype=float)
+        heading = np.asarray(heading, dtype=float)
+
+        forward_velocity = vx * np.cos(heading) + vy * np.sin(heading)
+        wheel_velocity = np.asarray(omega, dtype=float) * radius
+        reference = np.maximum(
+            np.maximum(np.abs(forward_velocity), np.abs(wheel_velocity)), cls.MIN_VELOCITY
+        )
+        slip_ratio = np.clip((wheel_velocity - forward_velocity) / reference, -1.0, 1.0)
+
+        contact_speed = np.sqrt(vx * vx + vy * vy)
+        slip_angle = normalize_angles(np.arctan2(vy, vx) - heading)
+        slip_angle = np.where(contact_speed < cls.MIN_VELOCITY, 0.0, slip_angle)
+
+        tan_alpha = np.where(
+            np.abs(slip_angle) < math.pi / 2 - 0.01, np.tan(slip_angle), 100.0
+        )
+        combined_slip = np.sqrt(slip_ratio * slip_ratio + tan_alpha * tan_alpha)
+
+        return SlipBatch(
+            slip_ratio=slip_ratio,
+            slip_angle=slip_angle,
+            slip_angle_deg=np.degrees(slip_angle),
+            combined_slip=combined_slip,
+            forward_velocity=forward_velocity,
+            contact_speed=contact_speed,
         )
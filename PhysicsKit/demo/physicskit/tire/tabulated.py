@@ -0,0 +1,243 @@
+"""Tabulated Pacejka tire model for real-time use.
+
+Evaluating the Magic Formula costs a sine and two arctangents per call.
+TabulatedPacejka precomputes the pure slip force curves once on a
+(slip x load) grid and answers lookups with bilinear interpolation,
+trading a small, measured accuracy loss for speed.
+
+Grids:
+    Fx(slip_ratio, Fz)
+    Fy(slip_angle, Fz) at zero camber
+
+Inputs outside the grid (and non-zero camber) fall back to the analytic
+formula, so TabulatedPacejka is a drop-in replacement for PacejkaFormula.
+"""
+
+from __future__ import annotations
+import math
+from typing import Optional
+
+import numpy as np
+
+from physicskit.tire.pacejka import PacejkaFormula, PacejkaParams
+from physicskit.tire.slip import ArrayLike
+
+
+class TabulatedPacejka(PacejkaFormula):
+    """Pacejka force model backed by precomputed lookup tables.
+
+    After construction, max_error_fx and max_error_fy report the largest
+    deviation from the analytic formula measured at the centre of every
+    grid cell, where bilinear interpolation error is largest.
+    """
+
+    def __init__(
+        self,
+        params: Optional[PacejkaParams] = None,
+        slip_points: int = 401,
+        load_points: int = 61,
+        max_load: float = 15000.0,
+        slip_ratio_range: tuple[float, float] = (-1.0, 1.0),
+        slip_angle_range: tuple[float, float] = (-90.0, 90.0),
+        **kwargs
+    ):
+        """Initialize and build lookup tables.
+
+        Args:
+            params: Pacejka coefficients. Defaults to sport tire if None.
+            slip_points: Grid points along each slip axis
+            load_points: Grid points along the load axis (from 0 to max_load)
+            max_load: Largest tabulated vertical load (N)
+            slip_ratio_range: Tabulated slip ratio range
+            slip_angle_range: Tabulated slip angle range (degrees)
+            **kwargs: Passed through to PacejkaFormula (peak cache settings)
+        """
+        self.slip_points = max(2, slip_points)
+        self.load_points = max(2, load_points)
+        self.max_load = max_load
+        self.slip_ratio_range = slip_ratio_range
+        self.slip_angle_range = slip_angle_range
+
+        self.max_error_fx: float = 0.0
+        self.max_error_fy: float = 0.0
+
+        # Builds tables through the params setter -> invalidate_cache
+        super().__init__(params, **kwargs)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached results and rebuild the lookup tables."""
+        super().invalidate_cache()
+        self._build_tables()
+
+    def _build_tables(self) -> None:
+        """Precompute force grids and measure interpolation error."""
+        self._sr_grid = np.linspace(*self.slip_ratio_range, self.slip_points)
+        self._sa_grid = np.linspace(*self.slip_angle_range, self.slip_points)
+        self._load_grid = np.linspace(0.0, self.max_load, self.load_points)
+
+        loads = self._load_grid[:, np.newaxis]
+        self._fx_table = self._analytic_fx(self._sr_grid[np.newaxis, :], loads)
+        self._fy_table = self._analytic_fy(self._sa_grid[np.newaxis, :], loads)
+
+        # Uniform grid parameters for O(1) index computation
+        self._sr_lo = self.slip_ratio_range[0]
+        self._sr_inv_step = (self.slip_points - 1) / (
+            self.slip_ratio_range[1] - self.slip_ratio_range[0]
+        )
+        self._sa_lo = self.slip_angle_range[0]
+        self._sa_inv_step = (self.slip_points - 1) / (
+            self.slip_angle_range[1] - self.slip_angle_range[0]
+        )
+        self._load_inv_step = (self.load_points - 1) / self.max_load
+        self._slip_last = self.slip_points - 1
+        self._load_last = self.load_points - 1
+
+        # Nested lists are faster than ndarray indexing for scalar lookups
+        self._fx_rows: list[list[float]] = self._fx_table.tolist()
+        self._fy_rows: list[list[float]] = self._fy_table.tolist()
+
+        # Error at cell centres
+        sr_mid = 0.5 * (self._sr_grid[1:] + self._sr_grid[:-1])
+        sa_mid = 0.5 * (self._sa_grid[1:] + self._sa_grid[:-1])
+        load_mid = 0.5 * (self._load_grid[1:] + self._load_grid[:-1])[:, np.newaxis]
+
+        fx_interp = 0.25 * (
+            self._fx_table[:-1, :-1] + self._fx_table[:-1, 1:] +
+            self._fx_table[1:, :-1] + self._fx_table[1:, 1:]
+        )
+        fy_interp = 0.25 * (
+            self._fy_table[:-1, :-1] + self._fy_table[:-1, 1:] +
+            self._fy_table[1:, :-1] + self._fy_table[1:, 1:]
+        )
+        self.max_error_fx = float(np.max(np.abs(
+            fx_interp - self._analytic_fx(sr_mid[np.newaxis, :], load_mid)
+        )))
+        self.max_error_fy = float(np.max(np.abs(
+            fy_interp - self._analytic_fy(sa_mid[np.newaxis, :], load_mid)
+        )))
+
+    def _analytic_fx(self, slip_ratio: np.ndarray, Fz: np.ndarray) -> np.ndarray:
+        """Analytic longitudinal force."""
+        return super().longitudinal_force_batch(slip_ratio, Fz)
+
+    def _analytic_fy(self, slip_angle_deg: np.ndarray, Fz: np.ndarray) -> np.ndarray:
+        """Analytic lateral force for slip angles in degrees."""
+        if not self.params.slip_angle_in_degrees:
+            slip_angle_deg = np.radians(slip_angle_deg)
+        return super().lateral_force_batch(slip_angle_deg, Fz)
+
+    @staticmethod
+    def _bilinear(rows: list[list[float]], fi: float, fj: float) -> float:
+        """Bilinear interpolation at fractional indices (slip fi, load fj)."""
+        i = int(fi)
+        j = int(fj)
+        ti = fi - i
+        tj = fj - j
+        row0 = rows[j]
+        row1 = rows[j + 1]
+        f0 = row0[i] + (row0[i + 1] - row0[i]) * ti
+        f1 = row1[i] + (row1[i + 1] - row1[i]) * ti
+        return f0 + (f1 - f0) * tj
+
+    def longitudinal_force(self, slip_ratio: float, Fz: float) -> float:
+        """Interpolated longitudinal force (see PacejkaFormula.longitudinal_force)."""
+        if Fz <= 0:
+            return 0.0
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+
+        fi = (slip_ratio - self._sr_lo) * self._sr_inv_step
+        fj = Fz * self._load_inv_step
+        if not (0.0 <= fi < self._slip_last and fj < self._load_last):
+            return super().longitudinal_force(slip_ratio, Fz)
+
+        return self._bilinear(self._fx_rows, fi, fj)
+
+    def lateral_force(self, slip_angle: float, Fz: float, camber: float = 0.0) -> float:
+        """Interpolated lateral force (see PacejkaFormula.lateral_force).
+
+        Non-zero camber is not tabulated and uses the analytic formula.
+        """
+        if Fz <= 0:
+            return 0.0
+
+        slip_angle_deg = slip_angle
+        if not self.params.slip_angle_in_degrees:
+            slip_angle_deg = math.degrees(slip_angle)
+
+        fi = (slip_angle_deg - self._sa_lo) * self._sa_inv_step
+        fj = Fz * self._load_inv_step
+        if camber != 0.0 or not (0.0 <= fi < self._slip_last and fj < self._load_last):
+            return super().lateral_force(slip_angle, Fz, camber)
+
+        return self._bilinear(self._fy_rows, fi, fj)
+
+    def _bilinear_batch(
+        self,
+        table: np.ndarray,
+        fi: np.ndarray,
+        fj: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized bilinear interpolation at in-range fractional indices."""
+        i = fi.astype(np.intp)
+        j = fj.astype(np.intp)
+        ti = fi - i
+        tj = fj - j
+        f0 = table[j, i] + (table[j, i + 1] - table[j, i]) * ti
+        f1 = table[j + 1, i] + (table[j + 1, i + 1] - table[j + 1, i]) * ti
+        forces: np.ndarray = f0 + (f1 - f0) * tj
+        return forces
+
+    def longitudinal_force_batch(self, slip_ratio: ArrayLike, Fz: ArrayLike) -> np.ndarray:
+        """Interpolated longitudinal force for arrays of slip ratios and loads."""
+        slip_ratio, Fz = np.broadcast_arrays(
+            np.asarray(slip_ratio, dtype=float), np.asarray(Fz, dtype=float)
+        )
+        if self._params._version != self._params_version:
+            self.invalidate_cache()
+        fi = (slip_ratio - self._sr_lo) * self._sr_inv_step
+        fj = Fz * self._load_inv_step
+        in_table = (fi >= 0.0) & (fi < self._slip_last) & (fj >= 0.0) & (fj < self._load_last)
+
+        forces = np.zeros(slip_ratio.shape)
+        forces[in_table] = self._bilinear_batch(self._fx_table, fi[in_table], fj[in_table])
+
+        outside = ~in_table
+        if np.any(outside):
+            forces[outside] = super().longitudinal_force_batch(
+                slip_ratio[outside], Fz[outside]
+            )
+        return np.where(Fz > 0, forces, 0.0)
+
+    def lateral_force_batch(
+        self,
+        slip_angle: ArrayLike,
+        Fz: ArrayLike,
+        camber: ArrayLike = 0.0
+    ) -> np.ndarray:
+        """Interpolated lateral force for arrays of slip angles, loads and cambers."""
+        slip_angle, Fz, camber = np.broadcast_arrays(
+            np.asarray(slip_angle, dtype=float),
+            np.asarray(Fz, dtype=float),
+            np.asarray(camber, dtype=float)
+        )
+        slip_angle_deg = slip_angle
+        if not self.params.slip_angle_in_degrees:
+            slip_angle_deg = np.degrees(slip_angle)
+
+        fi = (slip_angle_deg - self._sa_lo) * self._sa_inv_step
+        fj = Fz * self._load_inv_step
+        in_table = (
+            (camber == 0.0) & (fi >= 0.0) & (fi < self._slip_last) &
+            (fj >= 0.0) & (fj < self._load_last)
+        )
+
+        forces = np.zeros(slip_angle.shape)
+        forces[in_table] = self._bilinear_batch(self._fy_table, fi[in_table], fj[in_table])
+
+        outside = ~in_table
+        if np.any(outside):
+            forces[outside] = super().lateral_force_batch(
+                slip_angle[outside], Fz[outside], camber[outside]
+            )
+        return np.where(Fz > 0, forces, 0.0)
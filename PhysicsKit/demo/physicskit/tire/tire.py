@@ -6,10 +6,16 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 from physicskit.core.vector import Vector3
-from physicskit.tire.pacejka import PacejkaParams, PacejkaFormula
+from physicskit.core.profiling import StageProfiler
+from physicskit.tire.pacejka import PacejkaParams
 from physicskit.tire.slip import SlipCalculator, SlipState
-from physicskit.tire.combined import CombinedSlip, CombinedForces
+from physicskit.tire.combined import CombinedForces
 from physicskit.tire.relaxation import TireRelaxation
+from physicskit.tire.registry import TireModelRegistry, create_tire_model, default_registry
+
+
+# Wheel spin update used by Tire.step (see TireConfig.wheel_integrator)
+WHEEL_INTEGRATORS = ("explicit", "implicit")
 
 
 @dataclass
@@ -41,6 +47,76 @@ class TireState:
     is_grounded: bool = True
 
 
+class TireStateView:
+    """Read-only live view of a Tire with the fields of TireState.
+
+    Each attribute reads the tire when accessed, so the view always shows
+    the last step without building a TireState. Use snapshot() for a
+    frozen copy.
+    """
+
+    __slots__ = ("_tire",)
+
+    def __init__(self, tire: Tire):
+        self._tire = tire
+
+    @property
+    def slip_ratio(self) -> float:
+        return self._tire._slip_state.slip_ratio
+
+    @property
+    def slip_angle(self) -> float:
+        return self._tire._slip_state.slip_angle
+
+    @property
+    def slip_angle_deg(self) -> float:
+        return self._tire._slip_state.slip_angle_deg
+
+    @property
+    def Fx(self) -> float:
+        return self._tire._Fx
+
+    @property
+    def Fy(self) -> float:
+        return self._tire._Fy
+
+    @property
+    def Fz(self) -> float:
+        return self._tire.normal_load
+
+    @property
+    def Fx_pure(self) -> float:
+        return self._tire._forces.Fx_pure
+
+    @property
+    def Fy_pure(self) -> float:
+        return self._tire._forces.Fy_pure
+
+    @property
+    def saturation(self) -> float:
+        return self._tire._forces.saturation
+
+    @property
+    def angular_velocity(self) -> float:
+        return self._tire.angular_velocity
+
+    @property
+    def rotation_angle(self) -> float:
+        return self._tire.rotation_angle
+
+    @property
+    def contact_velocity(self) -> float:
+        return self._tire._contact_speed
+
+    @property
+    def is_grounded(self) -> bool:
+        return self._tire.normal_load > 10.0
+
+    def snapshot(self) -> TireState:
+        """Frozen copy of the current state."""
+        return self._tire._get_state()
+
+
 @dataclass
 class TireConfig:
     """Configuration for a tire."""
@@ -52,6 +128,14 @@ class TireConfig:
     # Tire model parameters
     pacejka_params: PacejkaParams = field(default_factory=PacejkaParams.sport_tire)
 
+    # Force model backend: "analytic" (PacejkaFormula) or "tabulated" (TabulatedPacejka)
+    force_model: str = "analytic"
+    table_slip_points: int = 401   # Tabulated: grid points per slip axis
+    table_load_points: int = 61    # Tabulated: grid points along load axis
+
+    # Combined slip method passed to CombinedSlip.calculate: "simple", "vector" or "empirical"
+    combined_slip_method: str = "empirical"
+
     # Relaxation
     relaxation_length_x: float = 0.4  # Longitudinal (m)
     relaxation_length_y: float = 0.5  # Lateral (m)
@@ -60,6 +144,10 @@ class TireConfig:
     # Friction
     friction_mu: float = 1.0       # Overall friction multiplier
 
+    # Wheel spin update: "explicit", or "implicit" (linearly implicit in the
+    # slip stiffness, stable at larger timesteps)
+    wheel_integrator: str = "explicit"
+
     @classmethod
     def sport(cls) -> TireConfig:
         """Sport/performance tire configuration."""
@@ -96,22 +184,45 @@ class Tire:
     - Combined slip with friction ellipse
     - Relaxation length dynamics
     - Wheel rotation dynamics
+
+    The force model (Pacejka + combined slip) is shared through a
+    TireModelRegistry with every other tire of equal configuration; the
+    remaining sub-models and state are per wheel.
     """
 
-    def __init__(self, config: Optional[TireConfig] = None):
+    def __init__(
+        self,
+        config: Optional[TireConfig] = None,
+        registry: Optional[TireModelRegistry] = None,
+        shared: bool = True
+    ):
         """Initialize tire.
 
         Args:
             config: Tire configuration. Defaults to sport tire.
+            registry: Source of shared force models. Defaults to the
+                      module-wide registry. Shared models are frozen (see
+                      physicskit.tire.registry).
+            shared: If False, build a private model that is not frozen, so
+                    pacejka.params and combined_slip.friction_mu can be
+                    changed on this tire alone. registry is not used.
         """
         self.config = config or TireConfig.sport()
+        if self.config.wheel_integrator not in WHEEL_INTEGRATORS:
+            raise ValueError(
+                f"Unknown wheel integrator '{self.config.wheel_integrator}'. "
+                f"Available: {', '.join(WHEEL_INTEGRATORS)}"
+            )
 
-        # Sub-models
-        self.pacejka = PacejkaFormula(self.config.pacejka_params)
-        self.combined_slip = CombinedSlip(
-            self.pacejka,
-            friction_mu=self.config.friction_mu
-        )
+        # Shared sub-models
+        if shared:
+            self.model = (registry if registry is not None else default_registry).get(self.config)
+        else:
+            self.model = create_tire_model(self.config)
+        self.pacejka = self.model.pacejka
+        self.combined_slip = self.model.combined_slip
+
+        # Per-wheel sub-models
         self.relaxation = TireRelaxation(
             self.config.relaxation_length_x,
             self.config.relaxation_length_y
@@ -123,13 +234,24 @@ class Tire:
         self.normal_load: float = 4000.0    # N
         self.camber: float = 0.0            # degrees
 
-        # Cached slip state
+        # Slip and steady-state forces of the last step, updated in place
         self._slip_state = SlipState()
+        self._forces = CombinedForces()
+        self._contact_speed: float = 0.0
 
-        # Cached forces
+        # Forces after relaxation
         self._Fx: float = 0.0
         self._Fy: float = 0.0
 
+        # Wheel spin update (see TireConfig.wheel_integrator)
+        self._implicit_wheel = self.config.wheel_integrator == "implicit"
+
+        # Optional stage timing, usually attached through Car.set_profiler
+        self.profiler: Optional[StageProfiler] = None
+
+        # Live read-only view of the state, created once
+        self.state_view = TireStateView(self)
+
     def update(
         self,
         contact_velocity: Vector3,
@@ -141,6 +263,8 @@ class Tire:
     ) -> TireState:
         """Update tire state and calculate forces.
 
+        Same as step, but also builds and returns a TireState.
+
         Args:
             contact_velocity: Velocity at contact patch (world frame, m/s)
             wheel_heading: Direction wheel is pointing (radians)
@@ -152,48 +276,90 @@ class Tire:
         Returns:
             TireState with all tire information
         """
+        self.step(contact_velocity, wheel_heading, normal_load, drive_torque, brake_torque, dt)
+        return self._get_state()
+
+    def step(
+        self,
+        contact_velocity: Vector3,
+        wheel_heading: float,
+        normal_load: float,
+        drive_torque: float,
+        brake_torque: float,
+        dt: float
+    ) -> None:
+        """Advance the tire by one time step.
+
+        Slip and forces are written into per-tire state objects, so this
+        does not allocate; read results through get_forces_local, the state
+        property or the tire attributes.
+
+        Args:
+            contact_velocity: Velocity at contact patch (world frame, m/s)
+            wheel_heading: Direction wheel is pointing (radians)
+            normal_load: Vertical load on tire (N)
+            drive_torque: Torque from drivetrain (N*m, positive = forward)
+            brake_torque: Brake torque (N*m, always positive, resists rotation)
+            dt: Time step (seconds)
+        """
         self.normal_load = max(0.0, normal_load)
+        self._contact_speed = contact_velocity.magnitude_2d()
 
         # If no load, no forces
         if self.normal_load < 10.0:
             self._Fx = 0.0
             self._Fy = 0.0
-            return self._get_state(contact_velocity)
+            forces = self._forces
+            forces.Fx = forces.Fy = forces.Fx_pure = forces.Fy_pure = forces.saturation = 0.0
+            if self.profiler is not None:
+                self.profiler.lap("tire_idle")
+            return
 
         # Calculate slip quantities
-        self._slip_state = SlipCalculator.calculate_slip(
+        slip = SlipCalculator.calculate_slip_into(
+            self._slip_state,
             contact_velocity,
             wheel_heading,
             self.angular_velocity,
             self.config.radius
         )
+        prof = self.profiler
+        if prof is not None:
+            prof.lap("slip")
 
         # Calculate steady-state forces using combined slip
         forces = self.combined_slip.calculate(
-            self._slip_state.slip_ratio,
-            self._slip_state.slip_angle_deg,
+            slip.slip_ratio,
+            slip.slip_angle_deg,
             self.normal_load,
             self.camber,
-            method="empirical"
+            method=self.config.combined_slip_method,
+            out=self._forces
         )
+        if prof is not None:
+            prof.lap("combined_slip")
 
         # Apply relaxation if enabled
         if self.config.use_relaxation:
-            velocity_mag = contact_velocity.magnitude_2d()
             self._Fx, self._Fy = self.relaxation.update(
-                forces.Fx, forces.Fy, velocity_mag, dt
+                forces.Fx, forces.Fy, self._contact_speed, dt
             )
         else:
             self._Fx = forces.Fx
             self._Fy = forces.Fy
+        if prof is not None:
+            prof.lap("relaxation")
 
         # Update wheel angular velocity
-        self._update_wheel_rotation(drive_torque, brake_torque, dt)
+        if self._implicit_wheel:
+            self._update_wheel_rotation_implicit(drive_torque, brake_torque, dt)
+        else:
+            self._update_wheel_rotation(drive_torque, brake_torque, dt)
 
         # Update rotation angle for rendering
         self.rotation_angle += self.angular_velocity * dt
-
-        return self._get_state(contact_velocity, forces)
+        if prof is not None:
+            prof.lap("wheel_spin")
 
     def _update_wheel_rotation(
         self,
@@ -231,12 +397,79 @@ class Tire:
         if brake_torque > 0 and abs(self.angular_velocity) < 0.1:
             self.angular_velocity = max(0.0, self.angular_velocity)
 
-    def _get_state(
+    def _update_wheel_rotation_implicit(
         self,
-        contact_velocity: Vector3,
-        forces: Optional[CombinedForces] = None
-    ) -> TireState:
-        """Build TireState from current state."""
+        drive_torque: float,
+        brake_torque: float,
+        dt: float
+    ) -> None:
+        """Linearly implicit wheel update for large timesteps.
+
+        Fx depends on omega through the slip ratio, so the explicit update
+        oscillates and diverges once dt * R * dFx/d(omega) exceeds about
+        2 * I; the brake, a Coulomb torque switching sign with omega,
+        chatters around zero wheel speed at any dt. Here Fx is linearized
+        around the current omega, which adds dt * R * dFx/d(omega) to the
+        inertia, and the brake is applied implicitly: it stops the wheel if
+        it can within the step and otherwise removes its full torque. The
+        applied force then moves along the same slope, so the tire and the
+        body see the force the wheel was solved with.
+        """
+        config = self.config
+        stiffness = self._spin_stiffness()
+        inertia = config.inertia + dt * config.radius * stiffness
+
+        omega = self.angular_velocity
+        free = omega + dt * (drive_torque - self._Fx * config.radius) / inertia
+        brake_step = dt * brake_torque / inertia
+        if abs(free) <= brake_step:
+            new_omega = 0.0
+        else:
+            new_omega = free - math.copysign(brake_step, free)
+
+        if stiffness > 0.0:
+            d_fx = stiffness * (new_omega - omega)
+            self._Fx += d_fx
+            if config.use_relaxation:
+                self.relaxation.Fx += d_fx
+        self.angular_velocity = new_omega
+
+    def _spin_stiffness(self) -> float:
+        """Slope of the applied Fx with respect to omega over the last step.
+
+        Chains the Pacejka slip stiffness, the combined slip reduction and
+        d(slip ratio)/d(omega), times the relaxation gain when relaxation
+        is on. Negative slopes (past the force peak) are not stiff and
+        count as zero.
+        """
+        slip = self._slip_state
+        if abs(slip.slip_ratio) >= 1.0:
+            return 0.0    # Slip ratio is clamped, Fx no longer follows omega
+
+        radius = self.config.radius
+        vx = slip.forward_velocity
+        wheel_velocity = self.angular_velocity * radius
+        if abs(wheel_velocity) > abs(vx) and abs(wheel_velocity) > SlipCalculator.MIN_VELOCITY:
+            # SR = (w - vx) / |w|
+            dsr_domega = radius * math.copysign(vx, wheel_velocity) / (wheel_velocity * wheel_velocity)
+        else:
+            dsr_domega = radius / max(abs(vx), SlipCalculator.MIN_VELOCITY)
+
+        forces = self._forces
+        reduction = forces.Fx / forces.Fx_pure if abs(forces.Fx_pure) > 1.0 else 1.0
+        slope = (
+            self.pacejka.longitudinal_slip_stiffness(slip.slip_ratio, self.normal_load)
+            * self.combined_slip.friction_mu
+            * min(max(reduction, 0.0), 1.0)
+            * dsr_domega
+        )
+        if self.config.use_relaxation:
+            slope *= self.relaxation.gain_x
+        return max(slope, 0.0)
+
+    def _get_state(self) -> TireState:
+        """Build TireState from the state of the last step."""
+        forces = self._forces
         return TireState(
             slip_ratio=self._slip_state.slip_ratio,
             slip_angle=self._slip_state.slip_angle,
@@ -244,20 +477,21 @@ class Tire:
             Fx=self._Fx,
             Fy=self._Fy,
             Fz=self.normal_load,
-            Fx_pure=forces.Fx_pure if forces else self._Fx,
-            Fy_pure=forces.Fy_pure if forces else self._Fy,
-            saturation=forces.saturation if forces else 0.0,
+            Fx_pure=forces.Fx_pure,
+            Fy_pure=forces.Fy_pure,
+            saturation=forces.saturation,
             angular_velocity=self.angular_velocity,
             rotation_angle=self.rotation_angle,
-            contact_velocity=contact_velocity.magnitude_2d(),
+            contact_velocity=self._contact_speed,
             is_grounded=self.normal_load > 10.0
         )
 
-    def get_forces_world(self, wheel_heading: float) -> Vector3:
+    def get_forces_world(self, wheel_heading: float, out: Optional[Vector3] = None) -> Vector3:
         """Get tire forces in world coordinates.
 
         Args:
             wheel_heading: Direction wheel is pointing (radians)
+            out: Vector to write the result into instead of allocating one
 
         Returns:
             Force vector in world frame
@@ -270,7 +504,9 @@ class Tire:
         world_x = self._Fx * cos_h - self._Fy * sin_h
         world_y = self._Fx * sin_h + self._Fy * cos_h
 
-        return Vector3(world_x, world_y, 0.0)
+        if out is None:
+            return Vector3(world_x, world_y, 0.0)
+        return out.set(world_x, world_y)
 
     def get_forces_local(self) -> tuple[float, float]:
         """Get tire forces in tire frame.
@@ -288,6 +524,8 @@ class Tire:
         self._Fx = 0.0
         self._Fy = 0.0
         self._slip_state = SlipState()
+        self._forces = CombinedForces()
+        self._contact_speed = 0.0
         self.relaxation.reset()
 
     def set_angular_velocity_from_speed(self, speed: float) -> None:
@@ -299,8 +537,8 @@ class Tire:
 
     @property
     def state(self) -> TireState:
-        """Get current tire state."""
-        return self._get_state(Vector3())
+        """Get current tire state (built on demand)."""
+        return self._get_state()
 
     @property
     def slip_ratio(self) -> float:
@@ -5,6 +5,8 @@ from physicskit.vehicle.steering import Steering
 from physicskit.vehicle.drivetrain import Drivetrain, DifferentialType
 from physicskit.vehicle.handbrake import Handbrake
 from physicskit.vehicle.car import Car, CarConfig, WheelPosition
+from physicskit.vehicle.geometry import WheelGeometry, WheelMap
+from physicskit.vehicle.fleet import FleetWorld
 
 __all__ = [
     "Suspension",
@@ -16,4 +18,7 @@ __all__ = [
     "Car",
     "CarConfig",
     "WheelPosition",
+    "WheelGeometry",
+    "WheelMap",
+    "FleetWorld",
 ]
@@ -15,11 +15,15 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
+from typing import Optional
 
-from physicskit.core.vector import Vector3
+from physicskit.core.vector import Vector2, Vector3
 from physicskit.core.rigid_body import RigidBody
-from physicskit.tire.tire import Tire, TireConfig, TireState
+from physicskit.core.profiling import StageProfiler
+from physicskit.core.integrators import (
+    DormandPrince, IntegratorStats, IntegratorType, explicit_euler, rk4_array
+)
+from physicskit.tire.tire import Tire, TireConfig, TireState, TireStateView
 from physicskit.tire.pacejka import PacejkaParams
 from physicskit.vehicle.suspension import (
     Suspension, SuspensionConfig, WheelLoads, WheelPosition
@@ -29,6 +33,15 @@ from physicskit.vehicle.drivetrain import (
     Drivetrain, DrivetrainConfig, DifferentialType, DriveType
 )
 from physicskit.vehicle.handbrake import Handbrake, HandbrakeConfig
+from physicskit.vehicle.geometry import (
+    WHEEL_INDEX, WheelGeometry, WheelMap, build_wheel_geometry
+)
+from physicskit.vehicle.dynamics import STATE_SCALE, CarDynamics
+
+# Air resistance, shared by Car.physics_step, CarDynamics and FleetWorld
+DRAG_COEFFICIENT = 0.3
+FRONTAL_AREA = 2.2             # m^2
+AIR_DENSITY = 1.225            # kg/m^3
 
 
 @dataclass
@@ -147,6 +160,124 @@ class CarState:
     handbrake: float = 0.0
 
 
+class CarStateView:
+    """Read-only live view of a Car with the fields of CarState.
+
+    Each attribute reads the car when accessed, so one view (see
+    Car.get_state_view) serves every consumer of a frame without copying.
+    position, velocity and wheel_loads are the car's own objects and
+    tire_* are live TireStateViews: treat them as read-only, and call
+    snapshot() when a frozen CarState is needed.
+    """
+
+    __slots__ = ("_car",)
+
+    def __init__(self, car: Car):
+        self._car = car
+
+    # Body state
+    @property
+    def position(self) -> Vector3:
+        return self._car.body.position
+
+    @property
+    def orientation(self) -> float:
+        return self._car.body.orientation
+
+    @property
+    def velocity(self) -> Vector3:
+        return self._car.body.velocity
+
+    @property
+    def angular_velocity(self) -> float:
+        return self._car.body.angular_velocity
+
+    # Derived quantities
+    @property
+    def speed(self) -> float:
+        return self._car.body.get_speed()
+
+    @property
+    def forward_speed(self) -> float:
+        return self._car.body.get_forward_speed()
+
+    @property
+    def lateral_speed(self) -> float:
+        return self._car.body.get_lateral_speed()
+
+    # Accelerations
+    @property
+    def longitudinal_accel(self) -> float:
+        return self._car._longitudinal_accel
+
+    @property
+    def lateral_accel(self) -> float:
+        return self._car._lateral_accel
+
+    # Wheel loads and tires
+    @property
+    def wheel_loads(self) -> WheelLoads:
+        return self._car._wheel_loads
+
+    @property
+    def tire_FL(self) -> TireStateView:
+        return self._car.wheels[0].state_view
+
+    @property
+    def tire_FR(self) -> TireStateView:
+        return self._car.wheels[1].state_view
+
+    @property
+    def tire_RL(self) -> TireStateView:
+        return self._car.wheels[2].state_view
+
+    @property
+    def tire_RR(self) -> TireStateView:
+        return self._car.wheels[3].state_view
+
+    # Inputs
+    @property
+    def throttle(self) -> float:
+        return self._car._throttle
+
+    @property
+    def brake(self) -> float:
+        return self._car._brake
+
+    @property
+    def steer(self) -> float:
+        return self._car._steer
+
+    @property
+    def handbrake(self) -> float:
+        return self._car._handbrake
+
+    def snapshot(self) -> CarState:
+        """Frozen copy of the current state."""
+        car = self._car
+        body = car.body
+        return CarState(
+            position=body.position.copy(),
+            orientation=body.orientation,
+            velocity=body.velocity.copy(),
+            angular_velocity=body.angular_velocity,
+            speed=body.get_speed(),
+            forward_speed=body.get_forward_speed(),
+            lateral_speed=body.get_lateral_speed(),
+            longitudinal_accel=car._longitudinal_accel,
+            lateral_accel=car._lateral_accel,
+            wheel_loads=car._wheel_loads.copy(),
+            tire_FL=car.wheels[0].state,
+            tire_FR=car.wheels[1].state,
+            tire_RL=car.wheels[2].state,
+            tire_RR=car.wheels[3].state,
+            throttle=car._throttle,
+            brake=car._brake,
+            steer=car._steer,
+            handbrake=car._handbrake
+        )
+
+
 class Car:
     """Complete 4-wheel vehicle model for physics simulation.
 
@@ -168,6 +299,9 @@ class Car:
             inertia=self.config.inertia
         )
 
+        # Fixed per-wheel geometry, indexed by wheel index
+        self.wheel_geometry: tuple[WheelGeometry, ...] = build_wheel_geometry(self.config)
+
         # Create subsystems
         self._init_suspension()
         self._init_steering()
@@ -187,6 +321,39 @@ class Car:
         self._longitudinal_accel: float = 0.0
         self._lateral_accel: float = 0.0
 
+        # Scratch vectors reused by physics_step so the wheel loop does not
+        # allocate: wheel offsets from the CG rotated into the world frame
+        self._wheel_offsets: tuple[Vector2, ...] = tuple(
+            geom.offset() for geom in self.wheel_geometry
+        )
+        self._wheel_offsets_world: tuple[Vector2, ...] = tuple(
+            Vector2() for _ in self.wheel_geometry
+        )
+        self._wheels_world: tuple[tuple[WheelGeometry, Tire, Vector2], ...] = tuple(
+            zip(self.wheel_geometry, self.wheels, self._wheel_offsets_world)
+        )
+        self._scratch_velocity = Vector3()
+        self._scratch_force = Vector3()
+
+        # Live read-only state view, created once
+        self._state_view = CarStateView(self)
+
+        # Optional stage timing (see core.profiling)
+        self.profiler: Optional[StageProfiler] = None
+        self.profiler_track: int = 0
+
+        # Integration method (see set_integrator)
+        self.integrator = IntegratorType.SEMI_IMPLICIT_EULER
+        self.integrator_stats = IntegratorStats()
+        self._dynamics: Optional[CarDynamics] = None
+        self._adaptive: Optional[DormandPrince] = None
+
+        # Wheel/tire sub-steps per physics_step (see set_wheel_substeps)
+        self.wheel_substeps: int = 1
+        self._substep_contacts: tuple[Vector3, ...] = tuple(
+            Vector3() for _ in self.wheel_geometry
+        )
+
     def _init_suspension(self) -> None:
         """Initialize suspension system."""
         self.suspension = Suspension(SuspensionConfig(
@@ -228,13 +395,15 @@ class Car:
         ))
 
     def _init_tires(self) -> None:
-        """Initialize tires."""
-        self.tires: Dict[WheelPosition, Tire] = {
-            WheelPosition.FRONT_LEFT: Tire(self.config.tire_config),
-            WheelPosition.FRONT_RIGHT: Tire(self.config.tire_config),
-            WheelPosition.REAR_LEFT: Tire(self.config.tire_config),
-            WheelPosition.REAR_RIGHT: Tire(self.config.tire_config),
-        }
+        """Initialize tires.
+
+        wheels holds the tires in wheel index order (FL, FR, RL, RR); tires
+        is a read-only WheelPosition-keyed view of the same objects.
+        """
+        self.wheels: tuple[Tire, ...] = tuple(
+            Tire(self.config.tire_config) for _ in self.wheel_geometry
+        )
+        self.tires: WheelMap[Tire] = WheelMap(self.wheels)
 
     def set_inputs(
         self,
@@ -256,24 +425,83 @@ class Car:
         self._steer = max(-1.0, min(1.0, steer))
         self._handbrake = max(0.0, min(1.0, handbrake))
 
+    def set_profiler(self, profiler: Optional[StageProfiler], track: int = 0) -> None:
+        """Attach a stage profiler to this car and its tires (None detaches).
+
+        Args:
+            profiler: Profiler to record physics_step stages into
+            track: Timeline row for this car in trace exports
+        """
+        self.profiler = profiler
+        self.profiler_track = track
+        for tire in self.wheels:
+            tire.profiler = profiler
+
+    def set_integrator(
+        self,
+        integrator: IntegratorType,
+        rtol: float = 1e-6,
+        atol: float = 1e-6,
+        max_dt: float = math.inf
+    ) -> None:
+        """Choose how physics_step integrates the car.
+
+        SEMI_IMPLICIT_EULER and EXPLICIT_EULER update the body after the
+        tires step individually. RK4 and DORMAND_PRINCE integrate the full
+        state (body, wheel spins, relaxed tire forces) as one ODE with the
+        step's steering, loads and torques held fixed; DORMAND_PRINCE
+        subdivides each physics_step adaptively to meet the tolerances and
+        records its steps in integrator_stats.
+
+        Args:
+            integrator: Integration method
+            rtol: DORMAND_PRINCE relative tolerance
+            atol: DORMAND_PRINCE absolute tolerance, scaled per state
+                  component (forces by 1000 N, angles by 0.1 rad)
+            max_dt: DORMAND_PRINCE largest internal step (seconds)
+        """
+        self.integrator = IntegratorType(integrator)
+        self.integrator_stats = IntegratorStats()
+        self._dynamics = None
+        self._adaptive = None
+        if self.integrator in (IntegratorType.RK4, IntegratorType.DORMAND_PRINCE):
+            self._dynamics = CarDynamics(self)
+        if self.integrator is IntegratorType.DORMAND_PRINCE:
+            self._adaptive = DormandPrince(rtol=rtol, atol=atol * STATE_SCALE, max_dt=max_dt)
+            self.integrator_stats = self._adaptive.stats
+
+    def set_wheel_substeps(self, substeps: int) -> None:
+        """Sub-step the wheels and tires under a slower chassis step.
+
+        With substeps > 1, each physics_step(dt) advances wheel spin, slip,
+        tire forces and relaxation substeps times at dt / substeps with the
+        body velocity, wheel loads and steering frozen, then integrates the
+        body once at dt with the tire forces averaged over the sub-steps.
+        Drive and handbrake torques follow the wheel speeds every sub-step.
+        RK4 and DORMAND_PRINCE integrate the wheels with the body and
+        ignore this setting.
+
+        Args:
+            substeps: Wheel sub-steps per physics step (1 = single-rate)
+        """
+        if substeps < 1:
+            raise ValueError(f"substeps must be >= 1, got {substeps}")
+        self.wheel_substeps = int(substeps)
+
     def get_wheel_position_local(self, wheel: WheelPosition) -> Vector3:
         """Get wheel position in local (body) coordinates."""
-        cfg = self.config
-
-        if wheel == WheelPosition.FRONT_LEFT:
-            return Vector3(cfg.cg_to_front, cfg.track_front / 2, 0)
-        elif wheel == WheelPosition.FRONT_RIGHT:
-            return Vector3(cfg.cg_to_front, -cfg.track_front / 2, 0)
-        elif wheel == WheelPosition.REAR_LEFT:
-            return Vector3(-(cfg.wheelbase - cfg.cg_to_front), cfg.track_rear / 2, 0)
-        else:  # REAR_RIGHT
-            return Vector3(-(cfg.wheelbase - cfg.cg_to_front), -cfg.track_rear / 2, 0)
+        geom = self.wheel_geometry[WHEEL_INDEX[wheel]]
+        return Vector3(geom.x, geom.y, 0.0)
 
     def get_wheel_position_world(self, wheel: WheelPosition) -> Vector3:
         """Get wheel position in world coordinates."""
         local = self.get_wheel_position_local(wheel)
         return self.body.local_to_world(local)
 
+    def get_wheel_positions_world(self) -> list[Vector3]:
+        """Get all wheel positions in world coordinates (WheelPosition order)."""
+        return self.body.local_to_world_batch(self._wheel_offsets)
+
     def physics_step(self, dt: float) -> None:
         """Perform one physics simulation step.
 
@@ -287,173 +515,293 @@ class Car:
         Args:
             dt: Time step in seconds
         """
+        prof = self.profiler
+        if prof is not None:
+            prof.start(self.profiler_track)
+
         # Update subsystems
         self.steering.set_input(self._steer)
         self.steering.update(dt)
         self.handbrake.set_input(self._handbrake)
         self.handbrake.update(dt)
+        if prof is not None:
+            prof.lap("steering")
 
         # Calculate accelerations for weight transfer
         self._update_accelerations(dt)
 
         # Get wheel loads
-        self._wheel_loads = self.suspension.calculate_loads_simple(
+        self.suspension.calculate_loads_simple(
             self._longitudinal_accel,
-            self._lateral_accel
+            self._lateral_accel,
+            out=self._wheel_loads
         )
+        if prof is not None:
+            prof.lap("load_transfer")
 
         # Get steering angles
         steer_left, steer_right = self.steering.get_wheel_angles()
 
         # Get drive and brake torques
-        rear_wheel_speeds = (
-            self.tires[WheelPosition.REAR_LEFT].angular_velocity,
-            self.tires[WheelPosition.REAR_RIGHT].angular_velocity
-        )
-        drive_torque_L, drive_torque_R = self.drivetrain.get_drive_torques(
+        wheels = self.wheels
+        rear_wheel_speeds = (wheels[2].angular_velocity, wheels[3].angular_velocity)
+        drive_torques = self.drivetrain.get_drive_torques(
             self._throttle, rear_wheel_speeds
         )
-        brake_FL, brake_FR, brake_RL, brake_RR = self.drivetrain.get_brake_torques(
-            self._brake
-        )
+        brake_torques = self.drivetrain.get_brake_torques(self._brake)
 
         # Handbrake torques (rear only)
-        hb_L, hb_R = self.handbrake.get_brake_torques(rear_wheel_speeds)
+        handbrake_torques = self.handbrake.get_brake_torques(rear_wheel_speeds)
+        if prof is not None:
+            prof.lap("drivetrain")
+
+        dynamics = self._dynamics
+        if dynamics is not None:
+            self._integrate_state(
+                dynamics, dt, (steer_left, steer_right), drive_torques, brake_torques,
+                handbrake_torques
+            )
+            if prof is not None:
+                prof.lap("body_integration")
+            self._update_engine(dt)
+            if prof is not None:
+                prof.lap("engine")
+                prof.finish()
+            return
 
         # Process each tire
-        total_force = Vector3()
+        body = self.body
+        body.rotate_offsets_into(self._wheel_offsets, self._wheel_offsets_world)
+        contact_velocity = self._scratch_velocity
+        tire_force_world = self._scratch_force
+        total_fx = 0.0
+        total_fy = 0.0
         total_torque = 0.0
+        steer_angles = (steer_left, steer_right)
+        loads = self._wheel_loads.values
+        orientation = body.orientation
 
-        for wheel in WheelPosition:
-            tire = self.tires[wheel]
-            local_pos = self.get_wheel_position_local(wheel)
-            world_pos = self.body.local_to_world(local_pos)
-
-            # Get velocity at wheel
-            contact_velocity = self.body.get_velocity_at_point(world_pos)
-
-            # Wheel heading (body heading + steering for front wheels)
-            if wheel in (WheelPosition.FRONT_LEFT, WheelPosition.FRONT_RIGHT):
-                if wheel == WheelPosition.FRONT_LEFT:
-                    wheel_heading = self.body.orientation + steer_left
-                else:
-                    wheel_heading = self.body.orientation + steer_right
-            else:
-                wheel_heading = self.body.orientation
-
-            # Get normal load
-            normal_load = self._wheel_loads.get(wheel)
-
-            # Get drive and brake torques for this wheel
-            if wheel == WheelPosition.REAR_LEFT:
-                drive_torque = drive_torque_L
-                brake_torque = brake_RL + hb_L
-            elif wheel == WheelPosition.REAR_RIGHT:
-                drive_torque = drive_torque_R
-                brake_torque = brake_RR + hb_R
-            elif wheel == WheelPosition.FRONT_LEFT:
-                drive_torque = 0.0  # RWD
-                brake_torque = brake_FL
-            else:  # FRONT_RIGHT
-                drive_torque = 0.0
-                brake_torque = brake_FR
-
-            # Update tire and get forces
-            tire_state = tire.update(
-                contact_velocity,
-                wheel_heading,
-                normal_load,
-                drive_torque,
-                brake_torque,
-                dt
+        if self.wheel_substeps > 1:
+            total_fx, total_fy, total_torque = self._step_tires_substepped(
+                dt, steer_angles, drive_torques, brake_torques, handbrake_torques
             )
-
-            # Get tire forces in world frame
-            tire_force_world = tire.get_forces_world(wheel_heading)
-
-            # Accumulate forces
-            total_force += tire_force_world
-
-            # Calculate torque from this tire
-            # Torque = r x F (in 2D, this is the z-component)
-            r = world_pos - self.body.position
-            tire_torque = r.x * tire_force_world.y - r.y * tire_force_world.x
-            total_torque += tire_torque
+        else:
+            for geom, tire, offset_world in self._wheels_world:
+                # Velocity at the wheel
+                body.get_velocity_at_point_into(contact_velocity, offset_world.x, offset_world.y)
+
+                # Wheel heading (body heading + steering for front wheels)
+                if geom.steered:
+                    wheel_heading = orientation + steer_angles[geom.side]
+                else:
+                    wheel_heading = orientation
+
+                # Get normal load
+                normal_load = loads[geom.index]
+
+                # Get drive and brake torques for this wheel
+                drive_torque = drive_torques[geom.side] if geom.driven else 0.0
+                brake_torque = brake_torques[geom.index]
+                if geom.handbrake:
+                    brake_torque += handbrake_torques[geom.side]
+
+                if prof is not None:
+                    prof.lap("tire_kinematics")
+
+                # Update tire and get forces
+                tire.step(
+                    contact_velocity,
+                    wheel_heading,
+                    normal_load,
+                    drive_torque,
+                    brake_torque,
+                    dt
+                )
+
+                # Get tire forces in world frame
+                tire.get_forces_world(wheel_heading, out=tire_force_world)
+
+                # Accumulate forces
+                total_fx += tire_force_world.x
+                total_fy += tire_force_world.y
+
+                # Calculate torque from this tire
+                # Torque = r x F (in 2D, this is the z-component)
+                total_torque += offset_world.x * tire_force_world.y - offset_world.y * tire_force_world.x
+                if prof is not None:
+                    prof.lap("force_accumulation")
 
         # Apply forces to body
-        self.body.apply_force(total_force)
-        self.body.apply_torque(total_torque)
+        body.add_force_xy(total_fx, total_fy)
+        body.apply_torque(total_torque)
 
         # Add air resistance (simplified)
-        speed = self.body.velocity.magnitude()
+        speed = body.velocity.magnitude()
         if speed > 0.1:
-            drag_coefficient = 0.3
-            frontal_area = 2.2
-            air_density = 1.225
-            drag_force = 0.5 * drag_coefficient * frontal_area * air_density * speed * speed
-            drag_direction = self.body.velocity.normalized() * (-1)
-            self.body.apply_force(drag_direction * drag_force)
+            drag_force = 0.5 * DRAG_COEFFICIENT * FRONTAL_AREA * AIR_DENSITY * speed * speed
+            scale = -drag_force / speed
+            body.add_force_xy(body.velocity.x * scale, body.velocity.y * scale)
 
         # Integrate
-        self.body.integrate(dt)
-
-        # Update engine RPM
-        avg_rear_speed = (
-            self.tires[WheelPosition.REAR_LEFT].angular_velocity +
-            self.tires[WheelPosition.REAR_RIGHT].angular_velocity
-        ) / 2
+        if self.integrator is IntegratorType.EXPLICIT_EULER:
+            explicit_euler(body, dt)
+        else:
+            body.integrate(dt)
+        if prof is not None:
+            prof.lap("body_integration")
+
+        self._update_engine(dt)
+        if prof is not None:
+            prof.lap("engine")
+            prof.finish()
+
+    def _step_tires_substepped(
+        self,
+        dt: float,
+        steer_angles: tuple[float, float],
+        drive_torques: tuple[float, float],
+        brake_torques: tuple[float, float, float, float],
+        handbrake_torques: tuple[float, float]
+    ) -> tuple[float, float, float]:
+        """Step the tires wheel_substeps times with the body frozen.
+
+        Returns:
+            (world Fx, world Fy, yaw torque) averaged over the sub-steps
+        """
+        prof = self.profiler
+        substeps = self.wheel_substeps
+        h = dt / substeps
+        body = self.body
+        orientation = body.orientation
+        loads = self._wheel_loads.values
+        wheels = self.wheels
+        contacts = self._substep_contacts
+        for geom, _, offset_world in self._wheels_world:
+            body.get_velocity_at_point_into(contacts[geom.index], offset_world.x, offset_world.y)
+
+        sum_fx = [0.0] * len(wheels)
+        sum_fy = [0.0] * len(wheels)
+        for k in range(substeps):
+            if k:
+                rear_wheel_speeds = (wheels[2].angular_velocity, wheels[3].angular_velocity)
+                drive_torques = self.drivetrain.get_drive_torques(
+                    self._throttle, rear_wheel_speeds
+                )
+                handbrake_torques = self.handbrake.get_brake_torques(rear_wheel_speeds)
+
+            for geom, tire, _ in self._wheels_world:
+                i = geom.index
+                wheel_heading = orientation + steer_angles[geom.side] if geom.steered else orientation
+                drive_torque = drive_torques[geom.side] if geom.driven else 0.0
+                brake_torque = brake_torques[geom.index]
+                if geom.handbrake:
+                    brake_torque += handbrake_torques[geom.side]
+                if prof is not None:
+                    prof.lap("tire_kinematics")
+
+                tire.step(contacts[i], wheel_heading, loads[i], drive_torque, brake_torque, h)
+                fx, fy = tire.get_forces_local()
+                sum_fx[i] += fx
+                sum_fy[i] += fy
+                if prof is not None:
+                    prof.lap("force_accumulation")
+
+        # Headings are fixed over the step, so the mean world force is the
+        # mean tire-frame force rotated once
+        total_fx = 0.0
+        total_fy = 0.0
+        total_torque = 0.0
+        for geom, _, offset_world in self._wheels_world:
+            i = geom.index
+            wheel_heading = orientation + steer_angles[geom.side] if geom.steered else orientation
+            cos_h = math.cos(wheel_heading)
+            sin_h = math.sin(wheel_heading)
+            fx = sum_fx[i] / substeps
+            fy = sum_fy[i] / substeps
+            force_x = fx * cos_h - fy * sin_h
+            force_y = fx * sin_h + fy * cos_h
+            total_fx += force_x
+            total_fy += force_y
+            total_torque += offset_world.x * force_y - offset_world.y * force_x
+        return total_fx, total_fy, total_torque
+
+    def _update_engine(self, dt: float) -> None:
+        """Engine RPM follows the driven (rear) wheels."""
+        wheels = self.wheels
+        avg_rear_speed = (wheels[2].angular_velocity + wheels[3].angular_velocity) / 2
         self.drivetrain.update_engine_rpm(avg_rear_speed, dt)
 
+    def _integrate_state(
+        self,
+        dynamics: CarDynamics,
+        dt: float,
+        steer_angles: tuple[float, float],
+        drive_torques: tuple[float, float],
+        brake_torques: tuple[float, float, float, float],
+        handbrake_torques: tuple[float, float]
+    ) -> None:
+        """Advance body and wheels as one ODE (RK4 or DORMAND_PRINCE)."""
+        wheel_brake_torques = tuple(
+            brake_torques[geom.index]
+            + (handbrake_torques[geom.side] if geom.handbrake else 0.0)
+            for geom in self.wheel_geometry
+        )
+        dynamics.hold_inputs(
+            steer_angles, self._wheel_loads.as_tuple(), drive_torques, wheel_brake_torques
+        )
+        y = dynamics.pack()
+
+        if self._adaptive is not None:
+            y = self._adaptive.integrate(dynamics.derivative, y, dt)
+        else:
+            y = rk4_array(dynamics.derivative, y, dt)
+            stats = self.integrator_stats
+            stats.steps += 1
+            stats.evaluations += 4
+            stats.min_dt = min(stats.min_dt, dt)
+            stats.max_dt = max(stats.max_dt, dt)
+
+        dynamics.unpack(y, dt)
+
     def _update_accelerations(self, dt: float) -> None:
         """Calculate accelerations for weight transfer."""
         if dt <= 0:
             return
 
         # Calculate acceleration from velocity change
-        dv = self.body.velocity - self._prev_velocity
-        world_accel = dv / dt
+        velocity = self.body.velocity
+        ax = (velocity.x - self._prev_velocity.x) / dt
+        ay = (velocity.y - self._prev_velocity.y) / dt
 
         # Transform to local frame
-        local_accel = self.body.world_to_local_direction(world_accel)
+        cos_h, sin_h = self.body.basis
+        local_ax = ax * cos_h + ay * sin_h
+        local_ay = -ax * sin_h + ay * cos_h
 
         # Smooth the acceleration values
         alpha = min(1.0, dt * 10)  # ~0.1s time constant
-        self._longitudinal_accel += (local_accel.x - self._longitudinal_accel) * alpha
-        self._lateral_accel += (local_accel.y - self._lateral_accel) * alpha
+        self._longitudinal_accel += (local_ax - self._longitudinal_accel) * alpha
+        self._lateral_accel += (local_ay - self._lateral_accel) * alpha
 
-        self._prev_velocity = self.body.velocity.copy()
+        self._prev_velocity.set(velocity.x, velocity.y, velocity.z)
 
     def get_state(self) -> CarState:
-        """Get complete vehicle state."""
-        local_vel = self.body.get_local_velocity()
+        """Get complete vehicle state (a frozen copy).
 
-        return CarState(
-            position=self.body.position.copy(),
-            orientation=self.body.orientation,
-            velocity=self.body.velocity.copy(),
-            angular_velocity=self.body.angular_velocity,
-            speed=self.body.get_speed(),
-            forward_speed=local_vel.x,
-            lateral_speed=local_vel.y,
-            longitudinal_accel=self._longitudinal_accel,
-            lateral_accel=self._lateral_accel,
-            wheel_loads=self._wheel_loads,
-            tire_FL=self.tires[WheelPosition.FRONT_LEFT].state,
-            tire_FR=self.tires[WheelPosition.FRONT_RIGHT].state,
-            tire_RL=self.tires[WheelPosition.REAR_LEFT].state,
-            tire_RR=self.tires[WheelPosition.REAR_RIGHT].state,
-            throttle=self._throttle,
-            brake=self._brake,
-            steer=self._steer,
-            handbrake=self._handbrake
-        )
+        For per-frame reads prefer get_state_view, which copies nothing.
+        """
+        return self._state_view.snapshot()
+
+    def get_state_view(self) -> CarStateView:
+        """Get the live, read-only view of the vehicle state."""
+        return self._state_view
 
     def get_drift_angle(self) -> float:
         """Get current drift angle (body slip angle) in degrees."""
-        local_vel = self.body.get_local_velocity()
-        if abs(local_vel.x) < 0.5:
+        forward_speed = self.body.get_forward_speed()
+        if abs(forward_speed) < 0.5:
             return 0.0
-        return math.degrees(math.atan2(local_vel.y, local_vel.x))
+        return math.degrees(math.atan2(self.body.get_lateral_speed(), forward_speed))
 
     def reset(self, position: Vector3 = None, orientation: float = 0.0) -> None:
         """Reset vehicle to initial state.
@@ -467,7 +815,7 @@ class Car:
             self.body.position = position.copy()
         self.body.orientation = orientation
 
-        for tire in self.tires.values():
+        for tire in self.wheels:
             tire.reset()
 
         self.handbrake.reset()
@@ -482,6 +830,11 @@ class Car:
         self._lateral_accel = 0.0
         self._wheel_loads = self.suspension.get_static_loads()
 
+        if self._adaptive is not None:
+            self._adaptive.reset()
+        else:
+            self.integrator_stats.reset()
+
     def set_velocity(self, speed: float, direction: float = None) -> None:
         """Set vehicle velocity.
 
@@ -501,5 +854,5 @@ class Car:
         )
 
         # Match wheel speeds to avoid initial slip
-        for tire in self.tires.values():
+        for tire in self.wheels:
             tire.set_angular_velocity_from_speed(speed)
@@ -0,0 +1,227 @@
+"""The car's continuous state as an ODE, for the higher-order integrators.
+
+Car.physics_step normally advances the body and each tire with
+first-order updates. For IntegratorType.RK4 and DORMAND_PRINCE it packs
+the full continuous state into one array and integrates y' = f(y) instead:
+
+    0-2    x, y, orientation           (m, m, rad)
+    3-5    vx, vy, yaw rate            (m/s, m/s, rad/s)
+    6-9    wheel angular velocities    (rad/s, FL FR RL RR)
+    10-13  relaxed longitudinal forces (N)
+    14-17  relaxed lateral forces      (N)
+
+Inputs that the car updates once per step (steering angles, wheel loads,
+drive and brake torques) are held constant over the step.
+"""
+
+from __future__ import annotations
+import math
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from physicskit.core.vector import Vector3, normalize_angle
+from physicskit.tire.slip import SlipCalculator
+from physicskit.vehicle import car as car_module  # Module import: car imports this module
+
+if TYPE_CHECKING:
+    from physicskit.vehicle.car import Car
+
+
+STATE_SIZE = 18
+WHEEL_SPEED = slice(6, 10)
+RELAXED_FX = slice(10, 14)
+RELAXED_FY = slice(14, 18)
+
+# Per-component magnitudes the absolute tolerance is scaled by
+STATE_SCALE = np.array(
+    [1.0, 1.0, 0.1, 1.0, 1.0, 0.1] + [1.0] * 4 + [1000.0] * 8
+)
+
+# Below this load a tire produces no force (matches Tire.step)
+MIN_LOAD = 10.0
+
+
+class CarDynamics:
+    """Derivative of a Car's full state with per-step inputs held fixed."""
+
+    def __init__(self, car: Car):
+        self.car = car
+        self._contact = Vector3()
+        self._steer = (0.0, 0.0)
+        self._loads: Sequence[float] = (0.0,) * 4
+        self._drive = (0.0, 0.0)
+        self._brake: Sequence[float] = (0.0,) * 4
+        self._drag = (
+            0.5 * car_module.DRAG_COEFFICIENT * car_module.FRONTAL_AREA * car_module.AIR_DENSITY
+        )
+
+    def hold_inputs(
+        self,
+        steer_angles: tuple[float, float],
+        loads: Sequence[float],
+        drive_torques: tuple[float, float],
+        brake_torques: Sequence[float]
+    ) -> None:
+        """Fix the inputs for the next integration step.
+
+        Args:
+            steer_angles: (left, right) front wheel steer angles (rad)
+            loads: Normal load per wheel (N)
+            drive_torques: (left, right) rear drive torques (N*m)
+            brake_torques: Brake plus handbrake torque per wheel (N*m)
+        """
+        self._steer = steer_angles
+        self._loads = loads
+        self._drive = drive_torques
+        self._brake = brake_torques
+
+    def pack(self) -> np.ndarray:
+        """Current car state as an array."""
+        car = self.car
+        body = car.body
+        y = np.empty(STATE_SIZE)
+        y[0:6] = (
+            body.position.x, body.position.y, body.orientation,
+            body.velocity.x, body.velocity.y, body.angular_velocity,
+        )
+        for i, tire in enumerate(car.wheels):
+            y[6 + i] = tire.angular_velocity
+            y[10 + i] = tire.relaxation.Fx
+            y[14 + i] = tire.relaxation.Fy
+        return y
+
+    def derivative(self, y: np.ndarray) -> np.ndarray:
+        """Time derivative of a state.
+
+        As a side effect each tire's slip and steady-state force objects
+        hold the values of this evaluation.
+        """
+        car = self.car
+        body = car.body
+        x, _, orientation, vx, vy, yaw_rate = y[0:6].tolist()
+        wheel_speed = y[WHEEL_SPEED].tolist()
+        relaxed_fx = y[RELAXED_FX].tolist()
+        relaxed_fy = y[RELAXED_FY].tolist()
+
+        cos_o = math.cos(orientation)
+        sin_o = math.sin(orientation)
+        contact = self._contact
+
+        dy = np.zeros(STATE_SIZE)
+        total_fx = 0.0
+        total_fy = 0.0
+        total_torque = 0.0
+
+        for geom, tire in zip(car.wheel_geometry, car.wheels):
+            i = geom.index
+            load = self._loads[i]
+            if load < MIN_LOAD:
+                continue
+
+            config = tire.config
+            r_x = geom.x * cos_o - geom.y * sin_o
+            r_y = geom.x * sin_o + geom.y * cos_o
+            contact.set(vx - yaw_rate * r_y, vy + yaw_rate * r_x)
+
+            heading = orientation
+            if geom.steered:
+                heading += self._steer[geom.side]
+
+            omega = wheel_speed[i]
+            slip = SlipCalculator.calculate_slip_into(
+                tire._slip_state, contact, heading, omega, config.radius
+            )
+            forces = tire.combined_slip.calculate(
+                slip.slip_ratio, slip.slip_angle_deg, load, tire.camber,
+                method=config.combined_slip_method, out=tire._forces
+            )
+
+            if config.use_relaxation:
+                fx = relaxed_fx[i]
+                fy = relaxed_fy[i]
+                dfx, dfy = tire.relaxation.rates(
+                    fx, fy, forces.Fx, forces.Fy, contact.magnitude_2d()
+                )
+                dy[10 + i] = dfx
+                dy[14 + i] = dfy
+            else:
+                fx = forces.Fx
+                fy = forces.Fy
+
+            # Wheel spin (Tire._update_wheel_rotation without the stop clamp,
+            # which Car applies after the step)
+            drive = self._drive[geom.side] if geom.driven else 0.0
+            brake = self._brake[i]
+            net_torque = drive - fx * config.radius
+            if abs(omega) > 0.1:
+                net_torque -= math.copysign(brake, omega)
+            elif abs(net_torque) < brake:
+                net_torque = 0.0
+            dy[6 + i] = net_torque / config.inertia
+
+            # Tire force to world frame and torque about the CG
+            cos_h = math.cos(heading)
+            sin_h = math.sin(heading)
+            force_x = fx * cos_h - fy * sin_h
+            force_y = fx * sin_h + fy * cos_h
+            total_fx += force_x
+            total_fy += force_y
+            total_torque += r_x * force_y - r_y * force_x
+
+        speed = math.hypot(vx, vy)
+        if speed > 0.1:
+            drag = self._drag * speed
+            total_fx -= drag * vx
+            total_fy -= drag * vy
+
+        dy[0] = vx
+        dy[1] = vy
+        dy[2] = yaw_rate
+        dy[3] = total_fx / body.mass
+        dy[4] = total_fy / body.mass
+        dy[5] = total_torque / body.inertia
+        return dy
+
+    def unpack(self, y: np.ndarray, dt: float) -> None:
+        """Write an integrated state back into the car.
+
+        Args:
+            y: State at the end of the step
+            dt: Step length (for the wheels' rendering angle)
+        """
+        car = self.car
+        body = car.body
+        x, y_pos, orientation, vx, vy, yaw_rate = y[0:6].tolist()
+        body.position.set(x, y_pos)
+        body.orientation = normalize_angle(orientation)
+        body.velocity.set(vx, vy)
+        body.angular_velocity = yaw_rate
+        body.clear_forces()
+
+        for i, tire in enumerate(car.wheels):
+            load = self._loads[i]
+            tire.normal_load = max(0.0, load)
+            if load < MIN_LOAD:
+                tire._Fx = tire._Fy = 0.0
+                forces = tire._forces
+                forces.Fx = forces.Fy = forces.Fx_pure = forces.Fy_pure = forces.saturation = 0.0
+                continue
+
+            omega = float(y[6 + i])
+            if self._brake[i] > 0 and abs(omega) < 0.1:
+                omega = max(0.0, omega)
+            tire.angular_velocity = omega
+            tire.rotation_angle += omega * dt
+
+            if tire.config.use_relaxation:
+                tire.relaxation.set_forces(float(y[10 + i]), float(y[14 + i]))
+                tire._Fx, tire._Fy = tire.relaxation.Fx, tire.relaxation.Fy
+            else:
+                tire._Fx, tire._Fy = tire._forces.Fx, tire._forces.Fy
+
+            r_x, r_y = car._wheel_offsets[i].x, car._wheel_offsets[i].y
+            c, s = body.basis
+            wx = r_x * c - r_y * s
+            wy = r_x * s + r_y * c
+            tire._contact_speed = math.hypot(vx - yaw_rate * wy, vy + yaw_rate * wx)
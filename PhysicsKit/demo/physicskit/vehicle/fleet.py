@@ -0,0 +1,790 @@
+"""Vectorized simulation of many vehicles at once.
+
+World.step advances each Car in turn, and every Car walks its four tires
+in pure Python. FleetWorld runs the same vehicle model for N cars in a
+structure-of-arrays layout: body state has shape (N,), wheel state has
+shape (N, 4) in WheelPosition order (FL, FR, RL, RR). One step of the
+whole fleet is a fixed number of NumPy operations, regardless of N.
+
+The model mirrors Car.physics_step term for term (rate-limited Ackermann
+steering, progressive handbrake, simple load transfer, empirical combined
+slip, relaxation, explicit or implicit wheel spin, drag and semi-implicit
+Euler), so a fleet
+built with FleetWorld.from_cars follows the same trajectories as the
+individual cars up to floating-point rounding.
+
+Cars with equal tire configurations share one force model through the
+tire registry, and their Pacejka forces are evaluated in a single batch.
+"""
+
+from __future__ import annotations
+import math
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from physicskit.core.schedule import InputSchedule, InputTable
+from physicskit.core.vector import Vector3, normalize_angles
+from physicskit.tire.registry import TireModelRegistry, SharedTireModel, default_registry
+from physicskit.tire.relaxation import get_decay
+from physicskit.tire.slip import SlipBatch, SlipCalculator
+from physicskit.tire.tire import WHEEL_INTEGRATORS
+from physicskit.vehicle.car import AIR_DENSITY, DRAG_COEFFICIENT, FRONTAL_AREA, Car, CarConfig
+from physicskit.vehicle.drivetrain import DifferentialType, DrivetrainConfig
+from physicskit.vehicle.geometry import build_wheel_geometry
+from physicskit.vehicle.handbrake import HandbrakeConfig
+from physicskit.vehicle.steering import SteeringConfig
+from physicskit.vehicle.suspension import SuspensionConfig
+
+
+class FleetWorld:
+    """Fixed-timestep world that steps N cars in one vectorized pass.
+
+    State arrays are public and may be read (or written, e.g. to teleport
+    cars) between steps:
+
+        position (N, 2), velocity (N, 2), orientation (N,),
+        angular_velocity (N,), wheel_speed (N, 4), wheel_rotation (N, 4),
+        wheel_loads (N, 4), tire_Fx / tire_Fy (N, 4, tire frame),
+        slip_ratio / slip_angle (N, 4, slip angle in radians)
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[CarConfig],
+        dt: float = 0.001,
+        registry: Optional[TireModelRegistry] = None
+    ):
+        """Initialize fleet at rest at the origin.
+
+        Args:
+            configs: One CarConfig per car
+            dt: Fixed physics timestep (seconds)
+            registry: Source of shared tire force models. Defaults to the
+                      module-wide registry used by Tire.
+        """
+        if len(configs) == 0:
+            raise ValueError("FleetWorld needs at least one car")
+        for cfg in configs:
+            if cfg.tire_config.combined_slip_method != "empirical":
+                raise ValueError(
+                    f"FleetWorld only supports the 'empirical' combined slip method, "
+                    f"got '{cfg.tire_config.combined_slip_method}'"
+                )
+            if cfg.tire_config.wheel_integrator not in WHEEL_INTEGRATORS:
+                raise ValueError(
+                    f"Unknown wheel integrator '{cfg.tire_config.wheel_integrator}'. "
+                    f"Available: {', '.join(WHEEL_INTEGRATORS)}"
+                )
+
+        self.configs = list(configs)
+        self.dt = dt
+        self.time = 0.0
+        self.n = len(self.configs)
+
+        self._init_parameters()
+        self._init_tire_groups(registry if registry is not None else default_registry)
+        self._init_relaxation_groups()
+        self._init_state()
+
+    @classmethod
+    def uniform(cls, config: CarConfig, n: int, dt: float = 0.001) -> FleetWorld:
+        """Create a fleet of n identical cars."""
+        return cls([config] * n, dt=dt)
+
+    @classmethod
+    def from_cars(cls, cars: Sequence[Car], dt: float = 0.001) -> FleetWorld:
+        """Create a fleet that continues from the current state of existing cars.
+
+        Inputs, body state, steering, handbrake, engine and tire state are
+        copied, so stepping the fleet reproduces stepping the cars.
+        """
+        fleet = cls([car.config for car in cars], dt=dt)
+        for i, car in enumerate(cars):
+            fleet._copy_from_car(i, car)
+        return fleet
+
+    def _init_parameters(self) -> None:
+        """Gather per-car constants from configs into arrays."""
+        def column(getter) -> np.ndarray:
+            return np.array([getter(cfg) for cfg in self.configs], dtype=float)
+
+        # Body
+        self.mass = column(lambda c: c.mass)
+        self.inertia = column(lambda c: c.inertia)
+
+        # Wheel positions in body frame (N, 4, 2), from the same wheel
+        # geometry table as Car
+        geometry = [build_wheel_geometry(c) for c in self.configs]
+        self.wheel_local = np.array([[(g.x, g.y) for g in table] for table in geometry])
+
+        # Suspension (calculate_loads_simple)
+        suspension = [
+            SuspensionConfig(
+                wheelbase=c.wheelbase, track_front=c.track_front, track_rear=c.track_rear,
+                cg_height=c.cg_height, cg_to_front=c.cg_to_front, total_mass=c.mass
+            )
+            for c in self.configs
+        ]
+        self.cg_height = column(lambda c: c.cg_height)
+        self.wheelbase = column(lambda c: c.wheelbase)
+        self.track_front = column(lambda c: c.track_front)
+        self.track_rear = column(lambda c: c.track_rear)
+        self.gravity = np.array([s.gravity for s in suspension])
+        self.front_fraction = np.array([s.front_weight_fraction for s in suspension])
+        self.rear_fraction = np.array([s.rear_weight_fraction for s in suspension])
+
+        # Steering
+        steering = SteeringConfig()
+        self.max_steer = column(lambda c: c.max_steer_angle)
+        self.ackermann = column(lambda c: c.ackermann_factor)
+        self.steering_rate = np.full(self.n, steering.steering_rate)
+
+        # Handbrake
+        handbrake = HandbrakeConfig()
+        self.handbrake_max_torque = column(lambda c: c.handbrake_torque)
+        self.handbrake_engage_rate = np.full(self.n, handbrake.engagement_rate)
+        self.handbrake_release_rate = np.full(self.n, handbrake.release_rate)
+
+        # Drivetrain
+        drivetrain = DrivetrainConfig()
+        self.max_torque = column(lambda c: c.max_torque)
+        self.gear_ratio = column(lambda c: c.gear_ratio)
+        self.efficiency = np.full(self.n, drivetrain.efficiency)
+        self.max_rpm = np.full(self.n, drivetrain.max_rpm)
+        self.idle_rpm = np.full(self.n, drivetrain.idle_rpm)
+        self.is_lsd = np.array([c.differential == DifferentialType.LSD for c in self.configs])
+        self.lsd_preload = column(lambda c: c.lsd_preload)
+        self.lsd_power_ratio = column(lambda c: c.lsd_power_ratio)
+        self.lsd_coast_ratio = column(lambda c: c.lsd_coast_ratio)
+        self.max_brake_torque = column(lambda c: c.max_brake_torque)
+        self.brake_bias = column(lambda c: c.brake_bias)
+
+        # Tires (same config on all four wheels, broadcast as (N, 1))
+        self.wheel_radius = column(lambda c: c.tire_config.radius)[:, np.newaxis]
+        self.wheel_inertia = column(lambda c: c.tire_config.inertia)[:, np.newaxis]
+        self.use_relaxation = np.array(
+            [c.tire_config.use_relaxation for c in self.configs]
+        )[:, np.newaxis]
+        self.implicit_wheel = np.array(
+            [c.tire_config.wheel_integrator == "implicit" for c in self.configs]
+        )[:, np.newaxis]
+        self._any_implicit = bool(np.any(self.implicit_wheel))
+
+    def _init_tire_groups(self, registry: TireModelRegistry) -> None:
+        """Group cars by shared tire force model for batched evaluation."""
+        groups: dict[int, tuple[SharedTireModel, list[int]]] = {}
+        for i, cfg in enumerate(self.configs):
+            model = registry.get(cfg.tire_config)
+            groups.setdefault(id(model), (model, []))[1].append(i)
+
+        self._tire_groups = [
+            (model, np.array(indices, dtype=np.intp))
+            for model, indices in groups.values()
+        ]
+
+    def _init_relaxation_groups(self) -> None:
+        """Group cars by relaxation lengths, which select the shared gain table."""
+        groups: dict[tuple[float, float], list[int]] = {}
+        for i, cfg in enumerate(self.configs):
+            key = (cfg.tire_config.relaxation_length_x, cfg.tire_config.relaxation_length_y)
+            groups.setdefault(key, []).append(i)
+
+        self._relaxation_groups = [
+            (key, np.array(indices, dtype=np.intp)) for key, indices in groups.items()
+        ]
+
+    def _init_state(self) -> None:
+        """Allocate dynamic state arrays."""
+        n = self.n
+
+        # Inputs
+        self.throttle = np.zeros(n)
+        self.brake = np.zeros(n)
+        self.steer = np.zeros(n)
+        self.handbrake = np.zeros(n)
+
+        # Body
+        self.position = np.zeros((n, 2))
+        self.velocity = np.zeros((n, 2))
+        self.orientation = np.zeros(n)
+        self.angular_velocity = np.zeros(n)
+
+        # Subsystems
+        self.steer_angle = np.zeros(n)           # Rate-limited steering input
+        self.handbrake_engagement = np.zeros(n)
+        self.engine_rpm = self.idle_rpm.copy()
+
+        # Load transfer
+        self.prev_velocity = np.zeros((n, 2))
+        self.longitudinal_accel = np.zeros(n)
+        self.lateral_accel = np.zeros(n)
+        self.wheel_loads = self._static_loads()
+
+        # Wheels
+        self.wheel_speed = np.zeros((n, 4))
+        self.wheel_rotation = np.zeros((n, 4))
+        self.relaxed_Fx = np.zeros((n, 4))
+        self.relaxed_Fy = np.zeros((n, 4))
+        self.tire_Fx = np.zeros((n, 4))
+        self.tire_Fy = np.zeros((n, 4))
+        self.slip_ratio = np.zeros((n, 4))
+        self.slip_angle = np.zeros((n, 4))
+
+    def _static_loads(self) -> np.ndarray:
+        """Static wheel loads (N, 4)."""
+        weight = self.mass * self.gravity
+        front = weight * self.front_fraction / 2
+        rear = weight * self.rear_fraction / 2
+        return np.stack((front, front, rear, rear), axis=1)
+
+    def _copy_from_car(self, i: int, car: Car) -> None:
+        """Copy the dynamic state of a Car into row i."""
+        body = car.body
+        self.throttle[i] = car._throttle
+        self.brake[i] = car._brake
+        self.steer[i] = car._steer
+        self.handbrake[i] = car._handbrake
+
+        # Brake settings may have been changed on the car's drivetrain
+        self.max_brake_torque[i] = car.drivetrain.config.max_brake_torque
+        self.brake_bias[i] = car.drivetrain.config.brake_bias
+
+        self.position[i] = (body.position.x, body.position.y)
+        self.velocity[i] = (body.velocity.x, body.velocity.y)
+        self.orientation[i] = body.orientation
+        self.angular_velocity[i] = body.angular_velocity
+
+        self.steer_angle[i] = car.steering.current_input
+        self.handbrake_engagement[i] = car.handbrake.engagement
+        self.engine_rpm[i] = car.drivetrain.engine_rpm
+
+        self.prev_velocity[i] = (car._prev_velocity.x, car._prev_velocity.y)
+        self.longitudinal_accel[i] = car._longitudinal_accel
+        self.lateral_accel[i] = car._lateral_accel
+
+        self.wheel_loads[i] = car._wheel_loads.as_array()
+        for j, tire in enumerate(car.wheels):
+            self.wheel_speed[i, j] = tire.angular_velocity
+            self.wheel_rotation[i, j] = tire.rotation_angle
+            self.relaxed_Fx[i, j] = tire.relaxation.Fx
+            self.relaxed_Fy[i, j] = tire.relaxation.Fy
+            self.tire_Fx[i, j], self.tire_Fy[i, j] = tire.get_forces_local()
+            self.slip_ratio[i, j] = tire.slip_ratio
+            self.slip_angle[i, j] = tire._slip_state.slip_angle
+
+    def set_inputs(
+        self,
+        throttle: Optional[np.ndarray] = None,
+        brake: Optional[np.ndarray] = None,
+        steer: Optional[np.ndarray] = None,
+        handbrake: Optional[np.ndarray] = None
+    ) -> None:
+        """Set control inputs for all cars.
+
+        Each argument is a scalar (applied to every car) or an (N,) array.
+        Inputs left as None keep their current value.
+
+        Args:
+            throttle: Throttle position (0-1)
+            brake: Brake pedal (0-1)
+            steer: Steering (-1 left, +1 right)
+            handbrake: Handbrake (0-1)
+        """
+        if throttle is not None:
+            self.throttle[:] = np.clip(throttle, 0.0, 1.0)
+        if brake is not None:
+            self.brake[:] = np.clip(brake, 0.0, 1.0)
+        if steer is not None:
+            self.steer[:] = np.clip(steer, -1.0, 1.0)
+        if handbrake is not None:
+            self.handbrake[:] = np.clip(handbrake, 0.0, 1.0)
+
+    def set_velocity(self, speed: np.ndarray, direction: Optional[np.ndarray] = None) -> None:
+        """Set vehicle velocities and matching wheel speeds (see Car.set_velocity).
+
+        Args:
+            speed: Speed in m/s, scalar or (N,)
+            direction: Direction in radians. Defaults to current orientations.
+        """
+        if direction is None:
+            direction = self.orientation
+        speed = np.broadcast_to(np.asarray(speed, dtype=float), (self.n,))
+        self.velocity[:, 0] = speed * np.cos(direction)
+        self.velocity[:, 1] = speed * np.sin(direction)
+        self.wheel_speed[:] = speed[:, np.newaxis] / self.wheel_radius
+
+    def reset(
+        self,
+        positions: Optional[np.ndarray] = None,
+        orientations: Optional[np.ndarray] = None
+    ) -> None:
+        """Reset all cars to rest.
+
+        Args:
+            positions: Starting positions (N, 2). Defaults to origin.
+            orientations: Starting orientations (N,) in radians.
+        """
+        self.time = 0.0
+        self._init_state()
+        if positions is not None:
+            self.position[:] = positions
+        if orientations is not None:
+            self.orientation[:] = orientations
+
+    def step(self) -> None:
+        """Advance every car by one fixed timestep (dt)."""
+        dt = self.dt
+
+        self._update_steering(dt)
+        self._update_handbrake(dt)
+        self._update_accelerations(dt)
+        self.wheel_loads = self._calculate_loads()
+        steer_left, steer_right = self._wheel_steer_angles()
+
+        # Torques use wheel speeds from the start of the step
+        drive = self._drive_torques()
+        brake = self._brake_torques()
+
+        # Wheel kinematics
+        cos_h = np.cos(self.orientation)[:, np.newaxis]
+        sin_h = np.sin(self.orientation)[:, np.newaxis]
+        local_x = self.wheel_local[..., 0]
+        local_y = self.wheel_local[..., 1]
+        r_x = local_x * cos_h - local_y * sin_h
+        r_y = local_x * sin_h + local_y * cos_h
+
+        omega = self.angular_velocity[:, np.newaxis]
+        contact_vx = self.velocity[:, 0:1] - omega * r_y
+        contact_vy = self.velocity[:, 1:2] + omega * r_x
+
+        wheel_heading = np.repeat(self.orientation[:, np.newaxis], 4, axis=1)
+        wheel_heading[:, 0] += steer_left
+        wheel_heading[:, 1] += steer_right
+
+        Fx, Fy = self._update_tires(contact_vx, contact_vy, wheel_heading, drive, brake, dt)
+
+        # Tire forces to world frame and body torque
+        cos_w = np.cos(wheel_heading)
+        sin_w = np.sin(wheel_heading)
+        force_x = Fx * cos_w - Fy * sin_w
+        force_y = Fx * sin_w + Fy * cos_w
+
+        total_x = force_x.sum(axis=1)
+        total_y = force_y.sum(axis=1)
+        torque = (r_x * force_y - r_y * force_x).sum(axis=1)
+
+        # Air resistance
+        vx = self.velocity[:, 0]
+        vy = self.velocity[:, 1]
+        speed = np.sqrt(vx * vx + vy * vy)
+        moving = speed > 0.1
+        drag = 0.5 * DRAG_COEFFICIENT * FRONTAL_AREA * AIR_DENSITY * speed * speed
+        inv_speed = np.divide(1.0, speed, out=np.zeros_like(speed), where=moving)
+        total_x -= np.where(moving, vx * inv_speed * drag, 0.0)
+        total_y -= np.where(moving, vy * inv_speed * drag, 0.0)
+
+        self._integrate(total_x, total_y, torque, dt)
+
+        # Engine RPM follows the driven (rear) wheels
+        avg_rear_speed = (self.wheel_speed[:, 2] + self.wheel_speed[:, 3]) / 2
+        target_rpm = np.abs(avg_rear_speed) * self.gear_ratio * 60 / (2 * math.pi)
+        target_rpm = np.clip(target_rpm, self.idle_rpm, self.max_rpm)
+        self.engine_rpm += (target_rpm - self.engine_rpm) * min(1.0, dt * 5)
+
+        self.time += dt
+
+    def run(
+        self,
+        n_steps: int,
+        inputs: Union[InputSchedule, Sequence[InputSchedule], InputTable, np.ndarray, None] = None
+    ) -> None:
+        """Advance the fleet by n_steps fixed timesteps.
+
+        Args:
+            n_steps: Number of fixed timesteps
+            inputs: Control inputs as (throttle, brake, steer, handbrake):
+                    one InputSchedule for every car, one schedule per car,
+                    an InputTable, or an array of shape (n_steps, 4) or
+                    (n_steps, N, 4). None keeps the current inputs.
+        """
+        if inputs is None:
+            for _ in range(n_steps):
+                self.step()
+            return
+
+        if isinstance(inputs, InputSchedule):
+            table = inputs.compile(self.dt, n_steps, t0=self.time).values
+        elif isinstance(inputs, InputTable):
+            table = inputs.values
+        elif isinstance(inputs, np.ndarray):
+            table = inputs
+        else:
+            if len(inputs) != self.n:
+                raise ValueError(f"Expected {self.n} input schedules, got {len(inputs)}")
+            table = InputSchedule.compile_batch(inputs, self.dt, n_steps, t0=self.time)
+
+        table = np.clip(np.asarray(table, dtype=float), [0.0, 0.0, -1.0, 0.0], 1.0)
+        if table.shape not in ((n_steps, 4), (n_steps, self.n, 4)):
+            raise ValueError(
+                f"inputs must have shape ({n_steps}, 4) or ({n_steps}, {self.n}, 4), "
+                f"got {table.shape}"
+            )
+        for row in table:
+            self.throttle[:] = row[..., 0]
+            self.brake[:] = row[..., 1]
+            self.steer[:] = row[..., 2]
+            self.handbrake[:] = row[..., 3]
+            self.step()
+
+    def _update_steering(self, dt: float) -> None:
+        """Rate-limit steering toward the input (Steering.update)."""
+        max_delta = self.steering_rate * dt / self.max_steer
+        diff = np.clip(self.steer - self.steer_angle, -max_delta, max_delta)
+        self.steer_angle += diff
+
+    def _update_handbrake(self, dt: float) -> None:
+        """Engage or release the handbrake progressively (Handbrake.update)."""
+        engaging = self.handbrake > self.handbrake_engagement
+        self.handbrake_engagement = np.where(
+            engaging,
+            np.minimum(self.handbrake, self.handbrake_engagement + self.handbrake_engage_rate * dt),
+            np.maximum(self.handbrake, self.handbrake_engagement - self.handbrake_release_rate * dt)
+        )
+
+    def _update_accelerations(self, dt: float) -> None:
+        """Smoothed body-frame accelerations for weight transfer."""
+        if dt <= 0:
+            return
+
+        accel = (self.velocity - self.prev_velocity) / dt
+        cos_h = np.cos(self.orientation)
+        sin_h = np.sin(self.orientation)
+        local_x = accel[:, 0] * cos_h + accel[:, 1] * sin_h
+        local_y = -accel[:, 0] * sin_h + accel[:, 1] * cos_h
+
+        alpha = min(1.0, dt * 10)
+        self.longitudinal_accel += (local_x - self.longitudinal_accel) * alpha
+        self.lateral_accel += (local_y - self.lateral_accel) * alpha
+
+        self.prev_velocity[:] = self.velocity
+
+    def _calculate_loads(self) -> np.ndarray:
+        """Wheel loads with weight transfer (Suspension.calculate_loads_simple)."""
+        m = self.mass
+        h = self.cg_height
+        weight = m * self.gravity
+
+        long_transfer = m * self.longitudinal_accel * h / self.wheelbase
+        lat_front = m * self.lateral_accel * h * self.front_fraction / self.track_front
+        lat_rear = m * self.lateral_accel * h * self.rear_fraction / self.track_rear
+
+        front = weight * self.front_fraction / 2 - long_transfer / 2
+        rear = weight * self.rear_fraction / 2 + long_transfer / 2
+        loads = np.stack((
+            front + lat_front,
+            front - lat_front,
+            rear + lat_rear,
+            rear - lat_rear,
+        ), axis=1)
+        np.maximum(loads, 0.0, out=loads)
+        return loads
+
+    def _wheel_steer_angles(self) -> tuple[np.ndarray, np.ndarray]:
+        """Front wheel angles with Ackermann geometry (Steering.get_wheel_angles)."""
+        base = self.steer_angle * self.max_steer
+        abs_base = np.abs(base)
+        factor = self.ackermann
+        wheelbase = self.wheelbase
+        track = self.track_front
+
+        # Small angles: linear Ackermann approximation
+        correction = wheelbase * base / (2 * track) * factor
+        left = base + correction
+        right = base - correction
+
+        # Larger angles: blend between parallel and geometric Ackermann
+        geometric = abs_base >= 0.1
+        if np.any(geometric):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                R = wheelbase / np.tan(abs_base)
+                R_inner = R - track / 2
+                R_outer = R + track / 2
+                angle_inner = np.arctan(wheelbase / R_inner)
+                angle_outer = np.arctan(wheelbase / R_outer)
+
+            outer = abs_base * (1 - factor) + angle_outer * factor
+            inner = abs_base * (1 - factor) + angle_inner * factor
+            turning_right = base > 0
+            geo_left = np.copysign(np.where(turning_right, outer, inner), base)
+            geo_right = np.copysign(np.where(turning_right, inner, outer), base)
+
+            # Degenerate geometry falls back to parallel steering
+            valid = (R_inner != 0) & (R_outer != 0)
+            geometric_ok = geometric & valid
+            left = np.where(geometric_ok, geo_left, np.where(geometric, base, left))
+            right = np.where(geometric_ok, geo_right, np.where(geometric, base, right))
+
+        parallel = factor < 0.001
+        left = np.where(parallel, base, left)
+        right = np.where(parallel, base, right)
+
+        straight = abs_base < 0.001
+        left = np.where(straight, 0.0, left)
+        right = np.where(straight, 0.0, right)
+        return left, right
+
+    def _drive_torques(self) -> np.ndarray:
+        """Drive torque per wheel (N, 4); rear wheel drive with open/locked/LSD diff."""
+        rpm_fraction = np.clip(self.engine_rpm / self.max_rpm, 0.1, 1.0)
+        torque_mult = np.where(
+            rpm_fraction < 0.3,
+            0.6 + (rpm_fraction / 0.3) * 0.4,
+            np.where(rpm_fraction < 0.8, 1.0, 1.0 - (rpm_fraction - 0.8) / 0.2 * 0.3)
+        )
+        engine_torque = self.throttle * self.max_torque * torque_mult
+        axle_torque = engine_torque * self.gear_ratio * self.efficiency
+        T_base = axle_torque / 2
+
+        # Limited slip: transfer torque from the faster rear wheel
+        delta_omega = self.wheel_speed[:, 3] - self.wheel_speed[:, 2]
+        lock_ratio = np.where(axle_torque > 0, self.lsd_power_ratio, self.lsd_coast_ratio)
+        locking_torque = self.lsd_preload + np.abs(axle_torque) * lock_ratio
+        transfer = np.minimum(locking_torque, np.abs(T_base)) * lock_ratio
+        transfer = np.where(self.is_lsd & (np.abs(delta_omega) > 0.1), transfer, 0.0)
+        transfer = np.where(delta_omega > 0, transfer, -transfer)
+
+        drive = np.zeros((self.n, 4))
+        drive[:, 2] = T_base + transfer
+        drive[:, 3] = T_base - transfer
+        return drive
+
+    def _brake_torques(self) -> np.ndarray:
+        """Service brake plus handbrake torque per wheel (N, 4).
+
+        Split by brake_bias each step, like Drivetrain.get_brake_torques.
+        """
+        total = self.brake * self.max_brake_torque
+        front = total * self.brake_bias / 2
+        rear = total * (1 - self.brake_bias) / 2
+        torques = np.stack((front, front, rear, rear), axis=1)
+        handbrake = self.handbrake_engagement * self.handbrake_max_torque
+        torques[:, 2] += handbrake
+        torques[:, 3] += handbrake
+        return torques
+
+    def _update_tires(
+        self,
+        contact_vx: np.ndarray,
+        contact_vy: np.ndarray,
+        wheel_heading: np.ndarray,
+        drive: np.ndarray,
+        brake: np.ndarray,
+        dt: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Slip, combined forces, relaxation and wheel spin for all wheels (Tire.update).
+
+        Returns:
+            Tuple of (Fx, Fy) tire-frame forces, shape (N, 4)
+        """
+        loads = self.wheel_loads
+        active = loads >= 10.0
+
+        # Slip (SlipCalculator.calculate_slip)
+        slip = SlipCalculator.calculate_slip_batch(
+            contact_vx, contact_vy, wheel_heading, self.wheel_speed, self.wheel_radius
+        )
+        self.slip_ratio = np.where(active, slip.slip_ratio, self.slip_ratio)
+        self.slip_angle = np.where(active, slip.slip_angle, self.slip_angle)
+
+        # Steady-state combined forces
+        target_Fx, target_Fy, Fx_pure = self._combined_forces(
+            slip.slip_ratio, slip.slip_angle_deg, loads
+        )
+
+        # Relaxation (TireRelaxation.update)
+        alpha_x, alpha_y = self._relaxation_gains(slip.contact_speed, dt)
+        relaxed_Fx = self.relaxed_Fx + (target_Fx - self.relaxed_Fx) * alpha_x
+        relaxed_Fy = self.relaxed_Fy + (target_Fy - self.relaxed_Fy) * alpha_y
+        self.relaxed_Fx = np.where(active & self.use_relaxation, relaxed_Fx, self.relaxed_Fx)
+        self.relaxed_Fy = np.where(active & self.use_relaxation, relaxed_Fy, self.relaxed_Fy)
+
+        Fx = np.where(self.use_relaxation, self.relaxed_Fx, target_Fx)
+        Fy = np.where(self.use_relaxation, self.relaxed_Fy, target_Fy)
+        Fx = np.where(active, Fx, 0.0)
+        Fy = np.where(active, Fy, 0.0)
+
+        # Wheel spin (Tire._update_wheel_rotation)
+        omega = self.wheel_speed
+        net_torque = drive - Fx * self.wheel_radius
+        spinning = np.abs(omega) > 0.1
+        held = ~spinning & (np.abs(net_torque) < brake)
+        net_torque = np.where(spinning, net_torque - brake * np.sign(omega), net_torque)
+        net_torque = np.where(held, 0.0, net_torque)
+        omega = np.where(held, 0.0, omega)
+
+        omega = omega + net_torque / self.wheel_inertia * dt
+        omega = np.where((brake > 0) & (np.abs(omega) < 0.1), np.maximum(omega, 0.0), omega)
+
+        if self._any_implicit:
+            # Tire._update_wheel_rotation_implicit
+            old_omega = self.wheel_speed
+            stiffness = self._spin_stiffness(slip, loads, target_Fx, Fx_pure, alpha_x)
+            inertia = self.wheel_inertia + dt * self.wheel_radius * stiffness
+            free = old_omega + dt * (drive - Fx * self.wheel_radius) / inertia
+            brake_step = dt * brake / inertia
+            implicit_omega = np.where(
+                np.abs(free) <= brake_step, 0.0, free - np.copysign(brake_step, free)
+            )
+            d_fx = np.where(
+                self.implicit_wheel & active, stiffness * (implicit_omega - old_omega), 0.0
+            )
+            Fx = Fx + d_fx
+            self.relaxed_Fx = np.where(self.use_relaxation, self.relaxed_Fx + d_fx, self.relaxed_Fx)
+            omega = np.where(self.implicit_wheel, implicit_omega, omega)
+
+        self.wheel_speed = np.where(active, omega, self.wheel_speed)
+        self.wheel_rotation = np.where(
+            active, self.wheel_rotation + self.wheel_speed * dt, self.wheel_rotation
+        )
+
+        self.tire_Fx = Fx
+        self.tire_Fy = Fy
+        return Fx, Fy
+
+    def _combined_forces(
+        self,
+        slip_ratio: np.ndarray,
+        slip_angle_deg: np.ndarray,
+        loads: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Empirical combined slip forces (CombinedSlip.combined_forces_empirical).
+
+        Returns:
+            Tuple of (Fx, Fy, Fx_pure), shape (N, 4)
+        """
+        Fx_pure = np.zeros_like(loads)
+        Fy_pure = np.zeros_like(loads)
+        Fx_peak = np.zeros_like(loads)
+        Fy_peak = np.zeros_like(loads)
+
+        for model, idx in self._tire_groups:
+            pacejka = model.pacejka
+            mu = model.combined_slip.friction_mu
+            Fz = loads[idx]
+            Fx_pure[idx] = pacejka.longitudinal_force_batch(slip_ratio[idx], Fz) * mu
+            Fy_pure[idx] = pacejka.lateral_force_batch(slip_angle_deg[idx], Fz) * mu
+            Fx_peak[idx] = pacejka.get_peak_longitudinal_force_batch(Fz)[0] * mu
+            Fy_peak[idx] = pacejka.get_peak_lateral_force_batch(Fz)[0] * mu
+
+        has_grip = (Fx_peak >= 1) & (Fy_peak >= 1)
+        Fx_peak = np.where(has_grip, Fx_peak, 1.0)
+        Fy_peak = np.where(has_grip, Fy_peak, 1.0)
+
+        fx_norm = np.abs(Fx_pure) / Fx_peak
+        fy_norm = np.abs(Fy_pure) / Fy_peak
+        sliding = has_grip & (fx_norm + fy_norm >= 0.001)
+
+        force_angle = np.arctan2(fy_norm, fx_norm)
+        Fx = Fx_pure * np.cos(force_angle * 0.5)
+        Fy = Fy_pure * np.cos((math.pi / 2 - force_angle) * 0.5)
+
+        fx_scaled = Fx / Fx_peak
+        fy_scaled = Fy / Fy_peak
+        saturation = np.sqrt(fx_scaled * fx_scaled + fy_scaled * fy_scaled)
+        scale = np.where(saturation > 1.0, 1.0 / np.maximum(saturation, 1.0), 1.0)
+
+        return np.where(sliding, Fx * scale, 0.0), np.where(sliding, Fy * scale, 0.0), Fx_pure
+
+    def _spin_stiffness(
+        self,
+        slip: SlipBatch,
+        loads: np.ndarray,
+        target_Fx: np.ndarray,
+        Fx_pure: np.ndarray,
+        alpha_x: np.ndarray
+    ) -> np.ndarray:
+        """Slope of the applied Fx with respect to wheel speed (Tire._spin_stiffness)."""
+        radius = self.wheel_radius
+        vx = slip.forward_velocity
+        wheel_velocity = self.wheel_speed * radius
+        min_velocity = SlipCalculator.MIN_VELOCITY
+        # SR = (w - vx) / |w| when the wheel is faster than the ground
+        over = (np.abs(wheel_velocity) > np.abs(vx)) & (np.abs(wheel_velocity) > min_velocity)
+        dsr_domega = np.where(
+            over,
+            radius * np.copysign(vx, wheel_velocity)
+            / np.maximum(wheel_velocity * wheel_velocity, min_velocity * min_velocity),
+            radius / np.maximum(np.abs(vx), min_velocity)
+        )
+
+        has_pure = np.abs(Fx_pure) > 1.0
+        reduction = np.divide(target_Fx, Fx_pure, out=np.ones_like(Fx_pure), where=has_pure)
+
+        slope = np.empty_like(loads)
+        for model, idx in self._tire_groups:
+            slope[idx] = (
+                model.pacejka.longitudinal_slip_stiffness_batch(slip.slip_ratio[idx], loads[idx])
+                * model.combined_slip.friction_mu
+            )
+        slope = slope * np.clip(reduction, 0.0, 1.0) * dsr_domega
+        slope = np.where(self.use_relaxation, slope * alpha_x, slope)
+        # Clamped slip ratios no longer follow omega
+        return np.where(np.abs(slip.slip_ratio) >= 1.0, 0.0, np.maximum(slope, 0.0))
+
+    def _relaxation_gains(
+        self,
+        contact_speed: np.ndarray,
+        dt: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Relaxation filter gains for all wheels (RelaxationDecay.gains_batch)."""
+        if len(self._relaxation_groups) == 1:
+            # Whole (N, 4) array at once
+            (sigma_x, sigma_y), _ = self._relaxation_groups[0]
+            return get_decay(dt, sigma_x, sigma_y).gains_batch(contact_speed)
+
+        alpha_x = np.empty_like(contact_speed)
+        alpha_y = np.empty_like(contact_speed)
+        for (sigma_x, sigma_y), idx in self._relaxation_groups:
+            alpha_x[idx], alpha_y[idx] = get_decay(dt, sigma_x, sigma_y).gains_batch(
+                contact_speed[idx]
+            )
+        return alpha_x, alpha_y
+
+    def _integrate(
+        self,
+        force_x: np.ndarray,
+        force_y: np.ndarray,
+        torque: np.ndarray,
+        dt: float
+    ) -> None:
+        """Semi-implicit Euler for all bodies (RigidBody.integrate)."""
+        self.velocity[:, 0] += force_x / self.mass * dt
+        self.velocity[:, 1] += force_y / self.mass * dt
+        self.position += self.velocity * dt
+
+        self.angular_velocity += torque / self.inertia * dt
+        self.orientation = normalize_angles(self.orientation + self.angular_velocity * dt)
+
+    @property
+    def speed(self) -> np.ndarray:
+        """Speed of each car (m/s)."""
+        return np.hypot(self.velocity[:, 0], self.velocity[:, 1])
+
+    def get_local_velocity(self) -> np.ndarray:
+        """Velocity of each car in its body frame (N, 2): forward, lateral."""
+        cos_h = np.cos(self.orientation)
+        sin_h = np.sin(self.orientation)
+        vx = self.velocity[:, 0]
+        vy = self.velocity[:, 1]
+        return np.stack((vx * cos_h + vy * sin_h, -vx * sin_h + vy * cos_h), axis=1)
+
+    def get_drift_angles(self) -> np.ndarray:
+        """Body slip angle of each car in degrees (see Car.get_drift_angle)."""
+        local = self.get_local_velocity()
+        angles = np.degrees(np.arctan2(local[:, 1], local[:, 0]))
+        return np.where(np.abs(local[:, 0]) < 0.5, 0.0, angles)
+
+    def get_position(self, i: int) -> Vector3:
+        """Position of car i as a Vector3."""
+        return Vector3(self.position[i, 0], self.position[i, 1], 0.0)
@@ -0,0 +1,94 @@
+"""Fixed per-wheel geometry of a vehicle.
+
+Car builds a wheel geometry table once from its CarConfig. The table is a
+tuple indexed by wheel index (WheelPosition order: FL, FR, RL, RR), so the
+physics step, load lookups and the renderer use integer indexing instead
+of enum comparisons and dict lookups.
+"""
+
+from __future__ import annotations
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator, TypeVar
+
+from physicskit.core.vector import Vector2
+from physicskit.vehicle.suspension import WHEEL_INDEX, WHEELS, WheelPosition
+
+if TYPE_CHECKING:
+    from physicskit.vehicle.car import CarConfig
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class WheelGeometry:
+    """Fixed data for one wheel."""
+    position: WheelPosition
+    index: int                     # Position in WHEELS
+    x: float                       # Offset from CG, forward (m, body frame)
+    y: float                       # Offset from CG, left (m, body frame)
+    side: int                      # 0 = left, 1 = right; indexes (left, right) pairs
+    steered: bool                  # Turned by the steering (front axle)
+    driven: bool                   # Receives drive torque (rear axle, RWD)
+    handbrake: bool                # Acted on by the handbrake (rear axle)
+
+    def offset(self) -> Vector2:
+        """Offset from the CG in body coordinates."""
+        return Vector2(self.x, self.y)
+
+
+def build_wheel_geometry(config: CarConfig) -> tuple[WheelGeometry, ...]:
+    """Build the wheel geometry table for a vehicle configuration.
+
+    Args:
+        config: Vehicle configuration
+
+    Returns:
+        One WheelGeometry per wheel, in WHEELS order
+    """
+    cg_to_rear = config.wheelbase - config.cg_to_front
+
+    table = []
+    for index, wheel in enumerate(WHEELS):
+        front = wheel in (WheelPosition.FRONT_LEFT, WheelPosition.FRONT_RIGHT)
+        left = wheel in (WheelPosition.FRONT_LEFT, WheelPosition.REAR_LEFT)
+        half_track = (config.track_front if front else config.track_rear) / 2
+        table.append(WheelGeometry(
+            position=wheel,
+            index=index,
+            x=config.cg_to_front if front else -cg_to_rear,
+            y=half_track if left else -half_track,
+            side=0 if left else 1,
+            steered=front,
+            driven=not front,
+            handbrake=not front,
+        ))
+    return tuple(table)
+
+
+class WheelMap(Mapping[WheelPosition, T]):
+    """Read-only WheelPosition-keyed view of per-wheel items.
+
+    The items are stored as a tuple in wheel index order; hot paths should
+    index that tuple (Car.wheels) directly.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[T]):
+        self._items = tuple(items)
+        if len(self._items) != len(WHEELS):
+            raise ValueError(f"Expected {len(WHEELS)} wheels, got {len(self._items)}")
+
+    def __getitem__(self, pos: WheelPosition) -> T:
+        return self._items[WHEEL_INDEX[pos]]
+
+    def __iter__(self) -> Iterator[WheelPosition]:
+        return iter(WHEELS)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"WheelMap({dict(zip(WHEELS, self._items))!r})"
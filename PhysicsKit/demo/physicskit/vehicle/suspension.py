@@ -10,9 +10,12 @@ grip each tire has available.
 
 from __future__ import annotations
 import math
+from array import array
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict
+from typing import Dict, Optional
+
+import numpy as np
 
 
 class WheelPosition(Enum):
@@ -23,21 +26,86 @@ class WheelPosition(Enum):
     REAR_RIGHT = "RR"
 
 
-@dataclass
+# Wheels in index order, and the index of each wheel. Per-wheel storage
+# (WheelLoads, Car.wheels, FleetWorld arrays) uses this order.
+WHEELS: tuple[WheelPosition, ...] = tuple(WheelPosition)
+WHEEL_INDEX: dict[WheelPosition, int] = {wheel: i for i, wheel in enumerate(WHEELS)}
+
+
+def _load_property(index: int, doc: str) -> property:
+    """WheelLoads attribute for one wheel index."""
+    def fget(self: WheelLoads) -> float:
+        return self.values[index]
+
+    def fset(self: WheelLoads, value: float) -> None:
+        self.values[index] = value
+
+    return property(fget, fset, doc=doc)
+
+
 class WheelLoads:
-    """Vertical loads on each wheel."""
-    FL: float = 0.0  # Front left (N)
-    FR: float = 0.0  # Front right (N)
-    RL: float = 0.0  # Rear left (N)
-    RR: float = 0.0  # Rear right (N)
+    """Vertical loads on each wheel.
+
+    Stored as a 4-element array('d') in wheel index order (FL, FR, RL, RR).
+    Hot paths index values directly; the FL/FR/RL/RR attributes and
+    get/set by WheelPosition are kept for convenience.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, FL: float = 0.0, FR: float = 0.0, RL: float = 0.0, RR: float = 0.0):
+        self.values = array("d", (FL, FR, RL, RR))
+
+    FL = _load_property(0, "Front left (N)")
+    FR = _load_property(1, "Front right (N)")
+    RL = _load_property(2, "Rear left (N)")
+    RR = _load_property(3, "Rear right (N)")
 
     def get(self, pos: WheelPosition) -> float:
         """Get load for a specific wheel."""
-        return getattr(self, pos.value)
+        return self.values[WHEEL_INDEX[pos]]
 
     def set(self, pos: WheelPosition, value: float) -> None:
         """Set load for a specific wheel."""
-        setattr(self, pos.value, value)
+        self.values[WHEEL_INDEX[pos]] = value
+
+    def __getitem__(self, index: int) -> float:
+        """Get load by wheel index."""
+        return self.values[index]
+
+    def __setitem__(self, index: int, value: float) -> None:
+        """Set load by wheel index."""
+        self.values[index] = value
+
+    def __len__(self) -> int:
+        return 4
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WheelLoads):
+            return NotImplemented
+        return self.values == other.values
+
+    def __repr__(self) -> str:
+        FL, FR, RL, RR = self.values
+        return f"WheelLoads(FL={FL!r}, FR={FR!r}, RL={RL!r}, RR={RR!r})"
+
+    def as_tuple(self) -> tuple[float, float, float, float]:
+        """Loads in wheel index order (FL, FR, RL, RR)."""
+        FL, FR, RL, RR = self.values
+        return FL, FR, RL, RR
+
+    def as_array(self) -> np.ndarray:
+        """NumPy view of the loads (shares memory, no copy)."""
+        return np.frombuffer(self.values, dtype=np.float64)
+
+    def copy(self) -> WheelLoads:
+        """Return a copy of these loads."""
+        loads = WheelLoads.__new__(WheelLoads)
+        loads.values = array("d", self.values)
+        return loads
 
     def to_dict(self) -> Dict[WheelPosition, float]:
         """Convert to dictionary."""
@@ -51,27 +119,27 @@ class WheelLoads:
     @property
     def front_total(self) -> float:
         """Total front axle load."""
-        return self.FL + self.FR
+        return self.values[0] + self.values[1]
 
     @property
     def rear_total(self) -> float:
         """Total rear axle load."""
-        return self.RL + self.RR
+        return self.values[2] + self.values[3]
 
     @property
     def left_total(self) -> float:
         """Total left side load."""
-        return self.FL + self.RL
+        return self.values[0] + self.values[2]
 
     @property
     def right_total(self) -> float:
         """Total right side load."""
-        return self.FR + self.RR
+        return self.values[1] + self.values[3]
 
     @property
     def total(self) -> float:
         """Total load on all wheels."""
-        return self.FL + self.FR + self.RL + self.RR
+        return sum(self.values)
 
 
 @dataclass
@@ -147,12 +215,7 @@ class Suspension:
 
     def get_static_loads(self) -> WheelLoads:
         """Get static wheel loads (no acceleration)."""
-        return WheelLoads(
-            FL=self._static_loads.FL,
-            FR=self._static_loads.FR,
-            RL=self._static_loads.RL,
-            RR=self._static_loads.RR
-        )
+        return self._static_loads.copy()
 
     def calculate_loads(
         self,
@@ -229,12 +292,21 @@ class Suspension:
     def calculate_loads_simple(
         self,
         longitudinal_accel: float,
-        lateral_accel: float
+        lateral_accel: float,
+        out: Optional[WheelLoads] = None
     ) -> WheelLoads:
         """Simplified weight transfer calculation.
 
         Uses a simpler model that's faster to compute and easier to tune.
         Good for initial development.
+
+        Args:
+            longitudinal_accel: Forward acceleration (m/s^2, positive = forward)
+            lateral_accel: Lateral acceleration (m/s^2, positive = right turn)
+            out: Loads to write into instead of allocating new ones
+
+        Returns:
+            WheelLoads with dynamic load distribution
         """
         cfg = self.config
         m = cfg.total_mass
@@ -253,18 +325,13 @@ class Suspension:
         lat_transfer_front = m * lateral_accel * h * front_frac / cfg.track_front
         lat_transfer_rear = m * lateral_accel * h * rear_frac / cfg.track_rear
 
-        # Calculate each wheel
-        loads = WheelLoads(
-            FL=total_weight * front_frac / 2 - long_transfer / 2 + lat_transfer_front,
-            FR=total_weight * front_frac / 2 - long_transfer / 2 - lat_transfer_front,
-            RL=total_weight * rear_frac / 2 + long_transfer / 2 + lat_transfer_rear,
-            RR=total_weight * rear_frac / 2 + long_transfer / 2 - lat_transfer_rear,
-        )
-
-        # Clamp
-        loads.FL = max(0.0, loads.FL)
-        loads.FR = max(0.0, loads.FR)
-        loads.RL = max(0.0, loads.RL)
-        loads.RR = max(0.0, loads.RR)
+        # Calculate each wheel, clamped to non-negative (wheel lift)
+        if out is None:
+            out = WheelLoads()
+        values = out.values
+        values[0] = max(0.0, total_weight * front_frac / 2 - long_transfer / 2 + lat_transfer_front)
+        values[1] = max(0.0, total_weight * front_frac / 2 - long_transfer / 2 - lat_transfer_front)
+        values[2] = max(0.0, total_weight * rear_frac / 2 + long_transfer / 2 + lat_transfer_rear)
+        values[3] = max(0.0, total_weight * rear_frac / 2 + long_transfer / 2 - lat_transfer_rear)
 
-        return loads
+        return out
@@ -8,7 +8,7 @@ Provides static plots for:
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Tuple, Optional
+from typing import TYPE_CHECKING, List, Tuple, Optional, Sequence, Union
 
 import numpy as np
 
@@ -20,6 +20,8 @@ except ImportError:
     MATPLOTLIB_AVAILABLE = False
 
 if TYPE_CHECKING:
+    from physicskit.core.recorder import TelemetryReader
+    from physicskit.core.telemetry import Telemetry
     from physicskit.tire.pacejka import PacejkaFormula
 
 
@@ -66,7 +68,7 @@ class TirePlotter:
         slip_angles = np.linspace(slip_range[0], slip_range[1], 200)
 
         for Fz in loads:
-            forces = [pacejka.lateral_force(a, Fz) for a in slip_angles]
+            forces = pacejka.lateral_force_batch(slip_angles, Fz)
             ax.plot(slip_angles, forces, label=f'{Fz:.0f} N')
 
         ax.set_xlabel('Slip Angle (degrees)')
@@ -110,7 +112,7 @@ class TirePlotter:
         slip_ratios = np.linspace(slip_range[0], slip_range[1], 200)
 
         for Fz in loads:
-            forces = [pacejka.longitudinal_force(sr, Fz) for sr in slip_ratios]
+            forces = pacejka.longitudinal_force_batch(slip_ratios, Fz)
             ax.plot(slip_ratios * 100, forces, label=f'{Fz:.0f} N')
 
         ax.set_xlabel('Slip Ratio (%)')
@@ -213,8 +215,8 @@ class TrajectoryPlotter:
 
     @staticmethod
     def plot_trajectory(
-        positions: List[Tuple[float, float]],
-        headings: Optional[List[float]] = None,
+        positions: Union[Sequence[Tuple[float, float]], np.ndarray],
+        headings: Optional[Union[Sequence[float], np.ndarray]] = None,
         ax: Optional[plt.Axes] = None,
         show_direction: bool = True,
         marker_interval: int = 50
@@ -222,8 +224,8 @@ class TrajectoryPlotter:
         """Plot vehicle trajectory path.
 
         Args:
-            positions: List of (x, y) positions
-            headings: Optional list of heading angles (radians)
+            positions: (x, y) positions, or an array of shape (n, 2)
+            headings: Optional heading angles (radians)
             ax: Optional axes to plot on
             show_direction: Show direction markers
             marker_interval: Interval between direction markers
@@ -238,11 +240,12 @@ class TrajectoryPlotter:
         else:
             fig = ax.figure
 
-        if not positions:
+        if len(positions) == 0:
             return fig
 
-        x = [p[0] for p in positions]
-        y = [p[1] for p in positions]
+        positions = np.asarray(positions, dtype=float)
+        x = positions[:, 0]
+        y = positions[:, 1]
 
         # Plot path
         ax.plot(x, y, 'b-', linewidth=1.5, alpha=0.7)
@@ -252,13 +255,12 @@ class TrajectoryPlotter:
         ax.plot(x[-1], y[-1], 'rs', markersize=10, label='End')
 
         # Direction markers
-        if show_direction and headings and len(headings) == len(positions):
+        if show_direction and headings is not None and len(headings) == len(positions):
+            headings = np.asarray(headings, dtype=float)
             for i in range(0, len(positions), marker_interval):
-                px, py = positions[i]
-                heading = headings[i]
-                dx = np.cos(heading) * 2
-                dy = np.sin(heading) * 2
-                ax.arrow(px, py, dx, dy, head_width=0.5, head_length=0.3,
+                dx = np.cos(headings[i]) * 2
+                dy = np.sin(headings[i]) * 2
+                ax.arrow(x[i], y[i], dx, dy, head_width=0.5, head_length=0.3,
                         fc='red', ec='red', alpha=0.5)
 
         ax.set_xlabel('X (meters)')
@@ -272,11 +274,11 @@ class TrajectoryPlotter:
 
     @staticmethod
     def plot_telemetry(
-        time: List[float],
-        speed: List[float],
-        drift_angle: List[float],
-        throttle: List[float],
-        steer: List[float],
+        time: Union[Sequence[float], np.ndarray],
+        speed: Union[Sequence[float], np.ndarray],
+        drift_angle: Union[Sequence[float], np.ndarray],
+        throttle: Union[Sequence[float], np.ndarray],
+        steer: Union[Sequence[float], np.ndarray],
         figsize: Tuple[float, float] = (12, 8)
     ) -> plt.Figure:
         """Plot telemetry over time.
@@ -297,7 +299,7 @@ class TrajectoryPlotter:
         fig, axes = plt.subplots(4, 1, figsize=figsize, sharex=True)
 
         # Speed
-        axes[0].plot(time, [s * 3.6 for s in speed], 'b-')
+        axes[0].plot(time, np.asarray(speed) * 3.6, 'b-')
         axes[0].set_ylabel('Speed (km/h)')
         axes[0].grid(True, alpha=0.3)
 
@@ -308,13 +310,13 @@ class TrajectoryPlotter:
         axes[1].grid(True, alpha=0.3)
 
         # Throttle
-        axes[2].plot(time, [t * 100 for t in throttle], 'g-')
+        axes[2].plot(time, np.asarray(throttle) * 100, 'g-')
         axes[2].set_ylabel('Throttle (%)')
         axes[2].set_ylim(-5, 105)
         axes[2].grid(True, alpha=0.3)
 
         # Steering
-        axes[3].plot(time, [s * 100 for s in steer], 'm-')
+        axes[3].plot(time, np.asarray(steer) * 100, 'm-')
         axes[3].set_ylabel('Steering (%)')
         axes[3].set_ylim(-105, 105)
         axes[3].axhline(y=0, color='k', linewidth=0.5)
@@ -326,6 +328,43 @@ class TrajectoryPlotter:
 
         return fig
 
+    @staticmethod
+    def plot_recording(
+        recording: Union[Telemetry, TelemetryReader],
+        vehicle: int = 0,
+        marker_interval: int = 50
+    ) -> Tuple[plt.Figure, plt.Figure]:
+        """Plot trajectory and telemetry of one vehicle from recorded telemetry.
+
+        Channels are passed to plot_trajectory/plot_telemetry as array
+        columns; nothing is converted to Python lists.
+
+        Args:
+            recording: World.run telemetry, or a TelemetryReader (or a
+                       time_range of one). Needs x, y, speed, drift_angle,
+                       throttle and steer; orientation is optional.
+            vehicle: Vehicle index in the recording
+            marker_interval: Rows between direction markers
+
+        Returns:
+            Tuple of (trajectory figure, telemetry figure)
+        """
+        _check_matplotlib()
+
+        positions = np.column_stack((recording["x"][:, vehicle], recording["y"][:, vehicle]))
+        headings = recording["orientation"][:, vehicle] if "orientation" in recording else None
+        trajectory = TrajectoryPlotter.plot_trajectory(
+            positions, headings, marker_interval=marker_interval
+        )
+        telemetry = TrajectoryPlotter.plot_telemetry(
+            recording.time,
+            recording["speed"][:, vehicle],
+            recording["drift_angle"][:, vehicle],
+            recording["throttle"][:, vehicle],
+            recording["steer"][:, vehicle],
+        )
+        return trajectory, telemetry
+
     @staticmethod
     def plot_drift_metrics(
         time: List[float],
@@ -6,12 +6,13 @@ Provides a top-down view of the vehicle with:
 - Trajectory trail
 - Telemetry overlay
 - Keyboard input handling
+- Replay of recorded telemetry (TelemetryReader)
 """
 
 from __future__ import annotations
 import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Dict, Tuple, Optional
+from typing import TYPE_CHECKING, Any, List, Dict, Sequence, Tuple, Optional
 
 try:
     import pygame
@@ -19,10 +20,14 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
-from physicskit.core.vector import Vector3
+from physicskit.vehicle.geometry import WheelGeometry, build_wheel_geometry
+from physicskit.vehicle.steering import Steering, SteeringConfig
 
 if TYPE_CHECKING:
-    from physicskit.vehicle.car import Car, CarState
+    import numpy as np
+
+    from physicskit.core.recorder import TelemetryReader
+    from physicskit.vehicle.car import Car, CarConfig, CarState
     from physicskit.drift.metrics import DriftMetrics
 
 
@@ -71,11 +76,11 @@ class PygameRenderer:
         self.config = config or RenderConfig()
         self._initialized = False
 
-        # Pygame surfaces
-        self._screen = None
-        self._clock = None
-        self._font = None
-        self._small_font = None
+        # Pygame surfaces, created by init()
+        self._screen: Any = None
+        self._clock: Any = None
+        self._font: Any = None
+        self._small_font: Any = None
 
         # Camera state
         self._camera_x: float = 0.0
@@ -172,29 +177,38 @@ class PygameRenderer:
 
     def _draw_car(self, car: Car) -> None:
         """Draw the vehicle body and wheels."""
-        state = car.get_state()
-        cfg = car.config
+        pos = car.body.position
+        self._draw_vehicle(
+            car.config, car.wheel_geometry, pos.x, pos.y, car.body.orientation,
+            car.steering.get_wheel_angles()
+        )
+
+    def _draw_vehicle(
+        self,
+        cfg: CarConfig,
+        geometry: Sequence[WheelGeometry],
+        x: float,
+        y: float,
+        orientation: float,
+        steer_angles: Tuple[float, float]
+    ) -> None:
+        """Draw a vehicle body and wheels at a pose."""
+        cos_o = math.cos(orientation)
+        sin_o = math.sin(orientation)
 
         # Car body dimensions (approximate)
         length = cfg.wheelbase * 1.2
         width = cfg.track_front * 0.8
 
-        # Get corners in local space
+        # Corners in local space, transformed to world and then screen
         half_l = length / 2
         half_w = width / 2
-        corners_local = [
-            Vector3(half_l, half_w, 0),
-            Vector3(half_l, -half_w, 0),
-            Vector3(-half_l, -half_w, 0),
-            Vector3(-half_l, half_w, 0),
+        corners_screen = [
+            self._world_to_screen(x + lx * cos_o - ly * sin_o, y + lx * sin_o + ly * cos_o)
+            for lx, ly in ((half_l, half_w), (half_l, -half_w),
+                           (-half_l, -half_w), (-half_l, half_w))
         ]
 
-        # Transform to world and then screen
-        corners_screen = []
-        for corner in corners_local:
-            world = car.body.local_to_world(corner)
-            corners_screen.append(self._world_to_screen(world.x, world.y))
-
         # Draw body
         pygame.draw.polygon(self._screen, self.config.car_color, corners_screen)
         pygame.draw.polygon(self._screen, (100, 100, 110), corners_screen, 2)
@@ -202,19 +216,13 @@ class PygameRenderer:
         # Draw wheels
         wheel_length = 0.6
         wheel_width = 0.25
-        steer_L, steer_R = car.steering.get_wheel_angles()
-
-        from physicskit.vehicle.suspension import WheelPosition
-        wheel_steers = {
-            WheelPosition.FRONT_LEFT: steer_L,
-            WheelPosition.FRONT_RIGHT: steer_R,
-            WheelPosition.REAR_LEFT: 0,
-            WheelPosition.REAR_RIGHT: 0,
-        }
 
-        for wheel_pos in WheelPosition:
-            wheel_center_world = car.get_wheel_position_world(wheel_pos)
-            wheel_heading = state.orientation + wheel_steers[wheel_pos]
+        for geom in geometry:
+            wheel_x = x + geom.x * cos_o - geom.y * sin_o
+            wheel_y = y + geom.x * sin_o + geom.y * cos_o
+            wheel_heading = orientation
+            if geom.steered:
+                wheel_heading += steer_angles[geom.side]
 
             # Wheel corners
             cos_h = math.cos(wheel_heading)
@@ -225,8 +233,8 @@ class PygameRenderer:
                           (wheel_length/2, wheel_width/2),
                           (wheel_length/2, -wheel_width/2),
                           (-wheel_length/2, -wheel_width/2)]:
-                wx = wheel_center_world.x + dx * cos_h - dy * sin_h
-                wy = wheel_center_world.y + dx * sin_h + dy * cos_h
+                wx = wheel_x + dx * cos_h - dy * sin_h
+                wy = wheel_y + dx * sin_h + dy * cos_h
                 wheel_corners.append(self._world_to_screen(wx, wy))
 
             pygame.draw.polygon(self._screen, self.config.wheel_color, wheel_corners)
@@ -236,46 +244,54 @@ class PygameRenderer:
         if not self.config.show_forces:
             return
 
-        from physicskit.vehicle.suspension import WheelPosition
-        state = car.get_state()
-        steer_L, steer_R = car.steering.get_wheel_angles()
-
-        tire_states = {
-            WheelPosition.FRONT_LEFT: (state.tire_FL, steer_L),
-            WheelPosition.FRONT_RIGHT: (state.tire_FR, steer_R),
-            WheelPosition.REAR_LEFT: (state.tire_RL, 0),
-            WheelPosition.REAR_RIGHT: (state.tire_RR, 0),
-        }
+        tires = [tire.state_view for tire in car.wheels]
+        pos = car.body.position
+        self._draw_tire_forces(
+            car.wheel_geometry, pos.x, pos.y, car.body.orientation,
+            car.steering.get_wheel_angles(),
+            [t.Fx for t in tires], [t.Fy for t in tires]
+        )
 
-        for wheel_pos in WheelPosition:
-            tire_state, steer_angle = tire_states[wheel_pos]
-            wheel_center_world = car.get_wheel_position_world(wheel_pos)
-            wheel_heading = state.orientation + steer_angle
+    def _draw_tire_forces(
+        self,
+        geometry: Sequence[WheelGeometry],
+        x: float,
+        y: float,
+        orientation: float,
+        steer_angles: Tuple[float, float],
+        Fx: Sequence[float],
+        Fy: Sequence[float]
+    ) -> None:
+        """Draw tire force vectors of a vehicle at a pose (forces in wheel order)."""
+        cos_o = math.cos(orientation)
+        sin_o = math.sin(orientation)
+        scale = self.config.force_scale
+
+        for geom in geometry:
+            wheel_x = x + geom.x * cos_o - geom.y * sin_o
+            wheel_y = y + geom.x * sin_o + geom.y * cos_o
+            fx = Fx[geom.index]
+            fy = Fy[geom.index]
+            wheel_heading = orientation
+            if geom.steered:
+                wheel_heading += steer_angles[geom.side]
+            cos_h = math.cos(wheel_heading)
+            sin_h = math.sin(wheel_heading)
 
-            # Scale forces for display
-            scale = self.config.force_scale
+            start = self._world_to_screen(wheel_x, wheel_y)
 
             # Longitudinal force (green)
-            fx_world = tire_state.Fx * math.cos(wheel_heading)
-            fy_world = tire_state.Fx * math.sin(wheel_heading)
-
-            start = self._world_to_screen(wheel_center_world.x, wheel_center_world.y)
-            end = self._world_to_screen(
-                wheel_center_world.x + fx_world * scale,
-                wheel_center_world.y + fy_world * scale
-            )
-            if abs(tire_state.Fx) > 10:
+            if abs(fx) > 10:
+                end = self._world_to_screen(
+                    wheel_x + fx * cos_h * scale, wheel_y + fx * sin_h * scale
+                )
                 pygame.draw.line(self._screen, self.config.force_color_fx, start, end, 2)
 
             # Lateral force (red)
-            fx_world = -tire_state.Fy * math.sin(wheel_heading)
-            fy_world = tire_state.Fy * math.cos(wheel_heading)
-
-            end = self._world_to_screen(
-                wheel_center_world.x + fx_world * scale,
-                wheel_center_world.y + fy_world * scale
-            )
-            if abs(tire_state.Fy) > 10:
+            if abs(fy) > 10:
+                end = self._world_to_screen(
+                    wheel_x - fy * sin_h * scale, wheel_y + fy * cos_h * scale
+                )
                 pygame.draw.line(self._screen, self.config.force_color_fy, start, end, 2)
 
     def _draw_trail(self, car: Car) -> None:
@@ -301,7 +317,7 @@ class PygameRenderer:
         if not self.config.show_telemetry:
             return
 
-        state = car.get_state()
+        state = car.get_state_view()
 
         lines = [
             f"Speed: {state.speed * 3.6:.1f} km/h",
@@ -323,13 +339,6 @@ class PygameRenderer:
                 f"Duration: {drift_metrics.drift_duration:.1f}s",
             ])
 
-        y = 10
-        for line in lines:
-            if line:
-                text = self._font.render(line, True, self.config.text_color)
-                self._screen.blit(text, (10, y))
-            y += 22
-
         # Controls help
         help_lines = [
             "Controls:",
@@ -344,6 +353,17 @@ class PygameRenderer:
             "Esc - Quit"
         ]
 
+        self._draw_text(lines, help_lines)
+
+    def _draw_text(self, lines: List[str], help_lines: List[str]) -> None:
+        """Draw overlay lines on the left and controls help on the right."""
+        y = 10
+        for line in lines:
+            if line:
+                text = self._font.render(line, True, self.config.text_color)
+                self._screen.blit(text, (10, y))
+            y += 22
+
         y = 10
         for line in help_lines:
             text = self._small_font.render(line, True, (150, 150, 160))
@@ -395,6 +415,141 @@ class PygameRenderer:
         # Limit frame rate
         self._clock.tick(fps)
 
+    def replay(
+        self,
+        reader: TelemetryReader,
+        car_config: CarConfig,
+        vehicle: int = 0,
+        speed: float = 1.0,
+        fps: int = 60
+    ) -> None:
+        """Play back a recording until the window is closed.
+
+        Each frame looks up the row for the playback time by binary search
+        and reads it (and the trail window) as views of the mapped files.
+        The recording needs x, y and orientation; steer, Fx, Fy and the
+        overlay channels are drawn when present.
+
+        Controls: Space pauses, ←/→ seek 1 s (5 s with Shift), F/T/C toggle
+        forces, overlay and camera, Esc quits.
+
+        Args:
+            reader: Recording to play
+            car_config: Configuration of the recorded vehicle (for its geometry)
+            vehicle: Vehicle index in the recording
+            speed: Playback speed (1.0 = real time)
+            fps: Target frame rate
+        """
+        for name in ("x", "y", "orientation"):
+            if name not in reader:
+                raise ValueError(f"Recording has no '{name}' channel; cannot replay")
+        if len(reader) == 0:
+            return
+        if not self._initialized:
+            self.init()
+
+        geometry = build_wheel_geometry(car_config)
+        steering = Steering(SteeringConfig(
+            max_steer_angle=car_config.max_steer_angle,
+            ackermann_factor=car_config.ackermann_factor,
+            wheelbase=car_config.wheelbase,
+            track_width=car_config.track_front
+        ))
+        last = len(reader) - 1
+        t_start = float(reader.frame(0)["time"])
+        t_end = float(reader.frame(last)["time"])
+        t = t_start
+        paused = False
+
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type != pygame.KEYDOWN:
+                    continue
+                if event.key == pygame.K_ESCAPE:
+                    return
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    step = 5.0 if event.mod & pygame.KMOD_SHIFT else 1.0
+                    t += step if event.key == pygame.K_RIGHT else -step
+                elif event.key == pygame.K_f:
+                    self.config.show_forces = not self.config.show_forces
+                elif event.key == pygame.K_t:
+                    self.config.show_telemetry = not self.config.show_telemetry
+                elif event.key == pygame.K_c:
+                    self.config.camera_follow = not self.config.camera_follow
+            t = min(max(t, t_start), t_end)
+
+            index = min(reader.index_at(t), last)
+            frame = reader.frame(index)
+            x = float(frame["x"][vehicle])
+            y = float(frame["y"][vehicle])
+            orientation = float(frame["orientation"][vehicle])
+            steer_angles = (
+                steering.get_wheel_angles(float(frame["steer"][vehicle]))
+                if "steer" in frame else (0.0, 0.0)
+            )
+
+            if self.config.camera_follow:
+                self._camera_x = x
+                self._camera_y = y
+            self._screen.fill(self.config.background_color)
+            self._draw_grid()
+
+            if self.config.show_trail and index > 0:
+                lo = max(0, index - self.config.trail_length)
+                xs = reader.channel("x", lo, index + 1)[:, vehicle]
+                ys = reader.channel("y", lo, index + 1)[:, vehicle]
+                points = [self._world_to_screen(px, py) for px, py in zip(xs, ys)]
+                pygame.draw.lines(self._screen, self.config.trail_color, False, points, 1)
+
+            self._draw_vehicle(car_config, geometry, x, y, orientation, steer_angles)
+
+            if self.config.show_forces and "Fx" in frame and "Fy" in frame:
+                self._draw_tire_forces(
+                    geometry, x, y, orientation, steer_angles,
+                    frame["Fx"][vehicle], frame["Fy"][vehicle]
+                )
+
+            if self.config.show_telemetry:
+                self._draw_text(
+                    self._replay_lines(frame, vehicle, paused, speed),
+                    ["Replay:", "Space - Pause", "←/→ - Seek 1s", "Shift - Seek 5s",
+                     "F - Toggle forces", "T - Toggle telemetry", "C - Toggle camera",
+                     "Esc - Quit"]
+                )
+
+            pygame.display.flip()
+            elapsed = self._clock.tick(fps) / 1000.0
+            if not paused:
+                t += elapsed * speed
+
+    @staticmethod
+    def _replay_lines(
+        frame: Dict[str, np.ndarray], vehicle: int, paused: bool, speed: float
+    ) -> List[str]:
+        """Overlay lines for one recorded row."""
+        lines = [f"Time: {float(frame['time']):.2f} s  ({'paused' if paused else f'{speed:g}x'})", ""]
+        rows = (
+            ("speed", "Speed: {:.1f} km/h", 3.6),
+            ("drift_angle", "Drift Angle: {:.1f}°", 1.0),
+            ("throttle", "Throttle: {:.0f}%", 100.0),
+            ("brake", "Brake: {:.0f}%", 100.0),
+            ("steer", "Steer: {:.0f}%", 100.0),
+            ("handbrake", "Handbrake: {:.0f}%", 100.0),
+            ("longitudinal_accel", "Long Accel: {:.1f} m/s²", 1.0),
+            ("lateral_accel", "Lat Accel: {:.1f} m/s²", 1.0),
+            ("yaw_rate", "Yaw Rate: {:.1f}°/s", math.degrees(1.0)),
+        )
+        for name, fmt, scale in rows:
+            if name in frame:
+                lines.append(fmt.format(float(frame[name][vehicle]) * scale))
+        if "drifting" in frame and frame["drifting"][vehicle]:
+            lines.extend(["", "DRIFTING"])
+        return lines
+
     def _draw_grid(self) -> None:
         """Draw reference grid."""
         grid_spacing = 10.0  # meters
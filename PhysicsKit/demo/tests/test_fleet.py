@@ -0,0 +1,93 @@
+"""FleetWorld follows the same trajectories as individually stepped Cars."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from physicskit.config.vehicle_presets import VEHICLE_PRESETS, get_vehicle_config
+from physicskit.vehicle.car import Car, CarConfig
+from physicskit.vehicle.fleet import FleetWorld
+
+
+def _inputs(t):
+    return dict(
+        throttle=0.8,
+        steer=0.6 if t < 1.0 else -0.4,
+        handbrake=1.0 if 0.8 < t < 1.1 else 0.0,
+        brake=0.3 if 1.5 < t < 1.6 else 0.0,
+    )
+
+
+def _implicit_wheels(config):
+    return replace(config, tire_config=replace(config.tire_config, wheel_integrator="implicit"))
+
+
+def test_fleet_matches_cars():
+    _assert_fleet_matches_cars([get_vehicle_config(name) for name in sorted(VEHICLE_PRESETS)])
+
+
+def test_fleet_matches_cars_with_implicit_wheels():
+    # Mixed explicit and implicit cars, at a step where explicit wheels chatter
+    configs = [get_vehicle_config(name) for name in sorted(VEHICLE_PRESETS)]
+    configs += [_implicit_wheels(config) for config in configs]
+    _assert_fleet_matches_cars(configs, dt=0.005, n_steps=300)
+
+
+def test_fleet_rejects_unknown_wheel_integrator():
+    config = CarConfig.sport()
+    config = replace(config, tire_config=replace(config.tire_config, wheel_integrator="rk"))
+    with pytest.raises(ValueError, match="Unknown wheel integrator 'rk'"):
+        FleetWorld([config])
+
+
+def _assert_fleet_matches_cars(configs, dt=0.001, n_steps=1500):
+    cars = [Car(config) for config in configs]
+    for car in cars:
+        car.set_velocity(20.0)
+    fleet = FleetWorld.from_cars(cars, dt=dt)
+
+    for i in range(n_steps):
+        inputs = _inputs(i * dt)
+        for car in cars:
+            car.set_inputs(**inputs)
+            car.physics_step(dt)
+        fleet.set_inputs(**inputs)
+        fleet.step()
+
+    for k, car in enumerate(cars):
+        body = car.body
+        np.testing.assert_allclose(
+            fleet.position[k], (body.position.x, body.position.y), rtol=0, atol=1e-9
+        )
+        np.testing.assert_allclose(
+            fleet.velocity[k], (body.velocity.x, body.velocity.y), rtol=0, atol=1e-9
+        )
+        assert abs(fleet.orientation[k] - body.orientation) < 1e-9
+        np.testing.assert_allclose(
+            fleet.wheel_speed[k], [tire.angular_velocity for tire in car.wheels],
+            rtol=0, atol=1e-7
+        )
+
+
+def test_brake_bias_changes_apply_at_runtime():
+    configured = Car(replace(CarConfig.sport(), brake_bias=0.9))
+    changed = Car(CarConfig.sport())
+    changed.drivetrain.config.brake_bias = 0.9
+    default = Car(CarConfig.sport())
+    cars = (configured, changed, default)
+    for car in cars:
+        car.set_velocity(20.0)
+        car.set_inputs(brake=0.8, steer=0.3)
+    fleet = FleetWorld.from_cars([changed])
+    fleet.set_inputs(brake=0.8, steer=0.3)
+
+    for _ in range(300):
+        for car in cars:
+            car.physics_step(fleet.dt)
+        fleet.step()
+
+    speeds = [[tire.angular_velocity for tire in car.wheels] for car in cars]
+    assert speeds[1] == speeds[0]
+    assert speeds[2] != speeds[0]
+    np.testing.assert_allclose(fleet.wheel_speed[0], speeds[1], rtol=0, atol=1e-7)
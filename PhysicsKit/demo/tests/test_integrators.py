@@ -0,0 +1,78 @@
+"""DormandPrince step-size control."""
+
+import math
+
+import numpy as np
+
+from physicskit.core.integrators import DormandPrince, IntegratorType
+from physicskit.vehicle import Car, CarConfig
+
+
+def _decay(rate):
+    return lambda y: -rate * y
+
+
+def test_error_follows_tolerance():
+    errors = []
+    for rtol in (1e-4, 1e-7, 1e-10):
+        dp = DormandPrince(rtol=rtol, atol=rtol)
+        y = dp.integrate(_decay(3.0), np.array([1.0]), 2.0)
+        errors.append(abs(y[0] - math.exp(-6.0)))
+        assert errors[-1] < 10 * rtol
+    assert errors[0] > errors[1] > errors[2]
+
+
+def test_rejects_steps_and_carries_step_size_over():
+    dp = DormandPrince(rtol=1e-6, atol=1e-9)
+    f = _decay(50.0)
+    y = dp.integrate(f, np.array([1.0]), 0.5)
+    stats = dp.stats
+
+    # The first step spans the whole interval and must be cut down
+    assert stats.rejected > 0
+    assert stats.evaluations == 1 + 6 * (stats.steps + stats.rejected)
+    assert stats.min_dt < stats.max_dt < 0.5
+    assert abs(y[0] - math.exp(-25.0)) < 1e-8
+
+    # The next interval starts from the adapted step size
+    rejected = stats.rejected
+    dp.integrate(f, y, 0.5)
+    assert stats.rejected - rejected < rejected
+
+
+def test_step_limits():
+    dp = DormandPrince(rtol=1e-6, max_dt=0.01)
+    dp.integrate(_decay(1.0), np.array([1.0]), 1.0)
+    assert dp.stats.max_dt <= 0.01 * 1.01
+    assert dp.stats.steps >= 99
+
+    # Steps at min_dt are accepted even when the error is too large, and
+    # the step never shrinks below it afterwards
+    dp = DormandPrince(rtol=1e-12, atol=1e-12, min_dt=0.1)
+    dp.integrate(_decay(30.0), np.array([1.0]), 1.0)
+    assert dp.stats.min_dt >= 0.1 * 0.99
+    assert dp.stats.steps <= 11
+
+
+def test_car_matches_rk4():
+    dt = 0.005
+
+    def run(integrator, **options):
+        car = Car(CarConfig.drift())
+        car.set_integrator(integrator, **options)
+        car.set_velocity(20.0)
+        car.set_inputs(throttle=0.8, steer=0.5)
+        for _ in range(100):
+            car.physics_step(dt)
+        return car
+
+    # Inputs are held over each physics step, so both solve the same ODE
+    reference = run(IntegratorType.RK4)
+    adaptive = run(IntegratorType.DORMAND_PRINCE, rtol=1e-9, atol=1e-9)
+    for a, b in ((adaptive.body.position, reference.body.position),
+                 (adaptive.body.velocity, reference.body.velocity)):
+        assert abs(a.x - b.x) < 1e-4 and abs(a.y - b.y) < 1e-4
+
+    stats = adaptive.integrator_stats
+    assert stats.steps > 100 and stats.rejected > 0
+    assert stats.max_dt <= dt
@@ -0,0 +1,75 @@
+"""PacejkaFormula fast paths against their scalar and sampled references."""
+
+import numpy as np
+import pytest
+
+from physicskit.config.tire_presets import TIRE_PRESETS
+from physicskit.tire.pacejka import PacejkaFormula, PacejkaParams
+from physicskit.tire.tabulated import TabulatedPacejka
+
+
+@pytest.fixture(params=sorted(TIRE_PRESETS))
+def pacejka(request):
+    return PacejkaFormula(TIRE_PRESETS[request.param]["config"]().pacejka_params)
+
+
+def test_batch_forces_match_scalar(pacejka):
+    rng = np.random.default_rng(0)
+    slip_ratio = rng.uniform(-1.0, 1.0, 200)
+    slip_angle = rng.uniform(-25.0, 25.0, 200)
+    Fz = rng.uniform(-500.0, 9000.0, 200)
+
+    Fx = pacejka.longitudinal_force_batch(slip_ratio, Fz)
+    Fy = pacejka.lateral_force_batch(slip_angle, Fz)
+    for i in range(len(Fz)):
+        assert Fx[i] == pytest.approx(pacejka.longitudinal_force(slip_ratio[i], Fz[i]), abs=1e-9)
+        assert Fy[i] == pytest.approx(pacejka.lateral_force(slip_angle[i], Fz[i]), abs=1e-9)
+
+
+def test_batch_peaks_match_scalar(pacejka):
+    Fz = np.array([-100.0, 0.0, 1234.0, 4000.0, 7777.0, 1e7])
+    peak_x, slip_x = pacejka.get_peak_longitudinal_force_batch(Fz)
+    peak_y, slip_y = pacejka.get_peak_lateral_force_batch(Fz)
+    for i, load in enumerate(Fz):
+        assert (peak_x[i], slip_x[i]) == pacejka.get_peak_longitudinal_force(load)
+        assert (peak_y[i], slip_y[i]) == pacejka.get_peak_lateral_force(load)
+
+
+@pytest.mark.parametrize("Fz", [800.0, 2500.0, 4000.0, 6500.0, 9000.0])
+def test_analytic_peaks_match_dense_scan(pacejka, Fz):
+    lo, hi = PacejkaFormula.LATERAL_PEAK_RANGE
+    slip = np.linspace(lo, hi, 200001)
+    forces = pacejka.lateral_force_batch(slip, Fz)
+    peak, peak_slip = pacejka.find_peak_lateral(Fz)
+    assert peak >= forces.max() - 1e-6
+    assert peak == pytest.approx(pacejka.lateral_force(peak_slip, Fz), abs=1e-9)
+    assert peak_slip == pytest.approx(slip[forces.argmax()], abs=2 * (hi - lo) / len(slip))
+
+    lo, hi = PacejkaFormula.LONGITUDINAL_PEAK_RANGE
+    slip = np.linspace(lo, hi, 200001)
+    forces = pacejka.longitudinal_force_batch(slip, Fz)
+    peak, peak_slip = pacejka.find_peak_longitudinal(Fz)
+    assert peak >= forces.max() - 1e-6
+    assert peak == pytest.approx(pacejka.longitudinal_force(peak_slip, Fz), abs=1e-9)
+    assert peak_slip == pytest.approx(slip[forces.argmax()], abs=2 * (hi - lo) / len(slip))
+
+
+@pytest.mark.parametrize("cls", [PacejkaFormula, TabulatedPacejka])
+def test_in_place_param_edits_invalidate_caches(cls):
+    edited = cls(PacejkaParams())
+    edited.lateral_force(5.0, 4000.0)
+    edited.longitudinal_force(0.1, 4000.0)
+    edited.get_peak_lateral_force(4000.0)
+    edited.get_peak_longitudinal_force_batch(np.array([4000.0]))
+
+    edited.params.a2 *= 1.5
+    edited.params.b2 *= 1.5
+    fresh = cls(PacejkaParams())
+    fresh.params.a2 *= 1.5
+    fresh.params.b2 *= 1.5
+
+    assert edited.lateral_force(5.0, 4000.0) == fresh.lateral_force(5.0, 4000.0)
+    assert edited.longitudinal_force(0.1, 4000.0) == fresh.longitudinal_force(0.1, 4000.0)
+    assert edited.get_peak_lateral_force(4000.0) == fresh.get_peak_lateral_force(4000.0)
+    peak, _ = edited.get_peak_longitudinal_force_batch(np.array([4000.0]))
+    assert peak[0] == fresh.get_peak_longitudinal_force(4000.0)[0]
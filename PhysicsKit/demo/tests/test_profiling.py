@@ -0,0 +1,67 @@
+"""StageProfiler timings and Chrome trace export."""
+
+import json
+
+import pytest
+
+from physicskit import World
+from physicskit.core import Vector3
+from physicskit.core.profiling import StageProfiler
+from physicskit.tire.tire import Tire, TireConfig
+from physicskit.vehicle import Car, CarConfig
+
+STEPS = 200
+
+
+def test_world_profiling_records_every_stage(tmp_path):
+    world = World()
+    for _ in range(2):
+        car = Car(CarConfig.drift())
+        car.set_velocity(15.0)
+        car.set_inputs(0.6, 0.0, 0.3, 0.0)
+        world.add_vehicle(car)
+    profiler = world.enable_profiling(trace=True)
+    for _ in range(STEPS):
+        world.step()
+
+    stats = profiler.stats
+    assert stats["physics_step"].count == 2 * STEPS
+    for stage in ("steering", "load_transfer", "drivetrain", "body_integration", "engine"):
+        assert stats[stage].count == 2 * STEPS, stage
+    # Every tire step either runs the force stages or records one idle lap
+    idle = stats["tire_idle"].count if "tire_idle" in stats else 0
+    for stage in ("slip", "combined_slip", "relaxation", "wheel_spin"):
+        assert stats[stage].count + idle == 8 * STEPS, stage
+
+    step = stats["physics_step"]
+    laps = sum(s.total_ns for name, s in stats.items() if name != "physics_step")
+    assert laps <= step.total_ns
+    assert step.min_ns <= step.percentile(50) * 1000.0 <= step.max_ns
+
+    path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(str(path))
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    assert len(events) == sum(s.count for s in stats.values())
+    assert {e["tid"] for e in events} == {0, 1}
+    assert all(e["ph"] == "X" and e["ts"] >= 0.0 and e["dur"] >= 0.0 for e in events)
+
+    world.disable_profiling()
+    world.step()
+    assert profiler.stats["physics_step"].count == 2 * STEPS
+
+
+def test_unloaded_tire_records_idle_lap():
+    profiler = StageProfiler()
+    tire = Tire(TireConfig())
+    tire.profiler = profiler
+    profiler.start()
+    tire.step(Vector3(10.0, 0.0, 0.0), 0.0, 0.0, 100.0, 0.0, 0.001)
+
+    assert profiler.stats["tire_idle"].count == 1
+    assert "slip" not in profiler.stats
+
+
+def test_trace_export_requires_trace(tmp_path):
+    with pytest.raises(ValueError):
+        StageProfiler().write_chrome_trace(str(tmp_path / "trace.json"))
@@ -0,0 +1,66 @@
+"""TelemetryRecorder/TelemetryReader round trip against World.run."""
+
+import numpy as np
+import pytest
+
+from physicskit import World
+from physicskit.core import TelemetryRecorder, TelemetryReader
+from physicskit.vehicle import Car, CarConfig
+
+CHANNELS = ["x", "slip_angle", "Fy", "drifting"]
+
+
+def _world():
+    world = World()
+    for _ in range(2):
+        car = Car(CarConfig.drift())
+        car.set_velocity(20.0)
+        car.set_inputs(0.8, 0.0, 0.5, 0.0)
+        world.add_vehicle(car)
+    return world
+
+
+def test_round_trip_matches_run(tmp_path):
+    reference = _world().run(1000, channels=CHANNELS, decimation=7)
+
+    world = _world()
+    with world.attach_recorder(
+        TelemetryRecorder(str(tmp_path / "run"), CHANNELS, decimation=7, chunk_rows=50)
+    ):
+        for _ in range(1000):
+            world.step()
+    world.detach_recorder()
+
+    with TelemetryReader(str(tmp_path / "run")) as reader:
+        assert len(reader) == len(reference.time)
+        assert np.array_equal(reader.time, reference.time)
+        for name in CHANNELS:
+            assert np.array_equal(reader[name], reference[name]), name
+
+        frame = reader.frame(-1)
+        assert np.array_equal(frame["Fy"], reference["Fy"][-1])
+        assert np.array_equal(reader.channel("slip_angle", 40, 60), reference["slip_angle"][40:60])
+
+        for t in (0.0, 0.007, 0.0071, 0.5, 0.9):
+            assert reader.index_at(t) == np.searchsorted(reference.time, t)
+
+        window = reader.time_range(0.2, 0.6)
+        assert window.time[0] >= 0.2 and window.time[-1] <= 0.6
+        start = reader.index_at(0.2)
+        assert np.array_equal(window["x"], reference["x"][start:start + len(window.time)])
+
+
+def test_closed_recorder_is_detached(tmp_path):
+    world = _world()
+    with TelemetryRecorder(str(tmp_path / "run"), CHANNELS, decimation=10) as recorder:
+        world.attach_recorder(recorder)
+        for _ in range(25):
+            world.step()
+
+    for _ in range(25):
+        world.step()
+    assert world.recorder is None
+    world.add_vehicle(Car(CarConfig.drift()))
+
+    with TelemetryReader(str(tmp_path / "run")) as reader:
+        assert len(reader) == 2
@@ -0,0 +1,53 @@
+"""Sharing and freezing of tire force models."""
+
+import gc
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from physicskit.tire.registry import TireModelRegistry
+from physicskit.tire.tire import Tire, TireConfig
+
+
+def test_equal_configs_share_one_model():
+    registry = TireModelRegistry()
+    a = Tire(TireConfig.sport(), registry=registry)
+    b = Tire(TireConfig.sport(), registry=registry)
+    c = Tire(TireConfig(friction_mu=0.8), registry=registry)
+
+    assert a.model is b.model
+    assert a.model is not c.model
+    assert (registry.hits, registry.misses) == (1, 2)
+
+    del a, b, c
+    gc.collect()
+    assert len(registry) == 0
+
+
+def test_shared_models_are_frozen():
+    config = TireConfig.sport()
+    tire = Tire(config, registry=TireModelRegistry())
+
+    with pytest.raises(FrozenInstanceError):
+        tire.pacejka.params.a2 = 1.0
+    with pytest.raises(AttributeError):
+        tire.pacejka.params = config.pacejka_params
+    with pytest.raises(AttributeError):
+        tire.combined_slip.friction_mu = 0.5
+
+    # The caller's config is copied, not frozen
+    config.pacejka_params.a2 = 1.0
+    assert tire.pacejka.params.a2 != 1.0
+
+
+def test_private_model_is_editable():
+    shared = Tire(TireConfig.sport())
+    private = Tire(TireConfig.sport(), shared=False)
+    assert private.model is not shared.model
+
+    Fy = shared.pacejka.lateral_force(5.0, 4000.0)
+    private.combined_slip.friction_mu = 0.5
+    private.pacejka.params.a2 *= 0.5
+    assert private.pacejka.lateral_force(5.0, 4000.0) < Fy
+    assert shared.pacejka.lateral_force(5.0, 4000.0) == Fy
+    assert shared.combined_slip.friction_mu == TireConfig.sport().friction_mu
@@ -0,0 +1,37 @@
+"""Tabulated relaxation gains against the exact filter."""
+
+import math
+
+import numpy as np
+import pytest
+
+from physicskit.tire.relaxation import AdaptiveRelaxation, RelaxationDecay, TireRelaxation
+
+
+@pytest.mark.parametrize("dt", [0.0005, 0.001, 0.005])
+def test_gains_match_exact(dt):
+    decay = RelaxationDecay(dt, 0.3, 0.4)
+    speed = np.concatenate((
+        np.random.default_rng(2).uniform(0.0, 200.0, 2000), [0.0, 0.5, 150.0, 1e6, math.inf]
+    ))
+    batch_x, batch_y = decay.gains_batch(speed)
+    for i, v in enumerate(speed.tolist()):
+        alpha_x, alpha_y = decay.gains(v)
+        assert alpha_x == pytest.approx(decay.exact(0.3, v), abs=decay.max_error + 1e-15)
+        assert alpha_y == pytest.approx(decay.exact(0.4, v), abs=decay.max_error + 1e-15)
+        assert alpha_x == pytest.approx(batch_x[i], abs=1e-15)
+        assert alpha_y == pytest.approx(batch_y[i], abs=1e-15)
+    assert decay.gains(math.inf) == (1.0, 1.0)
+
+
+def test_zero_length_adaptive_relaxation_follows_target():
+    relaxation = AdaptiveRelaxation(high_slip_factor=0.0)
+    Fx, Fy = relaxation.update_adaptive(1000.0, 1000.0, 20.0, 1.0, 0.0, 0.001)
+    assert (Fx, Fy) == (1000.0, 1000.0)
+
+    # Low slip keeps the base relaxation
+    relaxation = AdaptiveRelaxation(high_slip_factor=0.0)
+    base = TireRelaxation(relaxation.sigma_x, relaxation.sigma_y)
+    assert relaxation.update_adaptive(1000.0, 1000.0, 20.0, 0.0, 0.0, 0.001) == (
+        base.update(1000.0, 1000.0, 20.0, 0.001)
+    )
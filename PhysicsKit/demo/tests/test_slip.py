@@ -0,0 +1,40 @@
+"""SlipCalculator.calculate_slip_batch against the scalar calculate_slip."""
+
+import math
+
+import numpy as np
+import pytest
+
+from physicskit.core.vector import Vector3
+from physicskit.tire.slip import SlipCalculator
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(1)
+    n = 5000
+    vx = rng.normal(0.0, 10.0, n)
+    vy = rng.normal(0.0, 5.0, n)
+    # Contact speeds around MIN_VELOCITY and headings that need wrapping
+    vx[:500] *= 0.03
+    vy[:500] *= 0.03
+    heading = rng.uniform(-math.pi - 0.6, math.pi + 0.6, n)
+    omega = rng.normal(0.0, 40.0, n)
+    radius = 0.33
+
+    batch = SlipCalculator.calculate_slip_batch(vx, vy, heading, omega, radius)
+    for i in range(n):
+        slip = SlipCalculator.calculate_slip(Vector3(vx[i], vy[i]), heading[i], omega[i], radius)
+        assert batch.slip_ratio[i] == slip.slip_ratio
+        assert batch.forward_velocity[i] == slip.forward_velocity
+        assert batch.slip_angle[i] == pytest.approx(slip.slip_angle, abs=1e-12)
+        assert batch.slip_angle_deg[i] == pytest.approx(slip.slip_angle_deg, abs=1e-10)
+        assert batch.combined_slip[i] == pytest.approx(slip.combined_slip, rel=1e-9)
+
+
+def test_batch_broadcasts_wheel_radii():
+    omega = np.full((3, 4), 50.0)
+    radius = np.array([0.30, 0.31, 0.32, 0.33])
+    batch = SlipCalculator.calculate_slip_batch(np.full((3, 4), 10.0), 0.0, 0.0, omega, radius)
+    assert batch.slip_ratio.shape == (3, 4)
+    wheel_velocity = omega[0] * radius
+    assert np.array_equal(batch.slip_ratio[0], (wheel_velocity - 10.0) / wheel_velocity)
@@ -0,0 +1,51 @@
+"""Accuracy of wheel sub-stepping against single-rate runs."""
+
+import numpy as np
+import pytest
+
+from physicskit import World
+from physicskit.benchmark import scenario_inputs
+from physicskit.config.vehicle_presets import get_vehicle_config
+from physicskit.vehicle import Car
+
+DURATION = 2.0
+SAMPLE_DT = 0.02
+
+
+def _trajectory(dt, substeps):
+    car = Car(get_vehicle_config("drift_car"))
+    car.set_velocity(20.0)
+    world = World(dt=dt, wheel_substeps=substeps)
+    world.add_vehicle(car)
+    n_steps = round(DURATION / dt)
+    inputs = np.array([scenario_inputs(i * dt) for i in range(n_steps)])
+    telemetry = world.run(n_steps, inputs, channels=("x", "y"), decimation=round(SAMPLE_DT / dt))
+    return np.stack((telemetry["x"][:, 0], telemetry["y"][:, 0]), axis=1)
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return _trajectory(0.001, 1)
+
+
+def _error(trajectory, reference):
+    return float(np.max(np.linalg.norm(trajectory - reference, axis=1)))
+
+
+@pytest.mark.parametrize("substeps", [4, 5])
+def test_substeps_beat_single_rate(reference, substeps):
+    dt = 0.001 * substeps
+    single = _error(_trajectory(dt, 1), reference)
+    multi = _error(_trajectory(dt, substeps), reference)
+    assert multi < 0.8 * single
+    assert multi < 0.05
+
+
+def test_substep_error_shrinks_with_chassis_step(reference):
+    errors = [_error(_trajectory(0.001 * n, n), reference) for n in (2, 4)]
+    assert errors[0] < errors[1]
+
+
+def test_invalid_substeps():
+    with pytest.raises(ValueError):
+        Car().set_wheel_substeps(0)
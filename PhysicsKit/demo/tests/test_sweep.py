@@ -0,0 +1,46 @@
+"""run_sweep result caching."""
+
+import os
+
+from physicskit.sweep import SweepSpec, grid, run_sweep
+
+SPEC = SweepSpec(scenario="step_steer", duration=0.3)
+
+
+def test_sweep_reuses_cached_points(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    points = grid({"brake_bias": [0.55, 0.65]})
+
+    first = run_sweep(points, spec=SPEC, workers=1, cache_dir=cache_dir)
+    assert [r.cached for r in first] == [False, False]
+    assert len(os.listdir(cache_dir)) == 2
+
+    # A wider sweep only simulates the new point, in input order
+    seen = []
+    wider = run_sweep(
+        grid({"brake_bias": [0.55, 0.6, 0.65]}), spec=SPEC, workers=1,
+        cache_dir=cache_dir, progress=lambda r: seen.append(r.params["brake_bias"])
+    )
+    assert [r.cached for r in wider] == [True, False, True]
+    assert seen == [0.55, 0.65, 0.6]
+    assert wider[0].metrics == first[0].metrics
+    assert wider[2].metrics == first[1].metrics
+    assert wider[0].key == first[0].key
+
+    # Any change to the run spec misses the cache
+    longer = run_sweep(
+        points, spec=SweepSpec(scenario="step_steer", duration=0.4), workers=1,
+        cache_dir=cache_dir
+    )
+    assert not any(r.cached for r in longer)
+
+
+def test_sweep_ignores_unreadable_cache_entries(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    [result] = run_sweep([{"lsd_preload": 120.0}], spec=SPEC, workers=1, cache_dir=cache_dir)
+    with open(os.path.join(cache_dir, f"{result.key}.json"), "w") as f:
+        f.write("{")
+
+    [rerun] = run_sweep([{"lsd_preload": 120.0}], spec=SPEC, workers=1, cache_dir=cache_dir)
+    assert not rerun.cached
+    assert rerun.metrics == result.metrics
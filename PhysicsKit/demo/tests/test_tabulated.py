@@ -0,0 +1,39 @@
+"""TabulatedPacejka against the analytic formula it tabulates."""
+
+import numpy as np
+import pytest
+
+from physicskit.config.tire_presets import TIRE_PRESETS
+from physicskit.tire.pacejka import PacejkaFormula
+from physicskit.tire.tabulated import TabulatedPacejka
+
+
+@pytest.mark.parametrize("preset", sorted(TIRE_PRESETS))
+def test_error_within_reported_bound(preset):
+    params = TIRE_PRESETS[preset]["config"]().pacejka_params
+    table = TabulatedPacejka(params)
+    analytic = PacejkaFormula(params)
+
+    rng = np.random.default_rng(3)
+    slip_ratio = rng.uniform(-1.0, 1.0, 20000)
+    slip_angle = rng.uniform(-90.0, 90.0, 20000)
+    Fz = rng.uniform(0.0, table.max_load, 20000)
+
+    Fx = table.longitudinal_force_batch(slip_ratio, Fz)
+    Fy = table.lateral_force_batch(slip_angle, Fz)
+    error_x = np.abs(Fx - analytic.longitudinal_force_batch(slip_ratio, Fz))
+    error_y = np.abs(Fy - analytic.lateral_force_batch(slip_angle, Fz))
+    assert error_x.max() <= table.max_error_fx
+    assert error_y.max() <= table.max_error_fy
+
+    for i in range(0, 20000, 500):
+        assert table.longitudinal_force(slip_ratio[i], Fz[i]) == pytest.approx(Fx[i], abs=1e-9)
+        assert table.lateral_force(slip_angle[i], Fz[i]) == pytest.approx(Fy[i], abs=1e-9)
+
+
+def test_outside_grid_falls_back_to_analytic():
+    table = TabulatedPacejka()
+    analytic = PacejkaFormula()
+    assert table.lateral_force(5.0, 20000.0) == analytic.lateral_force(5.0, 20000.0)
+    assert table.lateral_force(5.0, 4000.0, camber=1.0) == analytic.lateral_force(5.0, 4000.0, 1.0)
+    assert table.longitudinal_force(1.5, 4000.0) == analytic.longitudinal_force(1.5, 4000.0)
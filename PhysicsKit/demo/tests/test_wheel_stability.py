@@ -0,0 +1,48 @@
+"""Wheel spin integrator stability at dt = 5 ms over every tire preset."""
+
+import math
+
+import pytest
+
+from physicskit.benchmark import MAX_CHATTER, STABILITY_SCENARIOS, wheel_stability_matrix
+from physicskit.config.tire_presets import TIRE_PRESETS
+
+DT = 0.005
+
+
+def _matrix(tire, scenario, inertia_scale=1.0):
+    results = wheel_stability_matrix(
+        tires=[tire],
+        dts=(0.001, DT),
+        inertia_scales=(inertia_scale,),
+        scenarios=[scenario],
+        reference_dt=0.001,
+    )
+    return {(r.integrator, r.dt): r for r in results}
+
+
+@pytest.mark.parametrize("scenario", sorted(STABILITY_SCENARIOS))
+@pytest.mark.parametrize("tire", sorted(TIRE_PRESETS))
+def test_implicit_stable_where_explicit_chatters(tire, scenario):
+    results = _matrix(tire, scenario)
+
+    implicit = results["implicit", DT]
+    assert implicit.stable, f"chatter {implicit.chatter:.1f}/s"
+    assert implicit.chatter <= MAX_CHATTER
+    # Bounded and still tracking an explicit run at 1 ms
+    assert math.isfinite(implicit.position_error)
+    assert implicit.position_error < 0.5
+
+    explicit = results["explicit", DT]
+    assert not explicit.stable
+    assert explicit.chatter > MAX_CHATTER
+    if scenario == "braking":
+        # Straight-line braking is clean explicitly at 1 ms; only the larger step chatters
+        assert results["explicit", 0.001].stable
+
+
+@pytest.mark.parametrize("tire", sorted(TIRE_PRESETS))
+def test_implicit_braking_stable_with_light_wheels(tire):
+    results = _matrix(tire, "braking", inertia_scale=0.25)
+    assert results["implicit", DT].stable
+    assert not results["explicit", DT].stable